@@ -1,3 +1,4 @@
+import os
 from logging.config import fileConfig
 
 from sqlalchemy import engine_from_config
@@ -5,15 +6,21 @@ from sqlalchemy import pool
 
 from alembic import context
 
+from app.config import settings
 from app.database import Base
 from app.models.user_model import Users
 from app.models.post_model import Post
 from app.models.comment_model import Comment  
+from app.models.post_like_model import PostLike
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
 config = context.config
 
+# DATABASE_URL 환경 변수가 지정되면 alembic.ini 대신 사용
+if "DATABASE_URL" in os.environ:
+    config.set_main_option("sqlalchemy.url", settings.database_url.replace("%", "%%"))
+
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
 if config.config_file_name is not None:
@@ -25,6 +32,16 @@ if config.config_file_name is not None:
 # target_metadata = mymodel.Base.metadata
 target_metadata = Base.metadata
 
+# 마이그레이션에서 직접 만든 FTS5 가상 테이블(및 섀도 테이블)은 모델에 없으므로
+# autogenerate가 삭제 대상으로 잡지 않도록 제외
+FTS_TABLE_PREFIXES = ("posts_fts", "comments_fts")
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    if type_ == "table" and reflected and compare_to is None and name.startswith(FTS_TABLE_PREFIXES):
+        return False
+    return True
+
 # other values from the config, defined by the needs of env.py,
 # can be acquired:
 # my_important_option = config.get_main_option("my_important_option")
@@ -47,6 +64,7 @@ def run_migrations_offline() -> None:
     context.configure(
         url=url,
         target_metadata=target_metadata,
+        include_object=include_object,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
     )
@@ -70,7 +88,9 @@ def run_migrations_online() -> None:
 
     with connectable.connect() as connection:
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            include_object=include_object
         )
 
         with context.begin_transaction():
@@ -0,0 +1,42 @@
+"""Add updated_at to posts, comments and users
+
+Revision ID: a4e7c9b21d58
+Revises: d9a2e6f04b13
+Create Date: 2025-12-09 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4e7c9b21d58'
+down_revision: Union[str, Sequence[str], None] = 'd9a2e6f04b13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add updated_at columns and backfill them."""
+    # SQLite는 ADD COLUMN에 CURRENT_TIMESTAMP 같은 비상수 기본값을 쓸 수 없으므로
+    # nullable로 추가 -> 값 채우기 -> NOT NULL로 변경 (batch: 테이블 재생성)
+    for table in ('posts', 'comments', 'users'):
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(), nullable=True))
+
+    op.execute("UPDATE posts SET updated_at = created_at")
+    op.execute("UPDATE comments SET updated_at = created_at")
+    # 앱은 naive 로컬 시각을 저장하므로 localtime 기준으로 채움
+    op.execute("UPDATE users SET updated_at = datetime('now', 'localtime')")
+
+    for table in ('posts', 'comments', 'users'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(), nullable=False)
+
+
+def downgrade() -> None:
+    """Drop updated_at columns."""
+    for table in ('users', 'comments', 'posts'):
+        with op.batch_alter_table(table) as batch_op:
+            batch_op.drop_column('updated_at')
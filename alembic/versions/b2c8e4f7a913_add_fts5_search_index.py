@@ -0,0 +1,97 @@
+"""Add FTS5 full-text search index for posts and comments
+
+Revision ID: b2c8e4f7a913
+Revises: a4e7c9b21d58
+Create Date: 2025-12-11 10:00:00.000000
+
+"""
+import re
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.config import settings
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2c8e4f7a913'
+down_revision: Union[str, Sequence[str], None] = 'a4e7c9b21d58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _tokenizer() -> str:
+    # tokenize 옵션은 SQL에 그대로 들어가므로 허용 문자만 통과
+    tokenizer = settings.search_tokenizer
+    if not re.fullmatch(r"[A-Za-z0-9_ ]+", tokenizer):
+        raise ValueError(f"지원하지 않는 SEARCH_TOKENIZER: {tokenizer}")
+    return tokenizer
+
+
+def upgrade() -> None:
+    """Create FTS5 tables, sync triggers and build the index."""
+    tokenizer = _tokenizer()
+
+    # 외부 콘텐츠 테이블: 본문은 posts/comments에만 저장하고 FTS에는 색인만 보관
+    op.execute(
+        "CREATE VIRTUAL TABLE posts_fts USING fts5("
+        "title, content, content='posts', content_rowid='id', "
+        f"tokenize='{tokenizer}')"
+    )
+    op.execute(
+        "CREATE VIRTUAL TABLE comments_fts USING fts5("
+        "content, content='comments', content_rowid='id', "
+        f"tokenize='{tokenizer}')"
+    )
+
+    # 게시글: 제목/내용이 바뀔 때만 재색인 (조회수, 댓글 수 갱신은 제외)
+    op.execute("""
+        CREATE TRIGGER posts_fts_ai AFTER INSERT ON posts BEGIN
+            INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER posts_fts_ad AFTER DELETE ON posts BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER posts_fts_au AFTER UPDATE OF title, content ON posts BEGIN
+            INSERT INTO posts_fts(posts_fts, rowid, title, content) VALUES ('delete', old.id, old.title, old.content);
+            INSERT INTO posts_fts(rowid, title, content) VALUES (new.id, new.title, new.content);
+        END
+    """)
+
+    # 댓글 (FK CASCADE 삭제도 DELETE 트리거를 실행함)
+    op.execute("""
+        CREATE TRIGGER comments_fts_ai AFTER INSERT ON comments BEGIN
+            INSERT INTO comments_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_fts_ad AFTER DELETE ON comments BEGIN
+            INSERT INTO comments_fts(comments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+        END
+    """)
+    op.execute("""
+        CREATE TRIGGER comments_fts_au AFTER UPDATE OF content ON comments BEGIN
+            INSERT INTO comments_fts(comments_fts, rowid, content) VALUES ('delete', old.id, old.content);
+            INSERT INTO comments_fts(rowid, content) VALUES (new.id, new.content);
+        END
+    """)
+
+    # 기존 데이터 색인
+    op.execute("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+    op.execute("INSERT INTO comments_fts(comments_fts) VALUES ('rebuild')")
+
+
+def downgrade() -> None:
+    """Drop FTS5 tables and triggers."""
+    for trigger in (
+        'comments_fts_au', 'comments_fts_ad', 'comments_fts_ai',
+        'posts_fts_au', 'posts_fts_ad', 'posts_fts_ai',
+    ):
+        op.execute(f"DROP TRIGGER IF EXISTS {trigger}")
+    op.execute("DROP TABLE IF EXISTS comments_fts")
+    op.execute("DROP TABLE IF EXISTS posts_fts")
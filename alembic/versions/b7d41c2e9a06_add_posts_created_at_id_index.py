@@ -0,0 +1,28 @@
+"""Add composite index on posts (created_at, id) for cursor pagination
+
+Revision ID: b7d41c2e9a06
+Revises: f2e035a78b12
+Create Date: 2025-12-02 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d41c2e9a06'
+down_revision: Union[str, Sequence[str], None] = 'f2e035a78b12'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_posts_created_at_id', 'posts', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_posts_created_at_id', table_name='posts')
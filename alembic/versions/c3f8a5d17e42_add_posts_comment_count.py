@@ -0,0 +1,38 @@
+"""Add denormalized comment_count to posts
+
+Revision ID: c3f8a5d17e42
+Revises: b7d41c2e9a06
+Create Date: 2025-12-03 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c3f8a5d17e42'
+down_revision: Union[str, Sequence[str], None] = 'b7d41c2e9a06'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Add comment_count column and backfill it from comments."""
+    op.add_column(
+        'posts',
+        sa.Column('comment_count', sa.Integer(), nullable=False, server_default='0')
+    )
+
+    # 기존 댓글 수로 채우기
+    op.execute(
+        "UPDATE posts SET comment_count = "
+        "(SELECT COUNT(*) FROM comments WHERE comments.post_id = posts.id)"
+    )
+
+
+def downgrade() -> None:
+    """Drop comment_count column."""
+    with op.batch_alter_table('posts') as batch_op:
+        batch_op.drop_column('comment_count')
@@ -0,0 +1,41 @@
+"""Add composite indexes for incremental and per-author export
+
+comments (created_at, id) serves the date-range export. posts/comments
+(author_id, created_at, id) serve the per-author export without a temp
+B-tree sort and replace the single-column author_id indexes, whose prefix
+they cover (CASCADE delete on account removal, comment count repair).
+
+Revision ID: c6e1f9a3b205
+Revises: b2c8e4f7a913
+Create Date: 2025-12-12 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e1f9a3b205'
+down_revision: Union[str, Sequence[str], None] = 'b2c8e4f7a913'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_comments_created_at_id', 'comments', ['created_at', 'id'], unique=False)
+    op.create_index('ix_posts_author_id_created_at', 'posts', ['author_id', 'created_at', 'id'], unique=False)
+    op.create_index('ix_comments_author_id_created_at', 'comments', ['author_id', 'created_at', 'id'], unique=False)
+    op.drop_index('ix_posts_author_id', table_name='posts')
+    op.drop_index('ix_comments_author_id', table_name='comments')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index('ix_comments_author_id', 'comments', ['author_id'], unique=False)
+    op.create_index('ix_posts_author_id', 'posts', ['author_id'], unique=False)
+    op.drop_index('ix_comments_author_id_created_at', table_name='comments')
+    op.drop_index('ix_posts_author_id_created_at', table_name='posts')
+    op.drop_index('ix_comments_created_at_id', table_name='comments')
@@ -0,0 +1,39 @@
+"""Add secondary indexes for hot query shapes
+
+Revision ID: d9a2e6f04b13
+Revises: c3f8a5d17e42
+Create Date: 2025-12-05 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd9a2e6f04b13'
+down_revision: Union[str, Sequence[str], None] = 'c3f8a5d17e42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 게시글별 댓글 목록 (WHERE post_id = ? ORDER BY created_at, id)
+    op.create_index('ix_comments_post_id_created_at', 'comments', ['post_id', 'created_at', 'id'], unique=False)
+    # 회원 탈퇴 시 CASCADE 삭제 및 댓글 수 보정 (author_id 조회)
+    op.create_index(op.f('ix_comments_author_id'), 'comments', ['author_id'], unique=False)
+    op.create_index(op.f('ix_posts_author_id'), 'posts', ['author_id'], unique=False)
+    # 닉네임 중복 확인 (기존 중복 닉네임이 있으면 실패하므로 먼저 정리해야 함)
+    op.drop_index(op.f('ix_users_nickname'), table_name='users')
+    op.create_index(op.f('ix_users_nickname'), 'users', ['nickname'], unique=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_users_nickname'), table_name='users')
+    op.create_index(op.f('ix_users_nickname'), 'users', ['nickname'], unique=False)
+    op.drop_index(op.f('ix_posts_author_id'), table_name='posts')
+    op.drop_index(op.f('ix_comments_author_id'), table_name='comments')
+    op.drop_index('ix_comments_post_id_created_at', table_name='comments')
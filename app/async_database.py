@@ -0,0 +1,73 @@
+from sqlalchemy import event, pool
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.config import settings
+from app.database import apply_read_only_session, apply_sqlite_pragmas, pool_options
+from app.utils.metrics import CheckoutTimingPoolMixin
+
+ASYNC_SQLALCHEMY_DATABASE_URL = settings.async_database_url
+ASYNC_READ_SQLALCHEMY_DATABASE_URL = settings.async_read_database_url
+
+
+class AsyncAdaptedQueuePool(CheckoutTimingPoolMixin, pool.AsyncAdaptedQueuePool):
+    """커넥션 체크아웃 시간/대기 수를 /metrics에 기록하는 AsyncAdaptedQueuePool"""
+
+    # 로거를 sqlalchemy.pool 아래에 두어 LOG_LEVEL=INFO에서도 풀 dispose/recreate 로그가 나오지 않도록 함
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.AsyncAdaptedQueuePool"
+
+
+ASYNC_POOL_CLASSES = {
+    "queue": AsyncAdaptedQueuePool,
+    "static": pool.StaticPool,
+    "null": pool.NullPool,
+    "singleton": pool.StaticPool,
+}
+
+async_engine = create_async_engine(
+    ASYNC_SQLALCHEMY_DATABASE_URL,
+    **pool_options(ASYNC_POOL_CLASSES)
+)
+
+async_read_engine = create_async_engine(
+    ASYNC_READ_SQLALCHEMY_DATABASE_URL,
+    **pool_options(ASYNC_POOL_CLASSES)
+)
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def set_sqlite_pragma(dbapi_conn, connection_record):
+    if async_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(dbapi_conn)
+
+@event.listens_for(async_read_engine.sync_engine, "connect")
+def set_read_only_pragma(dbapi_conn, connection_record):
+    if async_read_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(dbapi_conn, read_only=True)
+    else:
+        apply_read_only_session(dbapi_conn)
+
+# run_sync 밖에서 응답 직렬화 시 만료된 속성 lazy load가 일어나지 않도록 expire_on_commit=False
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+AsyncReadSessionLocal = async_sessionmaker(
+    bind=async_read_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+# 쓰기(및 읽고 나서 쓰는) 요청용 세션
+get_async_write_db = get_async_db
+
+async def get_async_read_db():
+    """읽기 전용 요청용 비동기 세션 (async_read_engine 풀 사용)"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
@@ -0,0 +1,174 @@
+import os
+
+
+def _env_int(name: str, default: int) -> int:
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def _env_float(name: str, default: float) -> float:
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def _read_only_url(url: str) -> str:
+    """SQLite 파일 URL을 읽기 전용(mode=ro) URI로 변환 (그 외 URL은 그대로)"""
+    if not url.startswith("sqlite") or ":memory:" in url or ":///" not in url:
+        return url
+    prefix, path = url.split(":///", 1)
+    if path.startswith("file:"):
+        return url
+    return f"{prefix}:///file:{path}?mode=ro&uri=true"
+
+
+class Settings:
+    """환경 변수 기반 애플리케이션 설정"""
+
+    def __init__(self):
+        self.database_url = os.getenv("DATABASE_URL", "sqlite:///./app.db")
+        # DB_ASYNC=1 이면 AsyncSession(aiosqlite) 기반 async 라우터 사용
+        self.db_async = _env_bool("DB_ASYNC", False)
+        self.async_database_url = os.getenv(
+            "ASYNC_DATABASE_URL",
+            self.database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        )
+        # 읽기 전용 엔진 (기본값: 같은 SQLite 파일을 mode=ro로 연다, 다른 파일이나 Postgres 복제본 지정 가능)
+        self.read_database_url = os.getenv(
+            "READ_DATABASE_URL",
+            _read_only_url(self.database_url)
+        )
+        self.async_read_database_url = os.getenv(
+            "ASYNC_READ_DATABASE_URL",
+            self.read_database_url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        )
+
+        self.log_level = os.getenv("LOG_LEVEL", "INFO").upper()
+
+        # 요청별 SQL 계측 (Server-Timing 헤더, N+1 경고), 운영에서 끄려면 SQL_INSTRUMENTATION=0
+        self.sql_instrumentation = _env_bool("SQL_INSTRUMENTATION", True)
+        # 한 요청에서 같은 쿼리가 이 횟수 이상 실행되면 N+1 의심 경고 (0이면 경고하지 않음)
+        self.sql_n_plus_one_threshold = _env_int("SQL_N_PLUS_ONE_THRESHOLD", 5)
+        # /metrics (Prometheus 텍스트 형식) 노출 및 요청/커넥션 풀 지표 기록
+        self.metrics_enabled = _env_bool("METRICS_ENABLED", True)
+
+        # 슬로 쿼리 로그: 이 시간(ms) 이상 걸린 SQL을 JSON Lines로 기록 (0이면 비활성화)
+        self.slow_query_ms = _env_float("SLOW_QUERY_MS", 100.0)
+        self.slow_query_log_path = os.getenv("SLOW_QUERY_LOG_PATH", "slow_queries.jsonl")
+        # 기록 시 별도 읽기 전용 커넥션으로 EXPLAIN QUERY PLAN 수집 (SQLite)
+        self.slow_query_explain = _env_bool("SLOW_QUERY_EXPLAIN", True)
+
+        # /internal/* 운영 엔드포인트 접근용 비밀 값 (X-Internal-Secret 헤더, 빈 값이면 라우터를 등록하지 않음)
+        self.internal_secret = os.getenv("INTERNAL_SECRET", "")
+
+        # 요청 단위 프로파일링: X-Profile 헤더 값이 PROFILE_SECRET과 같거나(빈 값이면 헤더 비활성화)
+        # PROFILE_SAMPLE_RATE 확률(0~1)에 걸린 요청의 호출 스택을 PROFILE_DIR에 저장
+        self.profile_secret = os.getenv("PROFILE_SECRET", "")
+        self.profile_sample_rate = _env_float("PROFILE_SAMPLE_RATE", 0.0)
+        self.profile_dir = os.getenv("PROFILE_DIR", "profiles")
+        self.profile_interval_ms = _env_float("PROFILE_INTERVAL_MS", 2.0)
+
+        # SQLite 튜닝 프로필 (빈 문자열로 지정하면 해당 PRAGMA는 설정하지 않음)
+        self.sqlite_journal_mode = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+        self.sqlite_synchronous = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+        self.sqlite_busy_timeout_ms = os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000")
+        # 음수는 KiB 단위 (-64000 ≈ 64MB)
+        self.sqlite_cache_size = os.getenv("SQLITE_CACHE_SIZE", "-64000")
+        self.sqlite_mmap_size = os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024))
+        self.sqlite_temp_store = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+        # 커넥션 풀: queue | static | null | singleton
+        self.db_pool_class = os.getenv("DB_POOL_CLASS", "queue").lower()
+        self.db_pool_size = _env_int("DB_POOL_SIZE", 20)
+        self.db_max_overflow = _env_int("DB_MAX_OVERFLOW", 20)
+        self.db_pool_timeout = _env_float("DB_POOL_TIMEOUT", 30.0)
+
+        # 쓰기 요청을 전용 writer 커넥션 하나로 모아 묶음 단위로 commit (group commit)
+        # 묶음당 최대 쓰기 수, 첫 쓰기 후 다음 쓰기를 기다리는 최대 시간(ms), 대기열 크기,
+        # 제출한 쓰기의 결과를 기다리는 최대 시간(초)
+        # (대기열이 가득 차면 DB_POOL_TIMEOUT 후, 결과가 제한 시간 안에 오지 않으면 503)
+        self.write_coordinator = _env_bool("WRITE_COORDINATOR", False)
+        self.write_coordinator_max_batch = _env_int("WRITE_COORDINATOR_MAX_BATCH", 64)
+        self.write_coordinator_max_wait_ms = _env_float("WRITE_COORDINATOR_MAX_WAIT_MS", 1.0)
+        self.write_coordinator_max_pending = _env_int("WRITE_COORDINATOR_MAX_PENDING", 1000)
+        self.write_coordinator_timeout = _env_float("WRITE_COORDINATOR_TIMEOUT", 30.0)
+
+        # 시작 시(lifespan) 매퍼 구성, 커넥션 풀, SQL 컴파일 캐시를 미리 준비
+        # (첫 요청이 커넥션 생성/SQL 컴파일 비용을 내지 않도록)
+        self.startup_warmup = _env_bool("STARTUP_WARMUP", True)
+        # 엔진마다 미리 열어 둘 커넥션 수 (풀 크기를 넘지 않음)
+        self.startup_warm_connections = _env_int("STARTUP_WARM_CONNECTIONS", 4)
+        # 비밀번호 해싱 워커 프로세스도 시작 시 띄워 둠 (워커 spawn 시간만큼 준비 완료가 늦어짐)
+        self.startup_warm_hash_workers = _env_bool("STARTUP_WARM_HASH_WORKERS", False)
+
+        # Argon2 비용 프로필 (low | default | high), 개별 값을 지정하면 프로필 값을 덮어씀
+        self.password_hash_profile = os.getenv("PASSWORD_HASH_PROFILE", "default").lower()
+        self.password_hash_time_cost = _env_int("PASSWORD_HASH_TIME_COST", 0)
+        self.password_hash_memory_cost = _env_int("PASSWORD_HASH_MEMORY_COST", 0)
+        self.password_hash_parallelism = _env_int("PASSWORD_HASH_PARALLELISM", 0)
+        # 해싱 전용 프로세스 풀 크기 (0이면 호출 스레드에서 직접 해싱)
+        self.password_hash_workers = _env_int("PASSWORD_HASH_WORKERS", 2)
+        # 동시에 대기/실행할 수 있는 최대 해싱 작업 수와 자리가 날 때까지 기다리는 시간(초)
+        self.password_hash_max_pending = _env_int("PASSWORD_HASH_MAX_PENDING", 32)
+        self.password_hash_queue_timeout = _env_float("PASSWORD_HASH_QUEUE_TIMEOUT", 5.0)
+
+        # 작성자 식별 정보 프로세스 캐시 (유지 시간(초), 0이면 요청 범위 캐시만 사용)
+        self.user_cache_ttl = _env_float("USER_CACHE_TTL", 30.0)
+        self.user_cache_size = _env_int("USER_CACHE_SIZE", 10000)
+
+        # 전문 검색 FTS5 토크나이저 (trigram: 한국어 부분 일치, unicode61: 공백 단위 단어)
+        # 마이그레이션/색인 재생성 시점에 적용됨 (python -m scripts.rebuild_search_index)
+        self.search_tokenizer = os.getenv("SEARCH_TOKENIZER", "trigram")
+        # 모든 검색어가 3글자 미만(trigram 색인 사용 불가)일 때 LIKE로 확인할 최근 게시글/댓글 수
+        self.search_short_term_scan_rows = _env_int("SEARCH_SHORT_TERM_SCAN_ROWS", 5000)
+
+        # 게시글 상세 응답에 포함할 최대 댓글 수 (나머지는 커서로 조회)
+        self.post_detail_comment_limit = _env_int("POST_DETAIL_COMMENT_LIMIT", 20)
+
+        # GET /posts/ 직렬화 결과 캐시 (항목 수, 유지 시간(초), 둘 중 하나라도 0이면 비활성화)
+        # 조회수/좋아요 수는 무효화 대상이 아니므로 목록의 view_count, like_count는 최대 TTL만큼 늦게 반영됨
+        self.post_list_cache_size = _env_int("POST_LIST_CACHE_SIZE", 256)
+        self.post_list_cache_ttl = _env_float("POST_LIST_CACHE_TTL", 5.0)
+
+        # POST /posts/bulk, /posts/{id}/comments/bulk 요청당 최대 항목 수
+        self.bulk_max_items = _env_int("BULK_MAX_ITEMS", 1000)
+
+        # /export/*.ndjson 스트리밍 시 한 번에 가져와 전송하는 행 수 (메모리 사용량 상한)
+        self.export_batch_size = _env_int("EXPORT_BATCH_SIZE", 500)
+
+        # 조회수 버퍼: 주기(초) 또는 누적 증가분 임계치 도달 시 일괄 반영
+        self.view_count_flush_interval = _env_float("VIEW_COUNT_FLUSH_INTERVAL", 5.0)
+        self.view_count_flush_threshold = _env_int("VIEW_COUNT_FLUSH_THRESHOLD", 1000)
+
+    def sqlite_pragmas(self, read_only: bool = False) -> dict[str, str]:
+        """커넥션마다 적용할 SQLite PRAGMA (적용 순서 유지)
+
+        Args:
+            read_only (bool): 읽기 전용 커넥션 여부 (journal_mode/synchronous 대신 query_only 적용)
+
+        Returns:
+            dict[str, str]: PRAGMA 이름과 값
+        """
+        if read_only:
+            pragmas = {"query_only": "ON"}
+        else:
+            pragmas = {
+                "journal_mode": self.sqlite_journal_mode,
+                "synchronous": self.sqlite_synchronous,
+            }
+        pragmas.update({
+            "busy_timeout": self.sqlite_busy_timeout_ms,
+            "cache_size": self.sqlite_cache_size,
+            "mmap_size": self.sqlite_mmap_size,
+            "temp_store": self.sqlite_temp_store,
+        })
+        return {name: value for name, value in pragmas.items() if value}
+
+
+settings = Settings()
@@ -0,0 +1,304 @@
+from collections.abc import AsyncIterator
+
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.models.user_model import Users
+from app.controllers.post_controller import PostController
+from app.controllers.comment_controller import CommentController
+from app.controllers.user_controller import UserController
+from app.controllers.auth_controller import AuthController
+from app.controllers.like_controller import LikeController
+from app.controllers.export_controller import encode_ndjson
+from app.schemas.post_schema import PostCreate, PostUpdate, PostLikeStatus
+from app.schemas.comment_schema import CommentCreate, CommentUpdate
+from app.schemas.user_schema import UserCreate, UserUpdate
+from app.schemas.auth_schema import LoginResponse
+from app.schemas.bulk_schema import PostBulkResult, CommentBulkResult
+from app.utils.security import hash_password_async, verify_password_and_check_rehash_async
+from app.exceptions import UnauthorizedException
+from app.config import settings
+
+# async 컨트롤러는 AsyncSession.run_sync로 동기 컨트롤러의 로직을 그대로 실행한다.
+# 비즈니스 로직은 동기 컨트롤러 한 곳에만 두고, I/O는 aiosqlite 드라이버가 비동기로 처리한다.
+# CPU를 오래 쓰는 Argon2 해싱/검증은 이벤트 루프를 막지 않도록 해싱 전용 프로세스 풀에서 기다린다.
+
+
+class AsyncPostController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_post(self, post_data: PostCreate, author_id: int) -> Post:
+        """게시글 생성 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).create_post(post_data, author_id)
+        )
+
+    async def bulk_create_posts(self, items: list, author_id: int) -> PostBulkResult:
+        """게시글 일괄 생성 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).bulk_create_posts(items, author_id)
+        )
+
+    async def get_posts(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list[Post]:
+        """모든 게시글 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).get_posts(skip, limit, cursor)
+        )
+
+    async def get_post_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list[dict]:
+        """모든 게시글 조회 (async, 목록 응답용 빠른 경로)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).get_post_rows(skip, limit, cursor)
+        )
+
+    async def search_posts(
+        self,
+        q: str,
+        limit: int = 10,
+        cursor: str | None = None
+    ) -> list[Post]:
+        """게시글 전문 검색 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).search_posts(q, limit, cursor)
+        )
+
+    async def get_post_by_id(self, post_id: int, increment_view: bool = True) -> Post | None:
+        """ID로 게시글 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).get_post_by_id(post_id, increment_view)
+        )
+
+    async def get_post_detail(
+        self,
+        post_id: int,
+        comment_limit: int,
+        increment_view: bool = True
+    ) -> Post | None:
+        """게시글 상세 조회 (async, 앞쪽 댓글 일부 포함)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).get_post_detail(
+                post_id, comment_limit, increment_view
+            )
+        )
+
+    async def update_post(
+        self,
+        post_id: int,
+        post_data: PostUpdate,
+        author_id: int
+    ) -> Post | None:
+        """게시글 수정 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).update_post(post_id, post_data, author_id)
+        )
+
+    async def delete_post(self, post_id: int, author_id: int) -> Post | None:
+        """게시글 삭제 (async)"""
+        return await self.db.run_sync(
+            lambda session: PostController(session).delete_post(post_id, author_id)
+        )
+
+
+class AsyncCommentController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_comment(
+        self,
+        comment_data: CommentCreate,
+        post_id: int,
+        author_id: int
+    ) -> Comment:
+        """댓글 생성 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).create_comment(
+                comment_data, post_id, author_id
+            )
+        )
+
+    async def bulk_create_comments(
+        self,
+        items: list,
+        post_id: int,
+        author_id: int
+    ) -> CommentBulkResult:
+        """댓글 일괄 생성 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).bulk_create_comments(
+                items, post_id, author_id
+            )
+        )
+
+    async def get_comments_by_post(
+        self,
+        post_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list[Comment]:
+        """게시글의 모든 댓글 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).get_comments_by_post(
+                post_id, skip, limit, cursor
+            )
+        )
+
+    async def get_comment_rows_by_post(
+        self,
+        post_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list:
+        """게시글의 댓글 조회 (async, 목록 응답용 빠른 경로)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).get_comment_rows_by_post(
+                post_id, skip, limit, cursor
+            )
+        )
+
+    async def get_comment_by_id(self, comment_id: int) -> Comment | None:
+        """ID로 댓글 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).get_comment_by_id(comment_id)
+        )
+
+    async def update_comment(
+        self,
+        comment_id: int,
+        comment_data: CommentUpdate,
+        author_id: int
+    ) -> Comment | None:
+        """댓글 수정 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).update_comment(
+                comment_id, comment_data, author_id
+            )
+        )
+
+    async def delete_comment(self, comment_id: int, author_id: int) -> Comment | None:
+        """댓글 삭제 (async)"""
+        return await self.db.run_sync(
+            lambda session: CommentController(session).delete_comment(comment_id, author_id)
+        )
+
+
+class AsyncUserController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_user(self, user_data: UserCreate) -> Users:
+        """회원 생성 (async, 비밀번호 해싱은 프로세스 풀에서 수행)"""
+        hashed_password = await hash_password_async(user_data.password)
+        return await self.db.run_sync(
+            lambda session: UserController(session).create_user(user_data, hashed_password)
+        )
+
+    async def get_users(self) -> list[Users]:
+        """모든 회원정보 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: UserController(session).get_users()
+        )
+
+    async def get_user_rows(self) -> list:
+        """모든 회원정보 조회 (async, 목록 응답용 빠른 경로)"""
+        return await self.db.run_sync(
+            lambda session: UserController(session).get_user_rows()
+        )
+
+    async def get_user_by_id(self, user_id: int) -> Users | None:
+        """id로 회원정보 조회 (async)"""
+        return await self.db.run_sync(
+            lambda session: UserController(session).get_user_by_id(user_id)
+        )
+
+    async def update_user(self, user_id: int, user_data: UserUpdate) -> Users | None:
+        """회원정보 수정 (async)"""
+        return await self.db.run_sync(
+            lambda session: UserController(session).update_user(user_id, user_data)
+        )
+
+    async def delete_user(self, user_id: int) -> Users | None:
+        """회원정보 삭제 (async)"""
+        return await self.db.run_sync(
+            lambda session: UserController(session).delete_user(user_id)
+        )
+
+
+class AsyncLikeController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def like_post(self, post_id: int, user_id: int) -> PostLikeStatus:
+        """게시글 좋아요 (async)"""
+        return await self.db.run_sync(
+            lambda session: LikeController(session).like_post(post_id, user_id)
+        )
+
+    async def unlike_post(self, post_id: int, user_id: int) -> PostLikeStatus:
+        """게시글 좋아요 취소 (async)"""
+        return await self.db.run_sync(
+            lambda session: LikeController(session).unlike_post(post_id, user_id)
+        )
+
+
+class AsyncExportController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def stream(self, statement: Select) -> AsyncIterator[bytes]:
+        """쿼리 결과를 export_batch_size 행 단위 NDJSON 청크로 생성 (async)
+
+        run_sync는 결과 전체를 한 번에 돌려주므로 여기서만 AsyncSession.stream으로 직접 순회한다.
+        쿼리는 ExportController.*_statement()로 만든다.
+        """
+        result = await self.db.stream(
+            statement.execution_options(yield_per=settings.export_batch_size)
+        )
+        async for partition in result.partitions():
+            yield encode_ndjson(partition)
+
+
+class AsyncAuthController:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def login(self, username: str, password: str) -> LoginResponse:
+        """로그인 (async, 비밀번호 검증은 프로세스 풀에서 수행)
+
+        Raises:
+            UnauthorizedException: 이메일 또는 비밀번호가 잘못된 경우
+        """
+        user = await self.db.run_sync(
+            lambda session: AuthController(session).get_user_by_email(username)
+        )
+
+        if not user:
+            raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다")
+
+        verified, needs_rehash = await verify_password_and_check_rehash_async(
+            password, user.hashed_password
+        )
+        if not verified:
+            raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다")
+
+        if needs_rehash:
+            hashed_password = await hash_password_async(password)
+            await self.db.run_sync(
+                lambda session: AuthController(session).update_password_hash(user.id, hashed_password)
+            )
+
+        return AuthController.build_login_response(user)
@@ -2,7 +2,9 @@ from sqlalchemy.orm import Session
 
 from app.models.user_model import Users
 from app.schemas.auth_schema import LoginResponse
-from app.utils.security import verify_password
+from app.utils.security import hash_password, verify_password_and_check_rehash
+from app.utils.db_utils import db_transaction
+from app.utils.write_coordinator import write_operation
 from app.exceptions import UnauthorizedException
 
 
@@ -24,19 +26,65 @@ class AuthController:
             UnauthorizedException: 이메일 또는 비밀번호가 잘못된 경우
         """
         # 이메일로 사용자 조회 (OAuth2의 username 필드를 email로 사용)
-        user = (
-            self.db.query(Users)
-            .filter(Users.email == username)
-            .first()
-        )
+        user = self.get_user_by_email(username)
 
         if not user:
             raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다")
 
         # 비밀번호 검증
-        if not verify_password(password, user.hashed_password):
+        verified, needs_rehash = verify_password_and_check_rehash(password, user.hashed_password)
+        if not verified:
             raise UnauthorizedException("이메일 또는 비밀번호가 잘못되었습니다")
 
+        # 비용 프로필이 바뀐 경우 로그인 시점에 새 파라미터로 재해싱
+        if needs_rehash:
+            self.update_password_hash(user.id, hash_password(password))
+
+        return self.build_login_response(user)
+
+    @write_operation
+    def update_password_hash(self, user_id: int, hashed_password: str) -> None:
+        """저장된 비밀번호 해시 교체
+
+        Args:
+            user_id (int): 대상 사용자 ID
+            hashed_password (str): 새로 해싱된 비밀번호
+        """
+        with db_transaction(self.db):
+            (
+                self.db.query(Users)
+                .filter(Users.id == user_id)
+                .update(
+                    {Users.hashed_password: hashed_password},
+                    synchronize_session=False
+                )
+            )
+
+    def get_user_by_email(self, email: str) -> Users | None:
+        """이메일로 사용자 조회
+
+        Args:
+            email (str): 사용자 이메일
+
+        Returns:
+            Users | None: 사용자 정보 또는 None
+        """
+        return (
+            self.db.query(Users)
+            .filter(Users.email == email)
+            .first()
+        )
+
+    @staticmethod
+    def build_login_response(user: Users) -> LoginResponse:
+        """로그인 성공 응답 생성
+
+        Args:
+            user (Users): 인증된 사용자
+
+        Returns:
+            LoginResponse: 로그인 성공 메시지 및 사용자 정보
+        """
         return LoginResponse(
             message="로그인 성공",
             user_id=user.id,
@@ -1,16 +1,33 @@
+from pydantic import TypeAdapter
+from sqlalchemy import insert, or_
 from sqlalchemy.orm import Session
 
 from app.models.comment_model import Comment
+from app.models.post_model import Post
 from app.controllers.user_controller import UserController
-from app.schemas.comment_schema import CommentCreate, CommentUpdate
-from app.exceptions import NotFoundException, ForbiddenException
-from app.utils.db_utils import db_transaction
+from app.schemas.comment_schema import CommentBase, CommentCreate, CommentUpdate, Comment as CommentSchema
+from app.schemas.bulk_schema import CommentBulkResult
+from app.exceptions import NotFoundException, ForbiddenException, InvalidDataException, BulkValidationException
+from app.utils.db_utils import db_transaction, after_commit
+from app.utils.response_cache import post_list_cache
+from app.utils.write_coordinator import write_operation
+from app.utils.pagination import decode_cursor
+from app.utils.bulk import validate_items
+from app.utils.serialization import schema_columns, schema_fields
+
+# 일괄 생성 항목은 내용만 받음 (게시글은 URL로 지정)
+_comment_item_adapter = TypeAdapter(CommentBase)
+
+# 목록 빠른 경로: 응답 스키마(Comment) 필드 + ETag 계산용 updated_at
+COMMENT_LIST_FIELDS = schema_fields(CommentSchema)
+COMMENT_LIST_COLUMNS = schema_columns(Comment, CommentSchema, Comment.updated_at)
 
 
 class CommentController:
     def __init__(self, db: Session):
         self.db = db
 
+    @write_operation
     def create_comment(
         self,
         comment_data: CommentCreate,
@@ -26,50 +43,167 @@ class CommentController:
 
         Returns:
             Comment: 생성된 댓글
-        """
-        # 작성자 존재 확인
-        user = UserController(self.db).get_user_by_id(author_id)
 
-        if not user:
-            raise NotFoundException("작성자가 존재하지 않습니다")
-        
+        Raises:
+            NotFoundException: 작성자가 존재하지 않는 경우
+        """
         new_comment = Comment(
             content=comment_data.content,
             post_id=post_id,
             author_id=author_id
         )
 
-        with db_transaction(self.db):
-            self.db.add(new_comment)
+        # 작성자 존재 확인은 별도 SELECT 없이 FK 제약에 맡김
+        try:
+            with db_transaction(self.db):
+                self.db.add(new_comment)
+                # 게시글의 댓글 수를 같은 트랜잭션에서 원자적으로 증가
+                self._adjust_comment_count(post_id, 1)
+        except InvalidDataException:
+            # 게시글 FK 위반일 수도 있으므로 작성자가 없을 때만 NotFoundException
+            if not UserController(self.db).user_exists(author_id, use_cache=False):
+                raise NotFoundException("작성자가 존재하지 않습니다")
+            raise
+
+        # 목록 캐시 중 이 게시글의 comment_count가 들어 있는 페이지만 무효화
+        after_commit(self.db, lambda: post_list_cache.invalidate_posts([post_id]))
 
         self.db.refresh(new_comment)
         return new_comment
 
+    def bulk_create_comments(
+        self,
+        items: list,
+        post_id: int,
+        author_id: int
+    ) -> CommentBulkResult:
+        """댓글 일괄 생성
+
+        항목을 하나씩 검증해 실패한 항목은 오류로 모으고, 나머지는 한 트랜잭션에서
+        INSERT ... RETURNING 한 번(executemany)으로 저장한 뒤 comment_count를 한 번에 증가시킨다.
+
+        Args:
+            items (list): content 필드를 가진 원본 항목
+            post_id (int): 게시글 ID
+            author_id (int): 작성자 ID
+
+        Returns:
+            CommentBulkResult: 생성된 댓글(요청 순서)과 항목별 오류
+
+        Raises:
+            NotFoundException: 게시글 또는 작성자가 존재하지 않는 경우
+            BulkValidationException: 모든 항목이 검증에 실패한 경우 (422, 항목별 오류 포함)
+        """
+        if self.db.query(Post.id).filter(Post.id == post_id).first() is None:
+            raise NotFoundException("게시글을 찾을 수 없습니다")
+        if not UserController(self.db).user_exists(author_id):
+            raise NotFoundException("작성자가 존재하지 않습니다")
+
+        valid, errors = validate_items(_comment_item_adapter, items)
+        if not valid:
+            raise BulkValidationException([error.model_dump() for error in errors])
+
+        rows = [
+            {"content": comment_data.content, "post_id": post_id, "author_id": author_id}
+            for _, comment_data in valid
+        ]
+        # 검증과 응답 변환은 writer 밖(호출한 스레드)에서 하고 INSERT와 댓글 수 증가만 쓰기로 넘김
+        created = self._insert_comments(post_id, rows)
+
+        return CommentBulkResult(
+            created=[CommentSchema.model_validate(row, from_attributes=True) for row in created],
+            errors=errors
+        )
+
+    @write_operation
+    def _insert_comments(self, post_id: int, rows: list[dict]) -> list:
+        statement = insert(Comment).returning(*Comment.__table__.columns, sort_by_parameter_order=True)
+
+        with db_transaction(self.db):
+            created = self.db.execute(statement, rows).all()
+            self._adjust_comment_count(post_id, len(created))
+
+        after_commit(self.db, lambda: post_list_cache.invalidate_posts([post_id]))
+        return created
+
     def get_comments_by_post(
         self,
         post_id: int,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> list[Comment]:
-        """게시글의 모든 댓글 조회
+        """게시글의 모든 댓글 조회 (작성순)
+
+        cursor가 주어지면 (created_at, id) 키셋 페이지네이션을 사용하고 skip은 무시한다.
 
         Args:
             post_id (int): 게시글 ID
-            skip (int): 건너뛸 개수
+            skip (int): 건너뛸 개수 (offset 모드)
             limit (int): 최대 개수
+            cursor (str | None): 이전 페이지의 next_cursor (cursor 모드)
 
         Returns:
             list[Comment]: 댓글 리스트
+
+        Raises:
+            InvalidDataException: 커서 형식이 잘못된 경우
         """
-        return (
-            self.db.query(Comment)
+        return self._comments_page((Comment,), post_id, skip, limit, cursor)
+
+    def get_comment_rows_by_post(
+        self,
+        post_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list:
+        """게시글의 댓글 조회 (작성순, 목록 응답용 빠른 경로)
+
+        ORM 객체 대신 COMMENT_LIST_COLUMNS 컬럼 튜플을 반환한다. 행은 속성 접근(row.id,
+        row.updated_at)이 가능하므로 커서/ETag 계산에 그대로 쓰고, 응답은
+        dump_rows(rows, COMMENT_LIST_FIELDS)로 직렬화한다.
+
+        Args:
+            post_id (int): 게시글 ID
+            skip (int): 건너뛸 개수 (offset 모드)
+            limit (int): 최대 개수
+            cursor (str | None): 이전 페이지의 next_cursor (cursor 모드)
+
+        Returns:
+            list: Comment 스키마 필드 + updated_at 순서의 행 리스트
+
+        Raises:
+            InvalidDataException: 커서 형식이 잘못된 경우
+        """
+        return self._comments_page(COMMENT_LIST_COLUMNS, post_id, skip, limit, cursor)
+
+    def _comments_page(
+        self,
+        entities,
+        post_id: int,
+        skip: int,
+        limit: int,
+        cursor: str | None
+    ) -> list:
+        query = (
+            self.db.query(*entities)
             .filter(Comment.post_id == post_id)
-            .order_by(Comment.created_at.asc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+            .order_by(Comment.created_at.asc(), Comment.id.asc())
         )
 
+        if cursor is not None:
+            created_at, comment_id = decode_cursor(cursor)
+            # (created_at, id) > (커서) 조건을 인덱스 범위 탐색이 가능한 형태로 표현
+            query = query.filter(
+                Comment.created_at >= created_at,
+                or_(Comment.created_at > created_at, Comment.id > comment_id)
+            )
+        else:
+            query = query.offset(skip)
+
+        return query.limit(limit).all()
+
     def get_comment_by_id(self, comment_id: int) -> Comment | None:
         """ID로 댓글 조회
 
@@ -85,6 +219,7 @@ class CommentController:
             .first()
         )
 
+    @write_operation
     def update_comment(
         self,
         comment_id: int,
@@ -122,6 +257,7 @@ class CommentController:
         self.db.refresh(comment)
         return comment
 
+    @write_operation
     def delete_comment(
         self,
         comment_id: int,
@@ -150,5 +286,25 @@ class CommentController:
 
         with db_transaction(self.db):
             self.db.delete(comment)
+            # 게시글의 댓글 수를 같은 트랜잭션에서 원자적으로 감소
+            self._adjust_comment_count(comment.post_id, -1)
 
-        return comment
\ No newline at end of file
+        after_commit(self.db, lambda: post_list_cache.invalidate_posts([comment.post_id]))
+
+        return comment
+
+    def _adjust_comment_count(self, post_id: int, delta: int) -> None:
+        """게시글의 comment_count를 delta만큼 갱신 (read-modify-write 없이 UPDATE)
+
+        Args:
+            post_id (int): 게시글 ID
+            delta (int): 증감값
+        """
+        (
+            self.db.query(Post)
+            .filter(Post.id == post_id)
+            .update(
+                {Post.comment_count: Post.comment_count + delta},
+                synchronize_session=False
+            )
+        )
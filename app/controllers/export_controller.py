@@ -0,0 +1,147 @@
+import json
+from collections.abc import Iterator, Sequence
+from datetime import datetime
+
+from sqlalchemy import Select, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import Session
+
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.models.user_model import Users
+from app.exceptions import InvalidDataException
+from app.config import settings
+
+
+# 내보내기 컬럼 (ORM 객체를 만들지 않고 컬럼 튜플만 가져옴, hashed_password는 제외)
+POST_EXPORT_COLUMNS = (
+    Post.id, Post.title, Post.content, Post.image_url, Post.author_id,
+    Post.created_at, Post.updated_at, Post.view_count, Post.like_count, Post.comment_count,
+)
+COMMENT_EXPORT_COLUMNS = (
+    Comment.id, Comment.post_id, Comment.author_id, Comment.content,
+    Comment.created_at, Comment.updated_at,
+)
+USER_EXPORT_COLUMNS = (Users.id, Users.email, Users.nickname, Users.updated_at)
+
+
+def _json_default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"직렬화할 수 없는 값: {type(value).__name__}")
+
+
+def encode_ndjson(rows: Sequence[Row]) -> bytes:
+    """행 묶음을 NDJSON(한 줄에 JSON 객체 하나) 바이트로 변환
+
+    Args:
+        rows (Sequence[Row]): 컬럼 이름으로 접근 가능한 결과 행
+
+    Returns:
+        bytes: 줄바꿈으로 끝나는 UTF-8 NDJSON
+    """
+    lines = [
+        json.dumps(dict(row._mapping), ensure_ascii=False, default=_json_default)
+        for row in rows
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+def _created_at_range(
+    statement: Select,
+    created_at_column,
+    created_from: datetime | None,
+    created_to: datetime | None
+) -> Select:
+    if created_from is not None and created_to is not None and created_from > created_to:
+        raise InvalidDataException("created_from은 created_to보다 늦을 수 없습니다")
+    if created_from is not None:
+        statement = statement.where(created_at_column >= created_from)
+    if created_to is not None:
+        statement = statement.where(created_at_column < created_to)
+    return statement
+
+
+class ExportController:
+    """테이블 전체를 NDJSON으로 스트리밍 내보내기
+
+    yield_per로 export_batch_size 행씩 커서에서 가져와 바로 인코딩해 보내므로
+    테이블 크기와 관계없이 메모리 사용량이 일정하다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @staticmethod
+    def posts_statement(
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        author_id: int | None = None
+    ) -> Select:
+        """게시글 내보내기 쿼리 (created_at, id 순)
+
+        Args:
+            created_from (datetime | None): 이 시각 이후(포함) 작성된 게시글만
+            created_to (datetime | None): 이 시각 이전(미포함) 작성된 게시글만
+            author_id (int | None): 작성자 ID
+
+        Returns:
+            Select: 컬럼 튜플을 반환하는 SELECT
+
+        Raises:
+            InvalidDataException: 기간의 시작이 끝보다 늦은 경우
+        """
+        statement = select(*POST_EXPORT_COLUMNS)
+        statement = _created_at_range(statement, Post.created_at, created_from, created_to)
+        if author_id is not None:
+            statement = statement.where(Post.author_id == author_id)
+        return statement.order_by(Post.created_at, Post.id)
+
+    @staticmethod
+    def comments_statement(
+        created_from: datetime | None = None,
+        created_to: datetime | None = None,
+        author_id: int | None = None
+    ) -> Select:
+        """댓글 내보내기 쿼리 (created_at, id 순)
+
+        Args:
+            created_from (datetime | None): 이 시각 이후(포함) 작성된 댓글만
+            created_to (datetime | None): 이 시각 이전(미포함) 작성된 댓글만
+            author_id (int | None): 작성자 ID
+
+        Returns:
+            Select: 컬럼 튜플을 반환하는 SELECT
+
+        Raises:
+            InvalidDataException: 기간의 시작이 끝보다 늦은 경우
+        """
+        statement = select(*COMMENT_EXPORT_COLUMNS)
+        statement = _created_at_range(statement, Comment.created_at, created_from, created_to)
+        if author_id is not None:
+            statement = statement.where(Comment.author_id == author_id)
+        return statement.order_by(Comment.created_at, Comment.id)
+
+    @staticmethod
+    def users_statement() -> Select:
+        """회원 내보내기 쿼리 (id 순, 비밀번호 해시 제외)
+
+        Returns:
+            Select: 컬럼 튜플을 반환하는 SELECT
+        """
+        return select(*USER_EXPORT_COLUMNS).order_by(Users.id)
+
+    def stream(self, statement: Select) -> Iterator[bytes]:
+        """쿼리 결과를 export_batch_size 행 단위 NDJSON 청크로 생성
+
+        Args:
+            statement (Select): *_statement()로 만든 쿼리
+
+        Yields:
+            bytes: NDJSON 청크
+        """
+        result = self.db.execute(
+            statement.execution_options(yield_per=settings.export_batch_size)
+        )
+        for partition in result.partitions():
+            yield encode_ndjson(partition)
@@ -0,0 +1,113 @@
+from sqlalchemy import delete, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.post_model import Post
+from app.models.post_like_model import PostLike
+from app.controllers.user_controller import UserController
+from app.schemas.post_schema import PostLikeStatus
+from app.exceptions import NotFoundException, InvalidDataException
+from app.utils.db_utils import db_transaction
+from app.utils.write_coordinator import write_operation
+
+
+class LikeController:
+    """게시글 좋아요
+
+    post_likes(user_id, post_id) 복합 PK로 회원당 한 번만 반영되고(멱등), like_count는
+    행이 실제로 추가/삭제된 경우에만 UPDATE ... SET like_count = like_count ± 1 ... RETURNING으로
+    같은 트랜잭션에서 갱신한다. 읽고 나서 쓰는 단계가 없으므로 동시 요청에도 값이 유실되지 않는다.
+
+    SQLite는 쓰기 잠금이 DB 단위라 카운터를 여러 행으로 나눠도(sharding) 쓰기가 병렬화되지 않는다.
+    대신 좋아요 한 번의 트랜잭션을 INSERT와 UPDATE 두 문장으로 짧게 유지한다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    @write_operation
+    def like_post(self, post_id: int, user_id: int) -> PostLikeStatus:
+        """게시글 좋아요 (이미 좋아요한 경우 그대로 성공)
+
+        Args:
+            post_id (int): 게시글 ID
+            user_id (int): 회원 ID
+
+        Returns:
+            PostLikeStatus: 좋아요 여부와 현재 좋아요 수
+
+        Raises:
+            NotFoundException: 게시글 또는 회원이 존재하지 않는 경우
+        """
+        statement = (
+            sqlite_insert(PostLike)
+            .values(user_id=user_id, post_id=post_id)
+            .on_conflict_do_nothing(index_elements=["user_id", "post_id"])
+        )
+
+        # 게시글/회원 존재 확인은 별도 SELECT 없이 FK 제약에 맡김
+        try:
+            with db_transaction(self.db):
+                inserted = self.db.execute(statement).rowcount == 1
+                like_count = self._adjust_like_count(post_id, 1 if inserted else 0)
+        except InvalidDataException:
+            self._raise_missing(post_id, user_id)
+            raise
+
+        return PostLikeStatus(post_id=post_id, liked=True, like_count=like_count)
+
+    @write_operation
+    def unlike_post(self, post_id: int, user_id: int) -> PostLikeStatus:
+        """게시글 좋아요 취소 (좋아요하지 않은 경우 그대로 성공)
+
+        Args:
+            post_id (int): 게시글 ID
+            user_id (int): 회원 ID
+
+        Returns:
+            PostLikeStatus: 좋아요 여부와 현재 좋아요 수
+
+        Raises:
+            NotFoundException: 게시글이 존재하지 않는 경우
+        """
+        with db_transaction(self.db):
+            deleted = self.db.execute(
+                delete(PostLike).where(
+                    PostLike.user_id == user_id,
+                    PostLike.post_id == post_id
+                )
+            ).rowcount == 1
+            like_count = self._adjust_like_count(post_id, -1 if deleted else 0)
+
+        if like_count is None:
+            raise NotFoundException("게시글을 찾을 수 없습니다")
+
+        return PostLikeStatus(post_id=post_id, liked=False, like_count=like_count)
+
+    def _adjust_like_count(self, post_id: int, delta: int) -> int | None:
+        """게시글의 like_count를 delta만큼 갱신하고 갱신된 값을 반환 (read-modify-write 없이 UPDATE)
+
+        Args:
+            post_id (int): 게시글 ID
+            delta (int): 증감값 (0이면 현재 값만 조회)
+
+        Returns:
+            int | None: 현재 좋아요 수 (게시글이 없으면 None)
+        """
+        if not delta:
+            return self.db.query(Post.like_count).filter(Post.id == post_id).scalar()
+
+        return self.db.execute(
+            update(Post)
+            .where(Post.id == post_id)
+            .values(like_count=Post.like_count + delta)
+            .returning(Post.like_count)
+            .execution_options(synchronize_session=False)
+        ).scalar_one_or_none()
+
+    def _raise_missing(self, post_id: int, user_id: int) -> None:
+        # FK 위반 원인 판별 (실패한 요청에서만 조회)
+        if self.db.query(Post.id).filter(Post.id == post_id).first() is None:
+            raise NotFoundException("게시글을 찾을 수 없습니다")
+        if not UserController(self.db).user_exists(user_id, use_cache=False):
+            raise NotFoundException("사용자를 찾을 수 없습니다")
@@ -1,18 +1,136 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy.orm.attributes import set_committed_value
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, func, insert, or_, select, text
 
 from app.models.post_model import Post
 from app.models.comment_model import Comment
 from app.controllers.user_controller import UserController
-from app.schemas.post_schema import PostCreate, PostUpdate
-from app.exceptions import NotFoundException, ForbiddenException
-from app.utils.db_utils import db_transaction
+from app.controllers.comment_controller import CommentController
+from app.schemas.post_schema import PostCreate, PostUpdate, Post as PostSchema
+from app.schemas.bulk_schema import PostBulkResult
+from app.exceptions import NotFoundException, ForbiddenException, InvalidDataException, BulkValidationException
+from app.utils.db_utils import db_transaction, after_commit
+from app.utils.pagination import decode_cursor, next_cursor, decode_rank_cursor
+from app.utils.bulk import validate_items
+from app.utils.serialization import schema_columns, schema_fields
+from app.config import settings
+from app.utils.view_counter import view_counter
+from app.utils.response_cache import post_list_cache
+from app.utils.write_coordinator import write_operation
+
+
+# FTS5 검색: 게시글(제목 가중치 10, 내용 1)과 댓글(점수 절반) 일치를 게시글 단위로 묶어
+# 가장 좋은 점수(bm25는 낮을수록 관련도 높음)로 페이지를 정함. 스니펫은 일치하는 모든 행이 아니라
+# 페이지에 들어간 행에 대해서만 FTS_*_SNIPPET_SQL로 따로 계산한다.
+# (SQLite는 min() 집계 시 나머지 컬럼을 최솟값 행에서 가져오므로 comment_id는 가장 좋은 일치의 댓글,
+# 게시글 자체 일치면 NULL)
+# trigram 토크나이저로 찾을 수 없는 3글자 미만 단어는 {post_filter}/{comment_filter}에서 FTS 후보 행에만
+# LIKE로 확인한다.
+FTS_SEARCH_SQL = """
+WITH hits AS (
+    SELECT posts_fts.rowid AS post_id,
+           bm25(posts_fts, 10.0, 1.0) AS rank,
+           NULL AS comment_id
+    FROM posts_fts
+    {post_join}
+    WHERE posts_fts MATCH :query{post_filter}
+    UNION ALL
+    SELECT comments.post_id,
+           bm25(comments_fts) * 0.5,
+           comments.id
+    FROM comments_fts
+    JOIN comments ON comments.id = comments_fts.rowid
+    WHERE comments_fts MATCH :query{comment_filter}
+),
+ranked AS (
+    SELECT post_id, min(rank) AS rank, comment_id
+    FROM hits
+    GROUP BY post_id
+)
+SELECT post_id, rank, comment_id
+FROM ranked
+WHERE {cursor_filter}
+ORDER BY rank, post_id
+LIMIT :limit
+"""
+
+FTS_POST_SNIPPET_SQL = """
+SELECT rowid AS id, snippet(posts_fts, -1, '<mark>', '</mark>', '…', 24) AS snippet
+FROM posts_fts
+WHERE posts_fts MATCH :query AND rowid IN :ids
+"""
+
+FTS_COMMENT_SNIPPET_SQL = """
+SELECT rowid AS id, snippet(comments_fts, 0, '<mark>', '</mark>', '…', 24) AS snippet
+FROM comments_fts
+WHERE comments_fts MATCH :query AND rowid IN :ids
+"""
+
+# 모든 단어가 3글자 미만이면 색인을 쓸 수 없으므로 최근 게시글/댓글 :scan_rows개씩만 LIKE로 확인
+# (게시글 일치 rank 0, 댓글만 일치 rank 1, 테이블 크기와 관계없이 비용이 일정함)
+RECENT_LIKE_SEARCH_SQL = """
+WITH recent_posts AS (
+    SELECT id, title, content FROM posts ORDER BY id DESC LIMIT :scan_rows
+),
+recent_comments AS (
+    SELECT id, post_id, content FROM comments ORDER BY id DESC LIMIT :scan_rows
+),
+hits AS (
+    SELECT posts.id AS post_id, 0.0 AS rank, NULL AS comment_id
+    FROM recent_posts AS posts
+    WHERE {post_filter}
+    UNION ALL
+    SELECT comments.post_id, 1.0, comments.id
+    FROM recent_comments AS comments
+    WHERE {comment_filter}
+),
+ranked AS (
+    SELECT post_id, min(rank) AS rank, comment_id
+    FROM hits
+    GROUP BY post_id
+)
+SELECT post_id, rank, comment_id
+FROM ranked
+WHERE {cursor_filter}
+ORDER BY rank, post_id
+LIMIT :limit
+"""
+
+SNIPPET_RADIUS = 24
+
+_post_create_adapter = TypeAdapter(PostCreate)
+
+# 목록 빠른 경로: 응답 스키마(Post) 필드만 컬럼 튜플로 조회
+POST_LIST_FIELDS = schema_fields(PostSchema)
+POST_LIST_COLUMNS = schema_columns(Post, PostSchema)
+
+
+def _like_snippet(body: str, term: str) -> str:
+    """LIKE 검색 결과에서 첫 일치 주변만 잘라 <mark>로 감쌈"""
+    index = body.lower().find(term.lower())
+    if index < 0:
+        return body[:SNIPPET_RADIUS * 2]
+    start = max(0, index - SNIPPET_RADIUS)
+    end = min(len(body), index + len(term) + SNIPPET_RADIUS)
+    return (
+        ("…" if start > 0 else "")
+        + body[start:index]
+        + "<mark>" + body[index:index + len(term)] + "</mark>"
+        + body[index + len(term):end]
+        + ("…" if end < len(body) else "")
+    )
+
+
+def _escape_like(term: str) -> str:
+    return term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
 class PostController:
     def __init__(self, db: Session):
         self.db = db
 
+    @write_operation
     def create_post(
         self,
         post_data: PostCreate,
@@ -26,12 +144,10 @@ class PostController:
 
         Returns:
             Post: 생성된 게시글
-        """
-        # 작성자 존재 확인
-        user = UserController(self.db).get_user_by_id(author_id)
-        if not user:
-            raise NotFoundException("작성자가 존재하지 않습니다")
 
+        Raises:
+            NotFoundException: 작성자가 존재하지 않는 경우
+        """
         new_post = Post(
             title=post_data.title,
             content=post_data.content,
@@ -39,51 +155,156 @@ class PostController:
             author_id=author_id
         )
 
-        with db_transaction(self.db):
-            self.db.add(new_post)
+        # 작성자 존재 확인은 별도 SELECT 없이 FK 제약에 맡김
+        try:
+            with db_transaction(self.db):
+                self.db.add(new_post)
+        except InvalidDataException:
+            if not UserController(self.db).user_exists(author_id, use_cache=False):
+                raise NotFoundException("작성자가 존재하지 않습니다")
+            raise
+
+        # 새 글이 첫 페이지에 들어가고 offset 페이지가 모두 밀림
+        after_commit(self.db, post_list_cache.clear)
 
         self.db.refresh(new_post)
         return new_post
 
+    def bulk_create_posts(self, items: list, author_id: int) -> PostBulkResult:
+        """게시글 일괄 생성
+
+        항목을 하나씩 검증해 실패한 항목은 오류로 모으고, 나머지는 한 트랜잭션에서
+        INSERT ... RETURNING 한 번(executemany)으로 저장한다. 작성자 확인도 요청당 한 번만 한다.
+
+        Args:
+            items (list): PostCreate 형식의 원본 항목
+            author_id (int): 작성자 ID
+
+        Returns:
+            PostBulkResult: 생성된 게시글(요청 순서)과 항목별 오류
+
+        Raises:
+            NotFoundException: 작성자가 존재하지 않는 경우
+            BulkValidationException: 모든 항목이 검증에 실패한 경우 (422, 항목별 오류 포함)
+        """
+        if not UserController(self.db).user_exists(author_id):
+            raise NotFoundException("작성자가 존재하지 않습니다")
+
+        valid, errors = validate_items(_post_create_adapter, items)
+        if not valid:
+            raise BulkValidationException([error.model_dump() for error in errors])
+
+        rows = [
+            {
+                "title": post_data.title,
+                "content": post_data.content,
+                "image_url": post_data.image_url,
+                "author_id": author_id,
+            }
+            for _, post_data in valid
+        ]
+        # 검증과 응답 변환은 writer 밖(호출한 스레드)에서 하고 INSERT만 쓰기로 넘김
+        created = self._insert_posts(rows)
+
+        return PostBulkResult(
+            created=[PostSchema.model_validate(row, from_attributes=True) for row in created],
+            errors=errors
+        )
+
+    @write_operation
+    def _insert_posts(self, rows: list[dict]) -> list:
+        # ORM 객체 대신 컬럼 행을 돌려받아 commit 후 객체별 refresh가 필요 없음
+        statement = insert(Post).returning(*Post.__table__.columns, sort_by_parameter_order=True)
+
+        with db_transaction(self.db):
+            created = self.db.execute(statement, rows).all()
+
+        after_commit(self.db, post_list_cache.clear)
+        return created
+
     def get_posts(
         self,
         skip: int = 0,
-        limit: int = 100
+        limit: int = 100,
+        cursor: str | None = None
     ) -> list[Post]:
-        """모든 게시글 조회
+        """모든 게시글 조회 (최신순)
+
+        cursor가 주어지면 (created_at, id) 키셋 페이지네이션을 사용하고
+        skip은 무시한다. 키셋 모드는 페이지 깊이와 무관하게 비용이 일정하다.
 
         Args:
-            skip (int): 건너뛸 개수
+            skip (int): 건너뛸 개수 (offset 모드)
             limit (int): 최대 개수
+            cursor (str | None): 이전 페이지의 next_cursor (cursor 모드)
 
         Returns:
             list[Post]: 게시글 리스트
+
+        Raises:
+            InvalidDataException: 커서 형식이 잘못된 경우
         """
-        # 게시글과 댓글 개수 조회
-        results = (
-            self.db.query(
-                Post,
-                func.count(Comment.id).label('comment_count')
-            )
-            .outerjoin(Comment, Post.id == Comment.post_id)
-            .group_by(Post.id)
-            .order_by(Post.created_at.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        posts = self._posts_page((Post,), skip, limit, cursor)
+        # 아직 DB에 반영되지 않은 조회수 포함
+        view_counter.apply(posts)
+
+        return posts
+
+    def get_post_rows(
+        self,
+        skip: int = 0,
+        limit: int = 100,
+        cursor: str | None = None
+    ) -> list[dict]:
+        """모든 게시글 조회 (최신순, 목록 응답용 빠른 경로)
+
+        get_posts와 같은 페이지를 ORM 객체 대신 Post 스키마 필드만 담은 dict로 반환한다.
+        ORM 객체 생성(identity map 등록, 속성 계측)과 from_attributes 검증을 모두 건너뛰므로
+        결과는 그대로 JSON으로 직렬화하면 된다.
+
+        Args:
+            skip (int): 건너뛸 개수 (offset 모드)
+            limit (int): 최대 개수
+            cursor (str | None): 이전 페이지의 next_cursor (cursor 모드)
+
+        Returns:
+            list[dict]: Post 스키마 필드 순서의 게시글 dict 리스트
+
+        Raises:
+            InvalidDataException: 커서 형식이 잘못된 경우
+        """
+        rows = [
+            dict(zip(POST_LIST_FIELDS, row))
+            for row in self._posts_page(POST_LIST_COLUMNS, skip, limit, cursor)
+        ]
+        view_counter.apply_rows(rows)
+        return rows
+
+    def _posts_page(self, entities, skip: int, limit: int, cursor: str | None) -> list:
+        # 댓글 개수는 posts.comment_count 컬럼에 비정규화되어 있어 조인이 필요 없음
+        query = (
+            self.db.query(*entities)
+            .order_by(Post.created_at.desc(), Post.id.desc())
         )
 
-        # Post 객체에 comment_count 추가
-        posts = []
-        for post, count in results:
-            post.comment_count = count
-            posts.append(post)
+        if cursor is not None:
+            created_at, post_id = decode_cursor(cursor)
+            # (created_at, id) < (커서) 조건을 인덱스 범위 탐색이 가능한 형태로 표현
+            query = query.filter(
+                Post.created_at <= created_at,
+                or_(Post.created_at < created_at, Post.id < post_id)
+            )
+        else:
+            query = query.offset(skip)
 
-        return posts
+        return query.limit(limit).all()
 
     def get_post_by_id(self, post_id: int, increment_view: bool = True) -> Post | None:
         """ID로 게시글 조회 (조회수 증가)
 
+        조회수 증가는 view_counter 버퍼에 누적되어 주기적으로 일괄 반영되므로
+        조회 요청이 DB 쓰기 잠금을 잡지 않는다.
+
         Args:
             post_id (int): 게시글 ID
             increment_view (bool): 조회수 증가 여부 (기본값: True)
@@ -96,14 +317,183 @@ class PostController:
             .filter(Post.id == post_id)
             .first()
         )
-        if post and increment_view:
-            post.view_count += 1
-            with db_transaction(self.db):
-                pass
-            self.db.refresh(post)
+        if post:
+            if increment_view:
+                view_counter.increment(post.id)
+            view_counter.apply([post])
+
+        return post
+
+    def get_post_detail(
+        self,
+        post_id: int,
+        comment_limit: int,
+        increment_view: bool = True
+    ) -> Post | None:
+        """게시글 상세 조회 (앞쪽 댓글 comment_limit개만 포함, 조회수 증가)
+
+        Post.comments를 lazy load하면 댓글 전체를 한 번에 읽으므로, 인덱스를 타는
+        LIMIT 쿼리 한 번으로 앞쪽 댓글만 읽어 관계에 채워 넣는다. 나머지 댓글은
+        next_comments_cursor로 /posts/{post_id}/comments에서 이어서 조회한다.
+
+        Args:
+            post_id (int): 게시글 ID
+            comment_limit (int): 포함할 최대 댓글 수
+            increment_view (bool): 조회수 증가 여부 (기본값: True)
+
+        Returns:
+            Post | None: 게시글 정보 (comments, next_comments_cursor 포함) 또는 None
+        """
+        post = self.get_post_by_id(post_id, increment_view)
+        if not post:
+            return None
+
+        comments = []
+        if comment_limit > 0:
+            comments = CommentController(self.db).get_comments_by_post(post_id, 0, comment_limit)
+
+        # 변경으로 추적되지 않도록 set_committed_value 사용 (delete-orphan 방지)
+        set_committed_value(post, "comments", comments)
+        post.next_comments_cursor = (
+            next_cursor(comments, comment_limit)
+            if post.comment_count > len(comments)
+            else None
+        )
 
         return post
 
+    def search_posts(
+        self,
+        q: str,
+        limit: int = 10,
+        cursor: str | None = None
+    ) -> list[Post]:
+        """게시글 전문 검색 (제목, 내용, 댓글)
+
+        FTS5 색인(posts_fts, comments_fts)을 bm25로 정렬하고 (rank, id) 커서로 페이지를 나눈다.
+        trigram 토크나이저에서 3글자 미만 단어는 FTS 후보 행에만 LIKE로 확인하고, 모든 단어가
+        3글자 미만이면 최근 search_short_term_scan_rows개 게시글/댓글 안에서만 LIKE로 찾는다.
+
+        Args:
+            q (str): 검색어 (공백으로 구분된 단어는 모두 포함되어야 함)
+            limit (int): 최대 개수
+            cursor (str | None): 이전 페이지의 X-Next-Cursor
+
+        Returns:
+            list[Post]: 관련도순 게시글 (search_rank, snippet 속성 포함)
+
+        Raises:
+            InvalidDataException: 검색어가 비어 있거나 커서 형식이 잘못된 경우
+        """
+        terms = q.split()
+        if not terms:
+            raise InvalidDataException("검색어를 입력해주세요")
+
+        params = {"limit": limit}
+        cursor_filter = "1 = 1"
+        if cursor is not None:
+            params["cursor_rank"], params["cursor_id"] = decode_rank_cursor(cursor)
+            cursor_filter = "rank > :cursor_rank OR (rank = :cursor_rank AND post_id > :cursor_id)"
+
+        if "trigram" in settings.search_tokenizer:
+            fts_terms = [term for term in terms if len(term) >= 3]
+            like_terms = [term for term in terms if len(term) < 3]
+        else:
+            fts_terms, like_terms = terms, []
+
+        post_filter = []
+        comment_filter = []
+        for i, term in enumerate(like_terms):
+            params[f"term{i}"] = f"%{_escape_like(term)}%"
+            post_filter.append(
+                f"(posts.title LIKE :term{i} ESCAPE '\\' OR posts.content LIKE :term{i} ESCAPE '\\')"
+            )
+            comment_filter.append(f"comments.content LIKE :term{i} ESCAPE '\\'")
+
+        if fts_terms:
+            # 사용자 입력을 FTS5 문법으로 해석하지 않도록 단어마다 큰따옴표로 감쌈 (암묵적 AND)
+            params["query"] = " ".join('"' + term.replace('"', '""') + '"' for term in fts_terms)
+            sql = FTS_SEARCH_SQL.format(
+                post_join="JOIN posts ON posts.id = posts_fts.rowid" if post_filter else "",
+                post_filter="".join(f" AND {condition}" for condition in post_filter),
+                comment_filter="".join(f" AND {condition}" for condition in comment_filter),
+                cursor_filter=cursor_filter
+            )
+        else:
+            params["scan_rows"] = settings.search_short_term_scan_rows
+            sql = RECENT_LIKE_SEARCH_SQL.format(
+                post_filter=" AND ".join(post_filter),
+                comment_filter=" AND ".join(comment_filter),
+                cursor_filter=cursor_filter
+            )
+
+        hits = self.db.execute(text(sql), params).all()
+        if not hits:
+            return []
+
+        posts_by_id = {
+            post.id: post
+            for post in self.db.query(Post).filter(Post.id.in_([hit.post_id for hit in hits]))
+        }
+        post_snippets, comment_snippets = self._search_snippets(
+            hits, posts_by_id, params.get("query"), like_terms[0] if like_terms else None
+        )
+        results = []
+        for hit in hits:
+            post = posts_by_id.get(hit.post_id)
+            if post is None:
+                continue
+            post.search_rank = hit.rank
+            if hit.comment_id is None:
+                post.snippet = post_snippets.get(hit.post_id, "")
+            else:
+                post.snippet = comment_snippets.get(hit.comment_id, "")
+            results.append(post)
+
+        view_counter.apply(results)
+        return results
+
+    def _search_snippets(
+        self,
+        hits: list,
+        posts_by_id: dict,
+        fts_query: str | None,
+        like_term: str | None
+    ) -> tuple[dict[int, str], dict[int, str]]:
+        """검색 결과 페이지의 게시글/댓글 하이라이트 스니펫
+
+        FTS 검색이면 페이지에 들어간 행에 대해서만 snippet()을 계산하고,
+        LIKE 검색이면 첫 단어의 첫 일치 주변을 잘라 쓴다.
+
+        Returns:
+            tuple[dict[int, str], dict[int, str]]: 게시글 ID → 스니펫, 댓글 ID → 스니펫
+        """
+        post_ids = [hit.post_id for hit in hits if hit.comment_id is None]
+        comment_ids = [hit.comment_id for hit in hits if hit.comment_id is not None]
+
+        if fts_query is not None:
+            snippets = []
+            for sql, ids in ((FTS_POST_SNIPPET_SQL, post_ids), (FTS_COMMENT_SNIPPET_SQL, comment_ids)):
+                rows = []
+                if ids:
+                    statement = text(sql).bindparams(bindparam("ids", expanding=True))
+                    rows = self.db.execute(statement, {"query": fts_query, "ids": ids}).all()
+                snippets.append({row.id: row.snippet for row in rows})
+            return snippets[0], snippets[1]
+
+        post_snippets = {
+            post_id: _like_snippet(f"{posts_by_id[post_id].title} {posts_by_id[post_id].content}", like_term)
+            for post_id in post_ids if post_id in posts_by_id
+        }
+        comment_snippets = {}
+        if comment_ids:
+            comment_snippets = {
+                row.id: _like_snippet(row.content, like_term)
+                for row in self.db.query(Comment.id, Comment.content).filter(Comment.id.in_(comment_ids))
+            }
+        return post_snippets, comment_snippets
+
+    @write_operation
     def update_post(
         self,
         post_id: int,
@@ -142,9 +532,13 @@ class PostController:
         with db_transaction(self.db):
             pass
 
+        after_commit(self.db, lambda: post_list_cache.invalidate_posts([post_id]))
+
         self.db.refresh(post)
+        view_counter.apply([post])
         return post
 
+    @write_operation
     def delete_post(
         self,
         post_id: int,
@@ -173,4 +567,34 @@ class PostController:
         with db_transaction(self.db):
             self.db.delete(post)
 
-        return post
\ No newline at end of file
+        after_commit(self.db, post_list_cache.clear)
+
+        return post
+
+    @write_operation
+    def repair_comment_counts(self) -> int:
+        """비정규화된 comment_count를 실제 댓글 수와 일치시킴
+
+        Returns:
+            int: 값이 수정된 게시글 수
+        """
+        actual_count = (
+            select(func.count(Comment.id))
+            .where(Comment.post_id == Post.id)
+            .scalar_subquery()
+        )
+
+        with db_transaction(self.db):
+            repaired = (
+                self.db.query(Post)
+                .filter(Post.comment_count != actual_count)
+                .update(
+                    {Post.comment_count: actual_count},
+                    synchronize_session=False
+                )
+            )
+
+        if repaired:
+            after_commit(self.db, post_list_cache.clear)
+
+        return repaired
@@ -1,21 +1,38 @@
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from app.models.user_model import Users
-from app.schemas.user_schema import UserCreate, UserUpdate
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.models.post_like_model import PostLike
+from app.schemas.user_schema import User as UserSchema, UserCreate, UserUpdate
 from app.utils.security import hash_password
 from app.exceptions import AlreadyExistsException
-from app.utils.db_utils import db_transaction
+from app.utils.db_utils import db_transaction, after_commit
+from app.utils.response_cache import post_list_cache
+from app.utils.serialization import schema_columns, schema_fields
+from app.utils.identity_cache import identity_cache
+from app.utils.write_coordinator import write_operation
+
+# 목록 빠른 경로: 응답 스키마(User) 필드만 컬럼 튜플로 조회
+USER_LIST_FIELDS = schema_fields(UserSchema)
+USER_LIST_COLUMNS = schema_columns(Users, UserSchema)
 
 
 class UserController:
     def __init__(self, db: Session):
         self.db = db
 
-    def create_user(self, user_data: UserCreate) -> Users:
+    def create_user(
+        self,
+        user_data: UserCreate,
+        hashed_password: str | None = None
+    ) -> Users:
         """회원 생성
 
         Args:
             user_data (UserCreate): 생성할 회원 정보
+            hashed_password (str | None): 미리 해싱된 비밀번호 (없으면 여기서 해싱)
 
         Returns:
             Users: 생성된 회원 정보
@@ -31,10 +48,23 @@ class UserController:
         if existing_email:
             raise AlreadyExistsException("이미 사용중인 이메일입니다.")
 
+        existing_nickname = (
+            self.db.query(Users)
+            .filter(Users.nickname == user_data.nickname)
+            .first()
+        )
+        if existing_nickname:
+            raise AlreadyExistsException("이미 사용중인 닉네임입니다.")
+
+        # 해싱은 writer 밖(호출한 스레드)에서 끝내고 INSERT만 쓰기로 넘김
+        return self._insert_user(user_data, hashed_password or hash_password(user_data.password))
+
+    @write_operation
+    def _insert_user(self, user_data: UserCreate, hashed_password: str) -> Users:
         new_user = Users(
             email=user_data.email,
             nickname=user_data.nickname,
-            hashed_password=hash_password(user_data.password)
+            hashed_password=hashed_password
         )
 
         with db_transaction(self.db):
@@ -51,6 +81,16 @@ class UserController:
         """
         return self.db.query(Users).all()
 
+    def get_user_rows(self) -> list:
+        """모든 회원정보 조회 (목록 응답용 빠른 경로)
+
+        비밀번호 해시를 포함한 ORM 객체 대신 User 스키마 필드만 컬럼 튜플로 조회한다.
+
+        Returns:
+            list: USER_LIST_FIELDS 순서의 행 리스트 (dump_rows로 직렬화)
+        """
+        return self.db.query(*USER_LIST_COLUMNS).order_by(Users.id).all()
+
     def get_user_by_id(self, user_id: int) -> Users | None:
         """id로 회원정보 조회
 
@@ -60,12 +100,41 @@ class UserController:
         Returns:
             Users | None: 회원 정보 또는 None
         """
-        return (
+        user = (
             self.db.query(Users)
             .filter(Users.id == user_id)
             .first()
         )
+        if user:
+            identity_cache.remember(user.id, user.nickname)
+        return user
 
+    def user_exists(self, user_id: int, use_cache: bool = True) -> bool:
+        """회원 존재 여부 확인 (요청/프로세스 캐시 우선)
+
+        Args:
+            user_id (int): 회원 id
+            use_cache (bool): 캐시 사용 여부 (False면 항상 DB 확인)
+
+        Returns:
+            bool: 존재 여부
+        """
+        if use_cache and identity_cache.get(user_id) is not None:
+            return True
+
+        row = (
+            self.db.query(Users.id, Users.nickname)
+            .filter(Users.id == user_id)
+            .first()
+        )
+        if row is None:
+            identity_cache.forget(user_id)
+            return False
+
+        identity_cache.remember(row.id, row.nickname)
+        return True
+
+    @write_operation
     def update_user(
         self,
         user_id: int,
@@ -107,9 +176,12 @@ class UserController:
         with db_transaction(self.db):
             pass  # commit만 수행
 
+        after_commit(self.db, lambda: identity_cache.forget(user_id))
+
         self.db.refresh(user)
         return user
 
+    @write_operation
     def delete_user(self, user_id: int) -> Users | None:
         """회원정보 삭제
 
@@ -123,6 +195,46 @@ class UserController:
         
         if user:
             with db_transaction(self.db):
+                # CASCADE로 함께 삭제될 댓글만큼 다른 사람 게시글의 댓글 수 감소
+                removed_count = (
+                    select(func.count(Comment.id))
+                    .where(
+                        Comment.post_id == Post.id,
+                        Comment.author_id == user_id
+                    )
+                    .scalar_subquery()
+                )
+                (
+                    self.db.query(Post)
+                    .filter(
+                        Post.id.in_(
+                            select(Comment.post_id)
+                            .where(Comment.author_id == user_id)
+                        )
+                    )
+                    .update(
+                        {Post.comment_count: Post.comment_count - removed_count},
+                        synchronize_session=False
+                    )
+                )
+                # CASCADE로 함께 삭제될 좋아요만큼 좋아요 수 감소 (회원당 게시글마다 최대 1)
+                (
+                    self.db.query(Post)
+                    .filter(
+                        Post.id.in_(
+                            select(PostLike.post_id)
+                            .where(PostLike.user_id == user_id)
+                        )
+                    )
+                    .update(
+                        {Post.like_count: Post.like_count - 1},
+                        synchronize_session=False
+                    )
+                )
                 self.db.delete(user)
 
+            after_commit(self.db, lambda: identity_cache.forget(user_id))
+            # 작성한 게시글이 CASCADE로 삭제되고 다른 게시글의 댓글 수도 바뀜
+            after_commit(self.db, post_list_cache.clear)
+
         return user
@@ -1,21 +1,141 @@
-from sqlalchemy import create_engine, event
+import logging
+
+from sqlalchemy import create_engine, event, pool
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 
-SQLALCHEMY_DATABASE_URL = "sqlite:///./app.db"
+from app.config import settings
+from app.utils.metrics import CheckoutTimingPoolMixin
+
+logger = logging.getLogger(__name__)
+
+SQLALCHEMY_DATABASE_URL = settings.database_url
+READ_SQLALCHEMY_DATABASE_URL = settings.read_database_url
+
+
+class QueuePool(CheckoutTimingPoolMixin, pool.QueuePool):
+    """커넥션 체크아웃 시간/대기 수를 /metrics에 기록하는 QueuePool"""
+
+    # 로거를 sqlalchemy.pool 아래에 두어 LOG_LEVEL=INFO에서도 풀 dispose/recreate 로그가 나오지 않도록 함
+    _sqla_logger_namespace = "sqlalchemy.pool.impl.QueuePool"
+
+
+POOL_CLASSES = {
+    "queue": QueuePool,
+    "static": pool.StaticPool,
+    "null": pool.NullPool,
+    "singleton": pool.SingletonThreadPool,
+}
+
+
+def pool_options(pool_classes: dict = POOL_CLASSES) -> dict:
+    """설정(DB_POOL_*)에 따른 create_engine 풀 옵션
+
+    Args:
+        pool_classes (dict): 풀 이름 → 풀 클래스 매핑 (async 엔진은 별도 매핑 사용)
+
+    Returns:
+        dict: poolclass 및 크기 관련 키워드 인자
+    """
+    if settings.db_pool_class not in pool_classes:
+        raise ValueError(f"지원하지 않는 DB_POOL_CLASS: {settings.db_pool_class}")
+
+    options = {"poolclass": pool_classes[settings.db_pool_class]}
+    if settings.db_pool_class == "queue":
+        options.update(
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+        )
+    return options
+
+
+def apply_sqlite_pragmas(dbapi_conn, read_only: bool = False) -> None:
+    """새 SQLite 커넥션에 외래키 제약조건과 튜닝 PRAGMA 적용
+
+    Args:
+        dbapi_conn: DBAPI 커넥션
+        read_only (bool): 읽기 전용 풀의 커넥션 여부 (query_only=ON)
+    """
+    cursor = dbapi_conn.cursor()
+    # SQLite에서 외래키 제약조건 활성화
+    cursor.execute("PRAGMA foreign_keys=ON")
+    for name, value in settings.sqlite_pragmas(read_only).items():
+        cursor.execute(f"PRAGMA {name}={value}")
+    cursor.close()
+
+
+def apply_read_only_session(dbapi_conn) -> None:
+    """SQLite 이외(예: Postgres 복제본) 읽기 커넥션을 읽기 전용 트랜잭션으로 설정
+
+    Args:
+        dbapi_conn: DBAPI 커넥션
+    """
+    cursor = dbapi_conn.cursor()
+    cursor.execute("SET SESSION CHARACTERISTICS AS TRANSACTION READ ONLY")
+    cursor.close()
+
+
+def connect_args(url: str) -> dict:
+    """URL에 맞는 DBAPI connect 인자 (SQLite만 스레드 공유 허용)"""
+    return {"check_same_thread": False} if url.startswith("sqlite") else {}
+
+
+def log_sqlite_pragmas(target_engine, read_only: bool = False) -> dict[str, str]:
+    """실제로 적용된 PRAGMA 값을 조회해 로그로 남김
+
+    Args:
+        target_engine: 확인할 (동기) 엔진
+        read_only (bool): 읽기 전용 엔진 여부
+
+    Returns:
+        dict[str, str]: PRAGMA 이름과 현재 값
+    """
+    if target_engine.dialect.name != "sqlite":
+        return {}
+
+    effective = {}
+    with target_engine.connect() as conn:
+        for name in ("foreign_keys", "journal_mode", *settings.sqlite_pragmas(read_only)):
+            if name not in effective:
+                effective[name] = str(conn.exec_driver_sql(f"PRAGMA {name}").scalar())
+
+    logger.info(
+        "SQLite pragmas in effect (%s, pool=%s): %s",
+        target_engine.url.render_as_string(hide_password=True),
+        target_engine.pool.status(),
+        ", ".join(f"{name}={value}" for name, value in effective.items())
+    )
+    return effective
+
 
 engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    SQLALCHEMY_DATABASE_URL,
+    connect_args=connect_args(SQLALCHEMY_DATABASE_URL),
+    **pool_options()
+)
+
+# 읽기 전용 풀: 쓰기 커넥션과 경합하지 않고, 다른 파일/복제본으로 분리 가능
+read_engine = create_engine(
+    READ_SQLALCHEMY_DATABASE_URL,
+    connect_args=connect_args(READ_SQLALCHEMY_DATABASE_URL),
+    **pool_options()
 )
 
-# SQLite에서 외래키 제약조건 활성화
 @event.listens_for(engine, "connect")
 def set_sqlite_pragma(dbapi_conn, connection_record):
-    cursor = dbapi_conn.cursor()
-    cursor.execute("PRAGMA foreign_keys=ON")
-    cursor.close()
+    if engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(dbapi_conn)
+
+@event.listens_for(read_engine, "connect")
+def set_read_only_pragma(dbapi_conn, connection_record):
+    if read_engine.dialect.name == "sqlite":
+        apply_sqlite_pragmas(dbapi_conn, read_only=True)
+    else:
+        apply_read_only_session(dbapi_conn)
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
 Base = declarative_base()
 
 def get_db():
@@ -23,4 +143,15 @@ def get_db():
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+# 쓰기(및 읽고 나서 쓰는) 요청용 세션
+get_write_db = get_db
+
+def get_read_db():
+    """읽기 전용 요청용 세션 (read_engine 풀 사용)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1,4 +1,6 @@
-from fastapi import status
+# fastapi.status와 같은 상수 (fastapi 패키지 전체를 import하지 않도록 starlette에서 직접 가져옴,
+# 해싱 워커 프로세스는 app.utils.security → app.exceptions만 import함)
+from starlette import status
 
 
 class AppException(Exception):
@@ -42,8 +44,22 @@ class InvalidDataException(AppException):
         super().__init__(message, status_code=status.HTTP_400_BAD_REQUEST)
 
 
+class BulkValidationException(AppException):
+    """일괄 요청의 모든 항목이 검증에 실패했을 때 (응답 본문의 errors에 항목별 사유를 담음)"""
+    def __init__(self, errors: list[dict], message: str = "모든 항목이 검증에 실패했습니다"):
+        self.errors = errors
+        super().__init__(message, status_code=status.HTTP_422_UNPROCESSABLE_ENTITY)
+
+
 # 데이터베이스 관련
 class DatabaseException(AppException):
     """데이터베이스 오류"""
     def __init__(self, message: str = "데이터베이스 오류가 발생했습니다"):
         super().__init__(message, status_code=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+# 서버 상태 관련
+class ServiceUnavailableException(AppException):
+    """서버가 일시적으로 요청을 처리할 수 없을 때 (과부하 등)"""
+    def __init__(self, message: str = "잠시 후 다시 시도해주세요"):
+        super().__init__(message, status_code=status.HTTP_503_SERVICE_UNAVAILABLE)
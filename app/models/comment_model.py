@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, Text, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,10 +7,21 @@ from app.database import Base
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # 게시글별 댓글 목록 (post_id = ? ORDER BY created_at, id) 용 복합 인덱스
+        Index("ix_comments_post_id_created_at", "post_id", "created_at", "id"),
+        # 기간 지정 내보내기 (created_at 범위 ORDER BY created_at, id) 용 복합 인덱스
+        Index("ix_comments_created_at_id", "created_at", "id"),
+        # 작성자별 내보내기 (author_id = ? ORDER BY created_at, id) 용 복합 인덱스
+        # (회원 탈퇴 CASCADE 삭제, 댓글 수 보정의 author_id 조회도 앞부분으로 처리)
+        Index("ix_comments_author_id_created_at", "author_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     content = Column(Text, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now().replace(microsecond=0), nullable=False)
+    # 최종 수정 시각 (ETag/Last-Modified 용)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     # 외래키: 게시글
     post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), nullable=False)
     # 외래키: 작성자
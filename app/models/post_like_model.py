@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, DateTime, ForeignKey, Index
+from datetime import datetime
+
+from app.database import Base
+
+
+class PostLike(Base):
+    """게시글 좋아요 (회원당 게시글 하나에 한 번, 복합 PK로 중복 방지)"""
+    __tablename__ = "post_likes"
+    __table_args__ = (
+        # 게시글 삭제 시 CASCADE, 게시글별 좋아요 수 보정 용
+        Index("ix_post_likes_post_id", "post_id"),
+    )
+
+    # 외래키: 회원 (PK 선두 컬럼이므로 회원 탈퇴 CASCADE에도 인덱스가 쓰임)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    # 외래키: 게시글
+    post_id = Column(Integer, ForeignKey("posts.id", ondelete="CASCADE"), primary_key=True)
+    created_at = Column(DateTime, default=lambda: datetime.now().replace(microsecond=0), nullable=False)
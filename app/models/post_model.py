@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from datetime import datetime
 
@@ -7,14 +7,25 @@ from app.database import Base
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 커서 페이지네이션 (created_at DESC, id DESC) 용 복합 인덱스
+        Index("ix_posts_created_at_id", "created_at", "id"),
+        # 작성자별 내보내기 (author_id = ? ORDER BY created_at, id) 용 복합 인덱스
+        # (author_id 단독 조회인 회원 탈퇴 CASCADE 삭제도 앞부분으로 처리)
+        Index("ix_posts_author_id_created_at", "author_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     title = Column(String(100), nullable=False)
     content = Column(Text, nullable=False)
     image_url = Column(String(500), nullable=True)
     created_at = Column(DateTime, default=lambda: datetime.now().replace(microsecond=0), nullable=False)
+    # 최종 수정 시각 (ETag/Last-Modified 용, 조회수 반영은 제외)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     view_count = Column(Integer, default=0, nullable=False)
     like_count = Column(Integer, default=0, nullable=False)
+    # 비정규화된 댓글 수 (댓글 작성/삭제 트랜잭션에서 함께 갱신)
+    comment_count = Column(Integer, default=0, nullable=False)
     # 외래키: 작성자
     author_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     # 관계: 댓글들
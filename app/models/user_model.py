@@ -1,5 +1,6 @@
-from sqlalchemy import Column, Integer, String
+from sqlalchemy import Column, Integer, String, DateTime
 from sqlalchemy.orm import relationship
+from datetime import datetime
 
 from app.database import Base
 
@@ -8,8 +9,10 @@ class Users(Base):
 
     id = Column(Integer, primary_key=True, index=True, autoincrement=True)
     email = Column(String, unique=True, index=True, nullable=False)
-    nickname = Column(String, index=True, nullable=False)
+    nickname = Column(String, unique=True, index=True, nullable=False)
     hashed_password = Column(String, nullable=False)
+    # 최종 수정 시각 (ETag/Last-Modified 용)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now, nullable=False)
     # 관계: 게시글들과 댓글들 (passive_deletes로 DB CASCADE에 맡김)
     posts = relationship("Post", back_populates="author", passive_deletes=True)
     comments = relationship("Comment", back_populates="author", passive_deletes=True)
\ No newline at end of file
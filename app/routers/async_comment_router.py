@@ -0,0 +1,141 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Header, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.async_database import get_async_read_db, get_async_write_db
+from app.schemas.comment_schema import Comment, CommentUpdate
+from app.controllers.async_controller import AsyncCommentController
+from app.utils.conditional import make_etag, check_not_modified
+from app.utils.profiling import ProfiledRoute
+
+router = APIRouter(
+    prefix="/comments",
+    tags=["comments"],
+    route_class=ProfiledRoute
+)
+
+@router.get(
+    "/{comment_id}",
+    response_model=Comment,
+    description="특정 댓글 조회 (ETag/Last-Modified 조건부 요청 지원)"
+)
+async def get_comment(
+    request: Request,
+    response: Response,
+    comment_id: int = Path(..., description="조회할 댓글 ID"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    """댓글 조회
+
+    Args:
+        request (Request): 조건부 요청 헤더 확인용 요청 객체
+        response (Response): ETag/Last-Modified 헤더 설정용 응답 객체
+        comment_id (int): 댓글 ID
+        db (AsyncSession): 비동기 데이터베이스 세션
+
+    Returns:
+        Comment: 댓글 정보, 변경이 없으면 304
+
+    Raises:
+        HTTPException: 댓글이 존재하지 않을 경우
+    """
+    controller = AsyncCommentController(db)
+    comment = await controller.get_comment_by_id(comment_id)
+    if not comment:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="댓글을 찾을 수 없습니다"
+        )
+
+    etag = make_etag("comment", comment.id, comment.updated_at)
+    not_modified = check_not_modified(request, response, etag, comment.updated_at)
+    if not_modified:
+        return not_modified
+    return comment
+
+
+@router.put(
+    "/{comment_id}",
+    response_model=Comment,
+    description="댓글 수정 (작성자만 가능)"
+)
+async def update_comment(
+    comment_id: int = Path(..., description="수정할 댓글 ID"),
+    comment_data: CommentUpdate = Body(...),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="작성자 ID (권한 확인용)"
+    ),
+    db: AsyncSession = Depends(get_async_write_db)
+):
+    """댓글 수정
+
+    Args:
+        comment_id (int): 댓글 ID
+        comment_data (CommentUpdate): 수정할 댓글 정보
+        x_user_id (int): 헤더로 전달된 작성자 ID (권한 확인용)
+        db (AsyncSession): 비동기 데이터베이스 세션
+
+    Returns:
+        Comment: 수정된 댓글
+
+    Raises:
+        HTTPException: 댓글이 존재하지 않거나 권한이 없을 경우
+    """
+    try:
+        controller = AsyncCommentController(db)
+        comment = await controller.update_comment(
+            comment_id,
+            comment_data,
+            x_user_id
+        )
+        if not comment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="댓글을 찾을 수 없습니다"
+            )
+        return comment
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
+
+
+@router.delete(
+    "/{comment_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    description="댓글 삭제 (작성자만 가능)"
+)
+async def delete_comment(
+    comment_id: int = Path(..., description="삭제할 댓글 ID"),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="작성자 ID (권한 확인용)"
+    ),
+    db: AsyncSession = Depends(get_async_write_db)
+):
+    """댓글 삭제
+
+    Args:
+        comment_id (int): 댓글 ID
+        x_user_id (int): 헤더로 전달된 작성자 ID (권한 확인용)
+        db (AsyncSession): 비동기 데이터베이스 세션
+
+    Raises:
+        HTTPException: 댓글이 존재하지 않거나 권한이 없을 경우
+    """
+    try:
+        controller = AsyncCommentController(db)
+        comment = await controller.delete_comment(comment_id, x_user_id)
+        if not comment:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="댓글을 찾을 수 없습니다"
+            )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail=str(e)
+        )
@@ -0,0 +1,135 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Header, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.async_database import get_async_read_db, get_async_write_db
+from app.schemas.user_schema import UserCreate, UserUpdate, User
+from app.controllers.async_controller import AsyncUserController
+from app.controllers.user_controller import USER_LIST_FIELDS
+from app.utils.conditional import make_etag, check_not_modified
+from app.utils.serialization import dump_rows, json_response
+from app.utils.profiling import ProfiledRoute
+
+router = APIRouter(
+    prefix="/api/users",
+    tags=["users"],
+    route_class=ProfiledRoute
+)
+
+@router.post(
+    "/",
+    response_model=User,
+    status_code=status.HTTP_201_CREATED,
+    description="새로운 사용자 생성"
+)
+async def create_user(user: UserCreate, db: AsyncSession = Depends(get_async_write_db)):
+    try:
+        controller = AsyncUserController(db)
+        return await controller.create_user(user)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.get(
+    "/",
+    response_model=list[User],
+    status_code=status.HTTP_200_OK,
+    description="모든 사용자 목록 조회 (컬럼 튜플을 바로 직렬화)"
+)
+async def get_users(db: AsyncSession = Depends(get_async_read_db)):
+    controller = AsyncUserController(db)
+    rows = await controller.get_user_rows()
+    return json_response(dump_rows(rows, USER_LIST_FIELDS))
+
+@router.get(
+    "/{user_id}",
+    response_model=User,
+    status_code=status.HTTP_200_OK,
+    description="특정 사용자 조회 (ETag/Last-Modified 조건부 요청 지원)"
+)
+async def get_user(
+    request: Request,
+    response: Response,
+    user_id: int = Path(..., description="조회할 사용자 ID"),
+    db: AsyncSession = Depends(get_async_read_db)
+):
+    controller = AsyncUserController(db)
+    user = await controller.get_user_by_id(user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다"
+        )
+
+    etag = make_etag("user", user.id, user.updated_at)
+    not_modified = check_not_modified(request, response, etag, user.updated_at)
+    if not_modified:
+        return not_modified
+    return user
+
+@router.put(
+    "/{user_id}",
+    response_model=User,
+    status_code=status.HTTP_200_OK,
+    description="사용자 정보 수정 (본인만 가능)"
+)
+async def update_user(
+    user_id: int = Path(..., description="수정할 사용자 ID"),
+    user: UserUpdate = Body(...),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="요청자 ID (권한 확인용)"
+    ),
+    db: AsyncSession = Depends(get_async_write_db)
+):
+    if user_id != x_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="본인만 수정할 수 있습니다"
+        )
+
+    try:
+        controller = AsyncUserController(db)
+        result = await controller.update_user(user_id, user)
+        if result is None:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="사용자를 찾을 수 없습니다"
+            )
+        return result
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+@router.delete(
+    "/{user_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    description="사용자 삭제 (본인만 가능)"
+)
+async def delete_user(
+    user_id: int = Path(..., description="삭제할 사용자 ID"),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="요청자 ID (권한 확인용)"
+    ),
+    db: AsyncSession = Depends(get_async_write_db)
+):
+    if user_id != x_user_id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="본인만 삭제할 수 있습니다"
+        )
+
+    controller = AsyncUserController(db)
+    user = await controller.delete_user(user_id)
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다"
+        )
+    return None
@@ -2,14 +2,16 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_write_db
 from app.schemas.auth_schema import LoginResponse
 from app.controllers.auth_controller import AuthController
 from app.exceptions import UnauthorizedException
+from app.utils.profiling import ProfiledRoute
 
 router = APIRouter(
     prefix="/auth",
-    tags=["auth"]
+    tags=["auth"],
+    route_class=ProfiledRoute
 )
 
 
@@ -20,7 +22,7 @@ router = APIRouter(
 )
 def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """로그인 (OAuth2 표준)
 
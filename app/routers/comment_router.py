@@ -1,32 +1,39 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Header, Request, Response
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db, get_write_db
 from app.schemas.comment_schema import Comment, CommentUpdate
 from app.controllers.comment_controller import CommentController
+from app.utils.conditional import make_etag, check_not_modified
+from app.utils.profiling import ProfiledRoute
 
 router = APIRouter(
     prefix="/comments",
-    tags=["comments"]
+    tags=["comments"],
+    route_class=ProfiledRoute
 )
 
 @router.get(
     "/{comment_id}",
     response_model=Comment,
-    description="특정 댓글 조회"
+    description="특정 댓글 조회 (ETag/Last-Modified 조건부 요청 지원)"
 )
 def get_comment(
+    request: Request,
+    response: Response,
     comment_id: int = Path(..., description="조회할 댓글 ID"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """댓글 조회
 
     Args:
+        request (Request): 조건부 요청 헤더 확인용 요청 객체
+        response (Response): ETag/Last-Modified 헤더 설정용 응답 객체
         comment_id (int): 댓글 ID
         db (Session): 데이터베이스 세션
 
     Returns:
-        Comment: 댓글 정보
+        Comment: 댓글 정보, 변경이 없으면 304
 
     Raises:
         HTTPException: 댓글이 존재하지 않을 경우
@@ -38,6 +45,11 @@ def get_comment(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="댓글을 찾을 수 없습니다"
         )
+
+    etag = make_etag("comment", comment.id, comment.updated_at)
+    not_modified = check_not_modified(request, response, etag, comment.updated_at)
+    if not_modified:
+        return not_modified
     return comment
 
 
@@ -54,7 +66,7 @@ def update_comment(
         alias="X-User-ID",
         description="작성자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """댓글 수정
 
@@ -102,7 +114,7 @@ def delete_comment(
         alias="X-User-ID",
         description="작성자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """댓글 삭제
 
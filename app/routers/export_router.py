@@ -0,0 +1,88 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Select
+
+from app.database import ReadSessionLocal
+from app.controllers.export_controller import ExportController
+from app.utils.profiling import ProfiledRoute
+
+router = APIRouter(
+    prefix="/export",
+    tags=["export"],
+    route_class=ProfiledRoute
+)
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def _stream(statement: Select):
+    """요청 의존성 세션과 별개로, 응답 전송이 끝날 때까지 유지되는 읽기 세션으로 스트리밍"""
+    with ReadSessionLocal() as db:
+        yield from ExportController(db).stream(statement)
+
+
+@router.get(
+    "/posts.ndjson",
+    response_class=StreamingResponse,
+    description="게시글 전체를 NDJSON으로 스트리밍 내보내기 (created_at 범위, 작성자 필터)"
+)
+def export_posts(
+    created_from: datetime | None = Query(None, description="이 시각 이후(포함) 작성된 게시글만"),
+    created_to: datetime | None = Query(None, description="이 시각 이전(미포함) 작성된 게시글만"),
+    author_id: int | None = Query(None, gt=0, description="작성자 ID")
+):
+    """게시글 내보내기
+
+    Args:
+        created_from (datetime | None): 기간 시작 (증분 내보내기 시 이전 내보내기의 created_to)
+        created_to (datetime | None): 기간 끝
+        author_id (int | None): 작성자 ID
+
+    Returns:
+        StreamingResponse: 한 줄에 게시글 하나씩 담긴 application/x-ndjson 응답
+    """
+    # 잘못된 기간은 스트리밍을 시작하기 전에 400으로 응답
+    statement = ExportController.posts_statement(created_from, created_to, author_id)
+    return StreamingResponse(_stream(statement), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/comments.ndjson",
+    response_class=StreamingResponse,
+    description="댓글 전체를 NDJSON으로 스트리밍 내보내기 (created_at 범위, 작성자 필터)"
+)
+def export_comments(
+    created_from: datetime | None = Query(None, description="이 시각 이후(포함) 작성된 댓글만"),
+    created_to: datetime | None = Query(None, description="이 시각 이전(미포함) 작성된 댓글만"),
+    author_id: int | None = Query(None, gt=0, description="작성자 ID")
+):
+    """댓글 내보내기
+
+    Args:
+        created_from (datetime | None): 기간 시작 (증분 내보내기 시 이전 내보내기의 created_to)
+        created_to (datetime | None): 기간 끝
+        author_id (int | None): 작성자 ID
+
+    Returns:
+        StreamingResponse: 한 줄에 댓글 하나씩 담긴 application/x-ndjson 응답
+    """
+    # 잘못된 기간은 스트리밍을 시작하기 전에 400으로 응답
+    statement = ExportController.comments_statement(created_from, created_to, author_id)
+    return StreamingResponse(_stream(statement), media_type=NDJSON_MEDIA_TYPE)
+
+
+@router.get(
+    "/users.ndjson",
+    response_class=StreamingResponse,
+    description="회원 전체를 NDJSON으로 스트리밍 내보내기 (비밀번호 해시 제외)"
+)
+def export_users():
+    """회원 내보내기
+
+    Returns:
+        StreamingResponse: 한 줄에 회원 하나씩 담긴 application/x-ndjson 응답
+    """
+    statement = ExportController.users_statement()
+    return StreamingResponse(_stream(statement), media_type=NDJSON_MEDIA_TYPE)
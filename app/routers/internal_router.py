@@ -0,0 +1,100 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import PlainTextResponse
+
+from app.config import settings
+from app.exceptions import ForbiddenException, NotFoundException
+
+from app.utils.security import hash_pool, HASH_PARAMS
+from app.utils.response_cache import post_list_cache
+from app.utils.write_coordinator import write_coordinator
+from app.utils.profiling import ProfiledRoute, list_profiles, profile_path
+
+
+def require_internal_secret(
+    x_internal_secret: str | None = Header(default=None, description="INTERNAL_SECRET 값")
+) -> None:
+    """X-Internal-Secret 헤더 확인 (/internal/* 공통 의존성)
+
+    Raises:
+        ForbiddenException: INTERNAL_SECRET이 비어 있거나 헤더 값이 다른 경우
+    """
+    secret = settings.internal_secret
+    if not secret or not hmac.compare_digest((x_internal_secret or "").encode(), secret.encode()):
+        raise ForbiddenException("운영 지표 조회 권한이 없습니다")
+
+
+# 해싱 파라미터, 큐 깊이, 캐시/쓰기 내부 상태, 호출 스택을 노출하므로 INTERNAL_SECRET 헤더를 요구
+# (main.py는 INTERNAL_SECRET이 설정된 경우에만 등록)
+router = APIRouter(
+    prefix="/internal",
+    tags=["internal"],
+    route_class=ProfiledRoute,
+    dependencies=[Depends(require_internal_secret)]
+)
+
+
+@router.get(
+    "/stats",
+    description="운영 지표 조회 (비밀번호 해싱 풀 큐 깊이, 게시글 목록 캐시 hit/miss, 쓰기 묶음 commit 등)"
+)
+async def get_stats():
+    """운영 지표 조회
+
+    Returns:
+        dict: 비밀번호 해싱 풀 상태와 적용 중인 Argon2 파라미터, 게시글 목록 캐시 상태,
+            쓰기 코디네이터(group commit) 상태
+    """
+    time_cost, memory_cost, parallelism = HASH_PARAMS
+    return {
+        "password_hasher": {
+            **hash_pool.stats(),
+            "time_cost": time_cost,
+            "memory_cost": memory_cost,
+            "parallelism": parallelism,
+        },
+        "post_list_cache": post_list_cache.stats(),
+        "write_coordinator": write_coordinator.stats(),
+    }
+
+
+@router.get(
+    "/profiles",
+    description="저장된 요청 프로파일 목록 (최신순)"
+)
+async def get_profiles(
+    limit: int = Query(100, ge=1, le=1000, description="최대 개수")
+):
+    """저장된 요청 프로파일 목록
+
+    Args:
+        limit (int): 최대 개수
+
+    Returns:
+        list[dict]: 파일 이름, 크기, 샘플 수, 생성 시각
+    """
+    return list_profiles(limit)
+
+
+@router.get(
+    "/profiles/{name}",
+    response_class=PlainTextResponse,
+    description="요청 프로파일 다운로드 (collapsed stack 형식, flamegraph.pl / speedscope로 시각화)"
+)
+async def get_profile(name: str):
+    """요청 프로파일 다운로드
+
+    Args:
+        name (str): 프로파일 파일 이름 (응답 헤더 X-Profile 또는 목록의 name)
+
+    Returns:
+        PlainTextResponse: collapsed stack 본문
+
+    Raises:
+        NotFoundException: 프로파일이 없는 경우
+    """
+    path = profile_path(name)
+    if path is None:
+        raise NotFoundException("프로파일을 찾을 수 없습니다")
+    return PlainTextResponse(path.read_text(encoding="utf-8"))
@@ -0,0 +1,23 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.utils.metrics import metrics
+from app.utils.profiling import ProfiledRoute
+
+router = APIRouter(tags=["internal"], route_class=ProfiledRoute)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get(
+    "/metrics",
+    response_class=PlainTextResponse,
+    description="Prometheus 지표 (라우트별 요청 수/지연 시간 히스토그램, 진행 중 요청, 커넥션 풀, 스레드풀)"
+)
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표
+
+    Returns:
+        PlainTextResponse: 지표 본문 (text/plain; version=0.0.4)
+    """
+    return PlainTextResponse(metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
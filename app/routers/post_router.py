@@ -1,15 +1,26 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Header
+from typing import Any
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Path, Body, Header, Request, Response
 from sqlalchemy.orm import Session
 
-from app.database import get_db
-from app.schemas.post_schema import Post, PostCreate, PostUpdate, PostDetail
+from app.database import get_read_db, get_write_db
+from app.schemas.post_schema import Post, PostCreate, PostUpdate, PostDetail, PostSearchResult, PostLikeStatus
 from app.schemas.comment_schema import Comment, CommentCreate
+from app.schemas.bulk_schema import PostBulkResult, CommentBulkResult
 from app.controllers.post_controller import PostController
-from app.controllers.comment_controller import CommentController
+from app.controllers.comment_controller import CommentController, COMMENT_LIST_FIELDS
+from app.controllers.like_controller import LikeController
+from app.config import settings
+from app.utils.pagination import next_cursor, next_rank_cursor
+from app.utils.conditional import make_etag, row_versions, latest, check_not_modified
+from app.utils.response_cache import post_list_cache, serialize_post_page, cached_response
+from app.utils.serialization import dump_rows, json_response
+from app.utils.profiling import ProfiledRoute
 
 router = APIRouter(
     prefix="/posts",
-    tags=["posts"]
+    tags=["posts"],
+    route_class=ProfiledRoute
 )
 
 
@@ -26,7 +37,7 @@ def create_post(
         alias="X-User-ID",
         description="작성자 ID"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """게시글 생성
 
@@ -42,58 +53,155 @@ def create_post(
     return controller.create_post(post_data, x_user_id)
 
 
+@router.post(
+    "/bulk",
+    response_model=PostBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    description="게시글 일괄 작성 (항목별 검증, 실패 항목은 errors로 반환하고 나머지는 한 트랜잭션으로 저장, 모든 항목이 실패하면 422)"
+)
+def bulk_create_posts(
+    items: list[Any] = Body(
+        ...,
+        min_length=1,
+        max_length=settings.bulk_max_items,
+        description="PostCreate 형식 항목 배열"
+    ),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="작성자 ID"
+    ),
+    db: Session = Depends(get_write_db)
+):
+    """게시글 일괄 생성
+
+    Args:
+        items (list[Any]): 생성할 게시글 정보 배열
+        x_user_id (int): 헤더로 전달된 작성자 ID
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        PostBulkResult: 생성된 게시글(요청 순서)과 항목별 오류 (index는 요청 배열 위치)
+    """
+    controller = PostController(db)
+    return controller.bulk_create_posts(items, x_user_id)
+
+
 @router.get(
     "/",
     response_model=list[Post],
-    description="게시글 목록 조회 (댓글 개수 포함)"
+    description="게시글 목록 조회 (댓글 개수 포함, 다음 페이지 커서는 X-Next-Cursor 헤더, 캐시 여부는 X-Cache 헤더)"
 )
 def get_posts(
-    skip: int = Query(0, ge=0, description="건너뛸 개수"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (offset 모드)"),
     limit: int = Query(10, ge=1, le=100, description="최대 조회 개수"),
-    db: Session = Depends(get_db)
+    cursor: str | None = Query(None, description="다음 페이지 커서 (cursor 모드, 지정 시 skip 무시)"),
+    db: Session = Depends(get_read_db)
 ):
     """모든 게시글 조회
 
+    직렬화된 페이지를 post_list_cache에 보관하고, 게시글/댓글 쓰기 시 컨트롤러에서 무효화한다.
+
     Args:
         skip (int): 건너뛸 개수
         limit (int): 최대 개수
+        cursor (str | None): 이전 응답의 X-Next-Cursor 값
         db (Session): 데이터베이스 세션
 
     Returns:
-        list[Post]: 게시글 리스트
+        Response: 게시글 리스트 JSON (X-Next-Cursor, X-Cache 헤더 포함)
+    """
+    # cursor 모드에서는 skip을 무시하므로 키에서도 제외
+    key = (0 if cursor else skip, limit, cursor)
+
+    def load_page():
+        rows = PostController(db).get_post_rows(skip, limit, cursor)
+        return serialize_post_page(rows, limit)
+
+    cached, hit = post_list_cache.get_or_compute(key, load_page)
+    return cached_response(cached, hit)
+
+
+# /{post_id}보다 먼저 등록해야 "search"가 게시글 ID로 해석되지 않음
+@router.get(
+    "/search",
+    response_model=list[PostSearchResult],
+    description="게시글 전문 검색 (제목, 내용, 댓글, 관련도순, 다음 페이지 커서는 X-Next-Cursor 헤더)"
+)
+def search_posts(
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=100, description="검색어 (공백으로 구분된 단어는 모두 포함)"),
+    limit: int = Query(10, ge=1, le=50, description="최대 조회 개수"),
+    cursor: str | None = Query(None, description="다음 페이지 커서"),
+    db: Session = Depends(get_read_db)
+):
+    """게시글 전문 검색
+
+    Args:
+        response (Response): X-Next-Cursor 헤더 설정용 응답 객체
+        q (str): 검색어
+        limit (int): 최대 개수
+        cursor (str | None): 이전 응답의 X-Next-Cursor 값
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        list[PostSearchResult]: 관련도순 게시글 (하이라이트 스니펫 포함)
     """
     controller = PostController(db)
-    return controller.get_posts(skip, limit)
+    posts = controller.search_posts(q, limit, cursor)
+    cursor_value = next_rank_cursor(posts, limit)
+    if cursor_value:
+        response.headers["X-Next-Cursor"] = cursor_value
+    return posts
 
 
 @router.get(
     "/{post_id}",
     response_model=PostDetail,
-    description="게시글 상세 조회 (댓글 포함, 조회수 증가)"
+    description="게시글 상세 조회 (앞쪽 댓글 일부 포함, 조회수 증가, ETag/Last-Modified 조건부 요청 지원)"
 )
 def get_post(
+    request: Request,
+    response: Response,
     post_id: int = Path(..., description="조회할 게시글 ID"),
-    db: Session = Depends(get_db)
+    comment_limit: int = Query(
+        settings.post_detail_comment_limit,
+        ge=0,
+        le=100,
+        description="포함할 최대 댓글 수 (나머지는 next_comments_cursor로 조회)"
+    ),
+    db: Session = Depends(get_read_db)
 ):
-    """게시글 상세 조회 (댓글 포함, 조회수 증가)
+    """게시글 상세 조회 (앞쪽 댓글 일부 포함, 조회수 증가)
 
     Args:
+        request (Request): 조건부 요청 헤더 확인용 요청 객체
+        response (Response): ETag/Last-Modified 헤더 설정용 응답 객체
         post_id (int): 게시글 ID
+        comment_limit (int): 포함할 최대 댓글 수
         db (Session): 데이터베이스 세션
 
     Returns:
-        PostDetail: 게시글 상세 정보 (댓글 포함)
+        PostDetail: 게시글 상세 정보 (댓글 일부, 댓글 수, 다음 댓글 커서 포함), 변경이 없으면 304
 
     Raises:
         HTTPException: 게시글이 존재하지 않을 경우
     """
     controller = PostController(db)
-    post = controller.get_post_by_id(post_id)
+    post = controller.get_post_detail(post_id, comment_limit)
     if not post:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="게시글을 찾을 수 없습니다"
         )
+
+    # 조회수는 매 요청마다 바뀌므로 ETag에서 제외하고, 그만큼 표현이 달라도 같은 값이므로 weak ETag
+    # (304 응답의 view_count는 이전 값 유지)
+    etag = make_etag("post", post.id, post.updated_at, comment_limit, row_versions(post.comments), weak=True)
+    last_modified = latest(post.updated_at, *(comment.updated_at for comment in post.comments))
+    not_modified = check_not_modified(request, response, etag, last_modified)
+    if not_modified:
+        return not_modified
     return post
 
 
@@ -110,7 +218,7 @@ def update_post(
         alias="X-User-ID",
         description="작성자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """게시글 수정
 
@@ -158,7 +266,7 @@ def delete_post(
         alias="X-User-ID",
         description="작성자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """게시글 삭제
 
@@ -185,30 +293,104 @@ def delete_post(
         )
 
 
+@router.post(
+    "/{post_id}/like",
+    response_model=PostLikeStatus,
+    description="게시글 좋아요 (이미 좋아요한 경우에도 200, 좋아요 수는 원자적으로 증가)"
+)
+def like_post(
+    post_id: int = Path(..., gt=0, description="게시글 ID"),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="회원 ID"
+    ),
+    db: Session = Depends(get_write_db)
+):
+    """게시글 좋아요
+
+    Args:
+        post_id (int): 게시글 ID
+        x_user_id (int): 헤더로 전달된 회원 ID
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        PostLikeStatus: 좋아요 여부와 현재 좋아요 수
+    """
+    controller = LikeController(db)
+    return controller.like_post(post_id, x_user_id)
+
+
+@router.delete(
+    "/{post_id}/like",
+    response_model=PostLikeStatus,
+    description="게시글 좋아요 취소 (좋아요하지 않은 경우에도 200)"
+)
+def unlike_post(
+    post_id: int = Path(..., gt=0, description="게시글 ID"),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="회원 ID"
+    ),
+    db: Session = Depends(get_write_db)
+):
+    """게시글 좋아요 취소
+
+    Args:
+        post_id (int): 게시글 ID
+        x_user_id (int): 헤더로 전달된 회원 ID
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        PostLikeStatus: 좋아요 여부와 현재 좋아요 수
+    """
+    controller = LikeController(db)
+    return controller.unlike_post(post_id, x_user_id)
+
 @router.get(
     "/{post_id}/comments",
     response_model=list[Comment],
-    description="특정 게시글의 댓글 목록 조회"
+    description="특정 게시글의 댓글 목록 조회 (다음 페이지 커서는 X-Next-Cursor 헤더, ETag 조건부 요청 지원)"
 )
 def get_post_comments(
+    request: Request,
+    response: Response,
     post_id: int = Path(..., gt=0, description="게시글 ID"),
-    skip: int = Query(0, ge=0, description="건너뛸 개수"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (offset 모드)"),
     limit: int = Query(10, ge=1, le=100, description="최대 조회 개수"),
-    db: Session = Depends(get_db)
+    cursor: str | None = Query(None, description="다음 페이지 커서 (cursor 모드, 지정 시 skip 무시)"),
+    db: Session = Depends(get_read_db)
 ):
     """게시글의 모든 댓글 조회
 
     Args:
+        request (Request): 조건부 요청 헤더 확인용 요청 객체
+        response (Response): X-Next-Cursor, ETag 헤더 설정용 응답 객체
         post_id (int): 게시글 ID
         skip (int): 건너뛸 개수
         limit (int): 최대 개수
+        cursor (str | None): 이전 응답의 X-Next-Cursor 또는 상세 조회의 next_comments_cursor
         db (Session): 데이터베이스 세션
 
     Returns:
-        list[Comment]: 댓글 리스트
+        Response: 댓글 리스트 JSON (컬럼 튜플을 바로 직렬화), 변경이 없으면 304
     """
     controller = CommentController(db)
-    return controller.get_comments_by_post(post_id, skip, limit)
+    comments = controller.get_comment_rows_by_post(post_id, skip, limit, cursor)
+
+    # 페이지에 포함된 행의 (id, updated_at)으로 계산 (댓글 삭제도 행 목록이 바뀌어 감지됨)
+    # 삭제는 최종 수정 시각으로 알 수 없으므로 목록에는 Last-Modified를 쓰지 않음
+    etag = make_etag("post_comments", post_id, 0 if cursor else skip, limit, cursor, row_versions(comments))
+    not_modified = check_not_modified(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    cursor_value = next_cursor(comments, limit)
+    if cursor_value:
+        response.headers["X-Next-Cursor"] = cursor_value
+    # Response를 직접 반환하면 주입된 response의 헤더가 적용되지 않으므로 옮겨 담음
+    return json_response(dump_rows(comments, COMMENT_LIST_FIELDS), dict(response.headers))
 
 
 @router.post(
@@ -225,7 +407,7 @@ def create_post_comment(
         alias="X-User-ID",
         description="작성자 ID"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     """게시글에 댓글 생성
 
@@ -245,3 +427,39 @@ def create_post_comment(
         post_id,
         x_user_id
     )
+
+
+@router.post(
+    "/{post_id}/comments/bulk",
+    response_model=CommentBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    description="게시글에 댓글 일괄 작성 (항목별 검증, 실패 항목은 errors로 반환하고 나머지는 한 트랜잭션으로 저장, 모든 항목이 실패하면 422)"
+)
+def bulk_create_post_comments(
+    post_id: int = Path(..., gt=0, description="게시글 ID"),
+    items: list[Any] = Body(
+        ...,
+        min_length=1,
+        max_length=settings.bulk_max_items,
+        description="content 필드를 가진 항목 배열"
+    ),
+    x_user_id: int = Header(
+        ...,
+        alias="X-User-ID",
+        description="작성자 ID"
+    ),
+    db: Session = Depends(get_write_db)
+):
+    """게시글에 댓글 일괄 생성
+
+    Args:
+        post_id (int): 게시글 ID
+        items (list[Any]): 생성할 댓글 정보 배열
+        x_user_id (int): 헤더로 전달된 작성자 ID
+        db (Session): 데이터베이스 세션
+
+    Returns:
+        CommentBulkResult: 생성된 댓글(요청 순서)과 항목별 오류 (index는 요청 배열 위치)
+    """
+    controller = CommentController(db)
+    return controller.bulk_create_comments(items, post_id, x_user_id)
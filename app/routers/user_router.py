@@ -1,13 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Header
+from fastapi import APIRouter, Depends, HTTPException, status, Path, Body, Header, Request, Response
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import get_read_db, get_write_db
 from app.schemas.user_schema import UserCreate, UserUpdate, User
-from app.controllers.user_controller import UserController
+from app.controllers.user_controller import UserController, USER_LIST_FIELDS
+from app.utils.conditional import make_etag, check_not_modified
+from app.utils.serialization import dump_rows, json_response
+from app.utils.profiling import ProfiledRoute
 
 router = APIRouter(
     prefix="/api/users",
     tags=["users"],
+    route_class=ProfiledRoute
 )
 
 @router.post(
@@ -16,7 +20,7 @@ router = APIRouter(
     status_code=status.HTTP_201_CREATED,
     description="새로운 사용자 생성"
 )
-def create_user(user: UserCreate, db: Session = Depends(get_db)):
+def create_user(user: UserCreate, db: Session = Depends(get_write_db)):
     try:
         controller = UserController(db)
         return controller.create_user(user)
@@ -30,21 +34,24 @@ def create_user(user: UserCreate, db: Session = Depends(get_db)):
     "/",
     response_model=list[User],
     status_code=status.HTTP_200_OK,
-    description="모든 사용자 목록 조회"
+    description="모든 사용자 목록 조회 (컬럼 튜플을 바로 직렬화)"
 )
-def get_users(db: Session = Depends(get_db)):
+def get_users(db: Session = Depends(get_read_db)):
     controller = UserController(db)
-    return controller.get_users()
+    rows = controller.get_user_rows()
+    return json_response(dump_rows(rows, USER_LIST_FIELDS))
 
 @router.get(
     "/{user_id}",
     response_model=User,
     status_code=status.HTTP_200_OK,
-    description="특정 사용자 조회"
+    description="특정 사용자 조회 (ETag/Last-Modified 조건부 요청 지원)"
 )
 def get_user(
+    request: Request,
+    response: Response,
     user_id: int = Path(..., description="조회할 사용자 ID"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     controller = UserController(db)
     user = controller.get_user_by_id(user_id)
@@ -53,6 +60,11 @@ def get_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="사용자를 찾을 수 없습니다"
         )
+
+    etag = make_etag("user", user.id, user.updated_at)
+    not_modified = check_not_modified(request, response, etag, user.updated_at)
+    if not_modified:
+        return not_modified
     return user
 
 @router.put(
@@ -69,7 +81,7 @@ def update_user(
         alias="X-User-ID",
         description="요청자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     if user_id != x_user_id:
         raise HTTPException(
@@ -104,7 +116,7 @@ def delete_user(
         alias="X-User-ID",
         description="요청자 ID (권한 확인용)"
     ),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_write_db)
 ):
     if user_id != x_user_id:
         raise HTTPException(
@@ -0,0 +1,19 @@
+from pydantic import BaseModel, Field
+
+from app.schemas.post_schema import Post
+from app.schemas.comment_schema import Comment
+
+
+class BulkItemError(BaseModel):
+    index: int = Field(description="요청 배열에서의 위치 (0부터)")
+    message: str = Field(description="검증 실패 사유")
+
+
+class PostBulkResult(BaseModel):
+    created: list[Post] = Field(default=[], description="생성된 게시글 (요청 순서)")
+    errors: list[BulkItemError] = Field(default=[], description="검증에 실패해 건너뛴 항목")
+
+
+class CommentBulkResult(BaseModel):
+    created: list[Comment] = Field(default=[], description="생성된 댓글 (요청 순서)")
+    errors: list[BulkItemError] = Field(default=[], description="검증에 실패해 건너뛴 항목")
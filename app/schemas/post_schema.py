@@ -33,9 +33,26 @@ class Post(PostBase):
     model_config: ConfigDict = ConfigDict(from_attributes=True)
 
 
-# 상세 조회용 (댓글 포함)
+# 검색 결과용 (관련도 점수, 하이라이트 스니펫 포함)
+class PostSearchResult(Post):
+    search_rank: float = Field(description="관련도 점수 (낮을수록 관련도 높음)")
+    snippet: str = Field(description="검색어 주변 발췌 (일치 부분은 <mark>로 감쌈)")
+
+
+# 상세 조회용 (앞쪽 댓글 일부 포함)
 class PostDetail(Post):
-    comments: List["Comment"] = Field(default=[], description="댓글 목록")
+    comments: List["Comment"] = Field(default=[], description="댓글 목록 (작성순 앞쪽 일부)")
+    next_comments_cursor: str | None = Field(
+        default=None,
+        description="나머지 댓글 조회용 커서 (GET /posts/{post_id}/comments?cursor=)"
+    )
+
+
+# 좋아요/좋아요 취소 응답
+class PostLikeStatus(BaseModel):
+    post_id: int = Field(description="게시글 ID")
+    liked: bool = Field(description="요청한 회원의 좋아요 여부")
+    like_count: int = Field(ge=0, description="좋아요 수")
 
 
 # 순환 import 해결을 위해 런타임에 Comment 임포트 후 모델 재빌드
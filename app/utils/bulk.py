@@ -0,0 +1,32 @@
+from typing import Any
+
+from pydantic import BaseModel, TypeAdapter, ValidationError
+
+from app.schemas.bulk_schema import BulkItemError
+
+
+def validate_items(
+    adapter: TypeAdapter,
+    items: list[Any]
+) -> tuple[list[tuple[int, BaseModel]], list[BulkItemError]]:
+    """일괄 요청 항목을 하나씩 검증 (실패 항목은 건너뛰고 사유를 모음)
+
+    Args:
+        adapter (TypeAdapter): 항목 스키마용 TypeAdapter (모듈 수준에서 한 번만 생성)
+        items (list[Any]): 요청 본문의 원본 항목
+
+    Returns:
+        tuple: ([(원래 위치, 검증된 모델)], [항목별 오류])
+    """
+    valid = []
+    errors = []
+    for index, item in enumerate(items):
+        try:
+            valid.append((index, adapter.validate_python(item)))
+        except ValidationError as e:
+            message = "; ".join(
+                f"{'.'.join(str(part) for part in error['loc']) or 'item'}: {error['msg']}"
+                for error in e.errors()
+            )
+            errors.append(BulkItemError(index=index, message=message))
+    return valid, errors
@@ -0,0 +1,106 @@
+import hashlib
+from collections.abc import Iterable
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+
+from fastapi import Request, Response
+
+
+def make_etag(*parts, weak: bool = False) -> str:
+    """검증자(버전 정보)로부터 ETag 생성
+
+    본문을 직렬화하지 않고 (id, updated_at) 같은 버전 정보만으로 계산하므로
+    304 응답 시 Pydantic 직렬화를 완전히 건너뛸 수 있다. parts가 표현의 모든 내용을
+    결정하면 strong ETag, 일부 필드(예: 조회수)를 빼고 계산했다면 weak=True로 weak ETag를 만든다.
+
+    Args:
+        *parts: 응답 내용을 결정하는 값 (ID, updated_at, 쿼리 파라미터 등)
+        weak (bool): 표현이 바뀌어도 같은 값이 나올 수 있는 경우 W/ 접두사
+
+    Returns:
+        str: 따옴표로 감싼 ETag (weak이면 W/"...")
+    """
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return f'W/"{digest}"' if weak else f'"{digest}"'
+
+
+def row_versions(rows: Iterable) -> tuple:
+    """행 목록의 (id, updated_at) 튜플"""
+    return tuple((row.id, row.updated_at) for row in rows)
+
+
+def latest(*values: datetime | None) -> datetime | None:
+    """None을 제외한 가장 최근 시각 (Last-Modified 계산용)"""
+    present = [value for value in values if value is not None]
+    return max(present) if present else None
+
+
+def http_date(value: datetime) -> str:
+    """naive 로컬 시각(DB 저장 형식)을 HTTP-date(GMT)로 변환"""
+    return format_datetime(value.astimezone(timezone.utc).replace(microsecond=0), usegmt=True)
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    candidates = [candidate.strip() for candidate in header.split(",")]
+    # If-None-Match는 weak 비교 (양쪽의 W/ 접두사 무시)
+    opaque = etag.removeprefix("W/")
+    return any(candidate.removeprefix("W/") == opaque for candidate in candidates)
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    # HTTP-date는 초 단위이므로 초 미만은 버리고 비교
+    modified = last_modified.astimezone(timezone.utc).replace(microsecond=0)
+    return modified <= since
+
+
+def validator_headers(etag: str, last_modified: datetime | None = None) -> dict[str, str]:
+    """200/304 응답에 공통으로 붙일 검증자 헤더"""
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+    return headers
+
+
+def check_not_modified(
+    request: Request,
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None
+) -> Response | None:
+    """조건부 GET 처리
+
+    If-None-Match가 있으면 그것만 비교하고, 없을 때만 If-Modified-Since를 본다 (RFC 9110).
+
+    Args:
+        request (Request): 요청 (조건부 헤더 확인용)
+        response (Response): 200 응답에 검증자 헤더를 설정할 응답 객체
+        etag (str): 현재 표현의 ETag
+        last_modified (datetime | None): 현재 표현의 최종 수정 시각
+
+    Returns:
+        Response | None: 변경이 없으면 304 응답, 있으면 None (헤더만 설정)
+    """
+    headers = validator_headers(etag, last_modified)
+
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, etag)
+    elif if_modified_since is not None and last_modified is not None:
+        not_modified = _not_modified_since(if_modified_since, last_modified)
+    else:
+        not_modified = False
+
+    if not_modified:
+        return Response(status_code=304, headers=headers)
+
+    response.headers.update(headers)
+    return None
@@ -1,8 +1,12 @@
+from collections.abc import Callable
 from contextlib import contextmanager
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from app.exceptions import InvalidDataException, DatabaseException
 
+# WriteCoordinator의 writer 세션에서 묶음 commit 이후로 미룬 작업 목록 (Session.info 키)
+AFTER_COMMIT = "after_commit"
+
 
 @contextmanager
 def db_transaction(db: Session):
@@ -27,3 +31,21 @@ def db_transaction(db: Session):
     except SQLAlchemyError as e:
         db.rollback()
         raise DatabaseException(f"데이터베이스 오류가 발생했습니다: {str(e)}")
+
+
+def after_commit(db: Session, callback: Callable[[], None]) -> None:
+    """commit 이후에 할 작업(캐시 무효화 등) 실행
+
+    db_transaction이 끝난 뒤 호출한다. 일반 세션은 이미 commit되었으므로 바로 실행하고,
+    WriteCoordinator의 writer 세션은 SAVEPOINT만 해제된 상태이므로 묶음이 commit된 뒤에 실행한다
+    (commit 전에 무효화하면 그 사이 다른 요청이 이전 데이터로 캐시를 다시 채울 수 있음).
+
+    Args:
+        db (Session): SQLAlchemy 세션
+        callback (Callable[[], None]): 실행할 작업
+    """
+    pending = db.info.get(AFTER_COMMIT)
+    if pending is None:
+        callback()
+    else:
+        pending.append(callback)
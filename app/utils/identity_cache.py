@@ -0,0 +1,116 @@
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+
+from app.config import settings
+
+# 요청 하나 동안 확인한 회원 (user_id -> nickname)
+_request_identities: ContextVar[dict[int, str] | None] = ContextVar("request_identities", default=None)
+
+
+class IdentityCache:
+    """작성자 존재 확인용 회원 식별 정보 캐시
+
+    1단계: 요청 범위 캐시 (ContextVar, 요청이 끝나면 버려짐)
+    2단계: 프로세스 범위 TTL 캐시 (ttl이 0이면 비활성화)
+
+    회원 삭제와 닉네임 변경 시 forget()으로 무효화한다. 다른 프로세스의 변경은
+    TTL이 지나야 반영되므로, 쓰기 경로의 최종 판단은 항상 FK 제약이 한다.
+    """
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[int, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> str | None:
+        """캐시된 닉네임 (없거나 만료되었으면 None)
+
+        Args:
+            user_id (int): 회원 ID
+
+        Returns:
+            str | None: 닉네임 또는 None
+        """
+        scoped = _request_identities.get()
+        if scoped is not None and user_id in scoped:
+            return scoped[user_id]
+
+        if self.ttl <= 0:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            expires_at, nickname = entry
+            if expires_at <= time.monotonic():
+                del self._entries[user_id]
+                return None
+
+        if scoped is not None:
+            scoped[user_id] = nickname
+        return nickname
+
+    def remember(self, user_id: int, nickname: str) -> None:
+        """조회한 회원 정보를 요청/프로세스 캐시에 저장
+
+        Args:
+            user_id (int): 회원 ID
+            nickname (str): 닉네임
+        """
+        scoped = _request_identities.get()
+        if scoped is not None:
+            scoped[user_id] = nickname
+
+        if self.ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[user_id] = (time.monotonic() + self.ttl, nickname)
+            self._entries.move_to_end(user_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def forget(self, user_id: int) -> None:
+        """회원 정보 무효화 (회원 삭제, 닉네임 변경)
+
+        Args:
+            user_id (int): 회원 ID
+        """
+        scoped = _request_identities.get()
+        if scoped is not None:
+            scoped.pop(user_id, None)
+
+        with self._lock:
+            self._entries.pop(user_id, None)
+
+
+class RequestIdentityScopeMiddleware:
+    """요청마다 비어 있는 요청 범위 캐시를 열어 주는 ASGI 미들웨어
+
+    동기 엔드포인트는 컨텍스트가 복사된 스레드에서, async 컨트롤러는 run_sync의
+    greenlet에서 실행되지만 같은 dict 객체를 공유하므로 요청 안에서 캐시가 유지된다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        token = _request_identities.set({})
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _request_identities.reset(token)
+
+
+identity_cache = IdentityCache(
+    ttl=settings.user_cache_ttl,
+    max_entries=settings.user_cache_size
+)
@@ -0,0 +1,276 @@
+import bisect
+import threading
+import time
+from collections import defaultdict
+
+import anyio.to_thread
+
+# 요청/커넥션 대기 시간 히스토그램 버킷 (초)
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: tuple[str, ...], values: tuple) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+class Counter:
+    """레이블별 누적 카운터 (Prometheus counter)"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str, label_names: tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self._values: defaultdict[tuple, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def inc(self, *labels, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] += amount
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = list(self._values.items())
+        return [f"{self.name}{_labels(self.label_names, labels)} {value:g}" for labels, value in items]
+
+
+class Gauge(Counter):
+    """레이블별 현재 값 (Prometheus gauge), 진행 중 요청 수처럼 증감하는 값"""
+
+    kind = "gauge"
+
+    def dec(self, *labels) -> None:
+        self.inc(*labels, amount=-1.0)
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램 (Prometheus histogram)
+
+    관측 시에는 버킷 위치만 이분 탐색하고 누적 합계는 노출 시점에 계산한다.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        help_text: str,
+        label_names: tuple[str, ...] = (),
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+    ):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = label_names
+        self.buckets = buckets
+        # 레이블 → [버킷별 개수 (+Inf 포함), 합계]
+        self._values: dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+            entry[0][index] += 1
+            entry[1] += value
+
+    def samples(self) -> list[str]:
+        with self._lock:
+            items = [(labels, list(counts), total) for labels, (counts, total) in self._values.items()]
+
+        names = (*self.label_names, "le")
+        lines = []
+        for labels, counts, total in items:
+            cumulative = 0
+            for bound, count in zip((*self.buckets, "+Inf"), counts):
+                cumulative += count
+                le = bound if bound == "+Inf" else f"{bound:g}"
+                lines.append(f"{self.name}_bucket{_labels(names, (*labels, le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_labels(self.label_names, labels)} {total:.6f}")
+            lines.append(f"{self.name}_count{_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+
+class CheckoutTimingPoolMixin:
+    """커넥션 체크아웃(풀 대기 + 필요 시 새 연결) 시간과 체크아웃 중인 요청 수를 기록하는 풀 믹스인
+
+    QueuePool / AsyncAdaptedQueuePool 앞에 섞어 쓰며, metrics에 등록된 엔진의 풀만 기록한다.
+    """
+
+    def connect(self):
+        name = metrics.pool_name(self)
+        if name is None:
+            return super().connect()
+
+        metrics.pool_waiting.inc(name)
+        started = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            metrics.pool_waiting.dec(name)
+            metrics.pool_checkout.observe(time.perf_counter() - started, name)
+
+
+class MetricsRegistry:
+    """요청/커넥션 풀/스레드풀 지표 (Prometheus 텍스트 형식으로 노출)"""
+
+    def __init__(self):
+        self.requests = Counter(
+            "http_requests_total", "HTTP 요청 수", ("method", "route", "status")
+        )
+        self.latency = Histogram(
+            "http_request_duration_seconds", "HTTP 요청 처리 시간 (응답 본문 전송 완료까지)", ("method", "route")
+        )
+        self.in_progress = Gauge(
+            "http_requests_in_progress", "처리 중인 HTTP 요청 수", ("method", "route")
+        )
+        self.exceptions = Counter(
+            "http_exceptions_total", "예외로 끝난 요청 수 (AppException 하위 클래스, DatabaseError 등)",
+            ("method", "route", "exception")
+        )
+        self.pool_waiting = Gauge(
+            "db_pool_checkouts_waiting", "커넥션 체크아웃 중(풀 대기 포함)인 요청 수", ("pool",)
+        )
+        self.pool_checkout = Histogram(
+            "db_pool_checkout_seconds", "커넥션 체크아웃 시간 (풀 대기 + 새 연결)", ("pool",)
+        )
+        self._engines: dict[str, object] = {}
+
+    def register_engine(self, name: str, engine) -> None:
+        """풀 지표를 노출할 엔진 등록 (dispose 후 다시 만들어진 풀도 따라가도록 엔진을 보관)
+
+        Args:
+            name (str): pool 레이블 값 (write, read 등)
+            engine: 동기 엔진 (async 엔진은 sync_engine)
+        """
+        self._engines[name] = engine
+
+    def pool_name(self, pool) -> str | None:
+        """등록된 엔진의 현재 풀이면 그 이름, 아니면 None"""
+        for name, engine in self._engines.items():
+            if engine.pool is pool:
+                return name
+        return None
+
+    def record_exception(self, scope, exception: str) -> None:
+        """예외 처리기에서 호출: 요청이 끝난 예외 종류 기록
+
+        Args:
+            scope: ASGI scope (request.scope)
+            exception (str): 예외 이름 (응답의 error 값)
+        """
+        route = scope.get("route")
+        self.exceptions.inc(scope.get("method", ""), route.path if route else UNMATCHED_ROUTE, exception)
+
+    def _pool_samples(self) -> list[str]:
+        gauges = {
+            "db_pool_size": ("풀 크기 (pool_size)", "size"),
+            "db_pool_checked_out": ("사용 중인 커넥션 수", "checkedout"),
+            "db_pool_overflow": ("pool_size를 넘어 연 커넥션 수 (음수면 아직 열리지 않은 슬롯)", "overflow"),
+        }
+        lines = []
+        for metric, (help_text, method) in gauges.items():
+            lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} gauge"]
+            for name, engine in self._engines.items():
+                getter = getattr(engine.pool, method, None)
+                if callable(getter):
+                    lines.append(f'{metric}{{pool="{name}"}} {getter()}')
+        return lines
+
+    @staticmethod
+    def _threadpool_samples() -> list[str]:
+        # 동기 엔드포인트/의존성이 실행되는 anyio 기본 스레드풀 (이벤트 루프 스레드에서 호출해야 함)
+        statistics = anyio.to_thread.current_default_thread_limiter().statistics()
+        return [
+            "# HELP threadpool_tokens_total 스레드풀 최대 동시 실행 수",
+            "# TYPE threadpool_tokens_total gauge",
+            f"threadpool_tokens_total {statistics.total_tokens:g}",
+            "# HELP threadpool_tokens_borrowed 실행 중인 스레드풀 작업 수",
+            "# TYPE threadpool_tokens_borrowed gauge",
+            f"threadpool_tokens_borrowed {statistics.borrowed_tokens}",
+            "# HELP threadpool_tasks_waiting 스레드풀 자리를 기다리는 작업 수 (0보다 크면 포화)",
+            "# TYPE threadpool_tasks_waiting gauge",
+            f"threadpool_tasks_waiting {statistics.tasks_waiting}",
+        ]
+
+    def render(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)
+
+        Returns:
+            str: /metrics 응답 본문
+        """
+        lines = []
+        for metric in (
+            self.requests, self.latency, self.in_progress, self.exceptions, self.pool_waiting, self.pool_checkout
+        ):
+            lines += [f"# HELP {metric.name} {metric.help_text}", f"# TYPE {metric.name} {metric.kind}"]
+            lines += metric.samples()
+        lines += self._pool_samples()
+        lines += self._threadpool_samples()
+        return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """요청 수/지연 시간/진행 중 요청 수를 라우트 템플릿(/posts/{post_id}) 단위로 기록하는 ASGI 미들웨어
+
+    경로 파라미터 값이 레이블에 들어가지 않도록 시작 시점에 라우트 템플릿을 찾는다.
+    일치하는 라우트가 없으면 <unmatched>로 묶는다.
+    """
+
+    def __init__(self, app, registry: "MetricsRegistry | None" = None):
+        self.app = app
+        self.registry = registry or metrics
+
+    def _route_template(self, scope) -> str:
+        # Route.matches()는 경로 파라미터 변환과 child scope 생성까지 하므로 정규식과 메서드만 비교
+        path, method = scope["path"], scope["method"]
+        partial = None
+        for route in scope["app"].router.routes:
+            regex = getattr(route, "path_regex", None)
+            if regex is None or not regex.match(path):
+                continue
+            methods = getattr(route, "methods", None)
+            if methods is None or method in methods:
+                return route.path
+            partial = partial or route.path
+        return partial or UNMATCHED_ROUTE
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        registry = self.registry
+        method = scope["method"]
+        route = self._route_template(scope)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        registry.in_progress.inc(method, route)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        except Exception as exc:
+            registry.exceptions.inc(method, route, exc.__class__.__name__)
+            raise
+        finally:
+            registry.latency.observe(time.perf_counter() - started, method, route)
+            registry.requests.inc(method, route, status)
+            registry.in_progress.dec(method, route)
+
+
+metrics = MetricsRegistry()
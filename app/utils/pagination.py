@@ -0,0 +1,105 @@
+import base64
+import json
+from datetime import datetime
+
+from app.exceptions import InvalidDataException
+
+
+def encode_cursor(created_at: datetime, item_id: int) -> str:
+    """(created_at, id) 키를 불투명한 커서 문자열로 인코딩
+
+    Args:
+        created_at (datetime): 마지막 항목의 생성 시간
+        item_id (int): 마지막 항목의 ID
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = json.dumps({"c": created_at.isoformat(), "i": item_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """커서 문자열을 (created_at, id) 키로 디코딩
+
+    Args:
+        cursor (str): encode_cursor로 만든 커서
+
+    Returns:
+        tuple[datetime, int]: (생성 시간, ID)
+
+    Raises:
+        InvalidDataException: 커서 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return datetime.fromisoformat(payload["c"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidDataException("유효하지 않은 커서입니다")
+
+
+def next_cursor(items: list, limit: int) -> str | None:
+    """다음 페이지 커서 계산 (페이지가 가득 찬 경우에만 발급)
+
+    Args:
+        items (list): created_at, id 속성을 가진 현재 페이지 항목
+        limit (int): 페이지 크기
+
+    Returns:
+        str | None: 다음 페이지 커서 또는 None (마지막 페이지)
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(last.created_at, last.id)
+
+
+def encode_rank_cursor(rank: float, item_id: int) -> str:
+    """검색 결과의 (rank, id) 키를 불투명한 커서 문자열로 인코딩
+
+    Args:
+        rank (float): 마지막 항목의 검색 점수 (bm25, 낮을수록 관련도 높음)
+        item_id (int): 마지막 항목의 ID
+
+    Returns:
+        str: URL-safe base64 커서
+    """
+    payload = json.dumps({"r": rank, "i": item_id})
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_rank_cursor(cursor: str) -> tuple[float, int]:
+    """커서 문자열을 (rank, id) 키로 디코딩
+
+    Args:
+        cursor (str): encode_rank_cursor로 만든 커서
+
+    Returns:
+        tuple[float, int]: (검색 점수, ID)
+
+    Raises:
+        InvalidDataException: 커서 형식이 잘못된 경우
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return float(payload["r"]), int(payload["i"])
+    except (ValueError, KeyError, TypeError):
+        raise InvalidDataException("유효하지 않은 커서입니다")
+
+
+def next_rank_cursor(items: list, limit: int) -> str | None:
+    """검색 결과 다음 페이지 커서 계산 (페이지가 가득 찬 경우에만 발급)
+
+    Args:
+        items (list): search_rank, id 속성을 가진 현재 페이지 항목
+        limit (int): 페이지 크기
+
+    Returns:
+        str | None: 다음 페이지 커서 또는 None (마지막 페이지)
+    """
+    if not items or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_rank_cursor(last.search_rank, last.id)
@@ -0,0 +1,242 @@
+import functools
+import hmac
+import inspect
+import random
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+
+from fastapi.routing import APIRoute
+
+from app.config import settings
+
+PROFILE_HEADER = b"x-profile"
+PROFILE_SUFFIX = ".collapsed"
+
+# 현재 요청의 프로파일 (프로파일링 대상이 아니면 None)
+_active_profile: ContextVar["RequestProfile | None"] = ContextVar("active_profile", default=None)
+
+
+class RequestProfile:
+    """요청 하나의 샘플링 결과 (스레드별 호출 스택 → 샘플 수)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.stacks: Counter[str] = Counter()
+        self.samples = 0
+        # 이 요청의 코드가 실행 중인 스레드 ident → 등록 횟수 (이벤트 루프 스레드, 스레드풀 워커)
+        self._threads: dict[int, int] = {}
+        self._lock = threading.Lock()
+
+    def enter_thread(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] = self._threads.get(ident, 0) + 1
+
+    def exit_thread(self) -> None:
+        ident = threading.get_ident()
+        with self._lock:
+            remaining = self._threads.get(ident, 1) - 1
+            if remaining:
+                self._threads[ident] = remaining
+            else:
+                self._threads.pop(ident, None)
+
+    def sample(self, frames: dict) -> None:
+        with self._lock:
+            idents = list(self._threads)
+        for ident in idents:
+            frame = frames.get(ident)
+            if frame is None:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{frame.f_globals.get('__name__', '?')}:{code.co_qualname}")
+                frame = frame.f_back
+            self.stacks[";".join(reversed(stack))] += 1
+            self.samples += 1
+
+    def collapsed(self) -> str:
+        """flamegraph.pl / speedscope에서 읽을 수 있는 collapsed stack 형식"""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.most_common())
+
+
+class SamplingProfiler:
+    """프로파일링 중인 요청이 있을 때만 동작하는 샘플링 프로파일러
+
+    interval마다 sys._current_frames()로 모든 스레드의 현재 프레임을 읽고, 각 프로파일에 등록된
+    스레드의 스택만 해당 요청의 결과에 더한다. 이벤트 루프 스레드는 여러 요청이 공유하므로
+    async 구간의 샘플에는 동시에 처리 중인 다른 요청의 스택이 섞일 수 있다.
+    """
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._profiles: set[RequestProfile] = set()
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+
+    def add(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.add(profile)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+
+    def remove(self, profile: RequestProfile) -> None:
+        with self._lock:
+            self._profiles.discard(profile)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                profiles = list(self._profiles)
+                if not profiles:
+                    self._thread = None
+                    return
+            frames = sys._current_frames()
+            for profile in profiles:
+                profile.sample(frames)
+            del frames
+            time.sleep(self.interval)
+
+
+def _enter_profiled(profile: "RequestProfile | None"):
+    if profile is not None:
+        profile.enter_thread()
+    return profile
+
+
+def profiled_endpoint(endpoint):
+    """엔드포인트가 실행되는 스레드를 현재 요청의 프로파일에 등록하는 래퍼
+
+    동기 엔드포인트는 스레드풀 워커에서, async 엔드포인트는 이벤트 루프 스레드에서 실행된다.
+    프로파일링 대상이 아닌 요청은 ContextVar 조회 한 번만 추가된다. 이미 감싼 엔드포인트는
+    그대로 반환한다 (include_router가 같은 route_class로 라우트를 다시 만들 때 이중으로 감싸지 않도록).
+    """
+    if getattr(endpoint, "_profiled", False):
+        return endpoint
+
+    if inspect.iscoroutinefunction(endpoint):
+        @functools.wraps(endpoint)
+        async def async_wrapper(*args, **kwargs):
+            profile = _enter_profiled(_active_profile.get())
+            try:
+                return await endpoint(*args, **kwargs)
+            finally:
+                if profile is not None:
+                    profile.exit_thread()
+        async_wrapper._profiled = True
+        return async_wrapper
+
+    @functools.wraps(endpoint)
+    def wrapper(*args, **kwargs):
+        profile = _enter_profiled(_active_profile.get())
+        try:
+            return endpoint(*args, **kwargs)
+        finally:
+            if profile is not None:
+                profile.exit_thread()
+    wrapper._profiled = True
+    return wrapper
+
+
+class ProfiledRoute(APIRoute):
+    """엔드포인트를 profiled_endpoint로 감싸는 route_class (app/routers/의 모든 APIRouter에 지정)"""
+
+    def __init__(self, path: str, endpoint, **kwargs):
+        super().__init__(path, profiled_endpoint(endpoint), **kwargs)
+
+
+class ProfilingMiddleware:
+    """요청 단위 온디맨드 프로파일링 ASGI 미들웨어
+
+    - X-Profile 헤더 값이 PROFILE_SECRET과 같거나, PROFILE_SAMPLE_RATE 확률에 걸린 요청만 프로파일링
+    - 결과는 PROFILE_DIR에 collapsed stack 파일로 저장하고 응답 헤더 X-Profile에 파일 이름을 반환
+      (샘플 수 × PROFILE_INTERVAL_MS ≈ 요청 처리 시간)
+    - 대상이 아닌 요청은 헤더 확인과 난수 하나만 추가된다
+    """
+
+    def __init__(self, app):
+        self.app = app
+        self.secret = settings.profile_secret.encode()
+        self.sample_rate = settings.profile_sample_rate
+        self.directory = Path(settings.profile_dir)
+        self.profiler = SamplingProfiler(settings.profile_interval_ms / 1000)
+
+    def _should_profile(self, scope) -> bool:
+        if self.secret:
+            for name, value in scope["headers"]:
+                if name == PROFILE_HEADER:
+                    return hmac.compare_digest(value, self.secret)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._should_profile(scope):
+            await self.app(scope, receive, send)
+            return
+
+        path = re.sub(r"[^A-Za-z0-9]+", "_", scope["path"]).strip("_") or "root"
+        profile = RequestProfile(f"{datetime.now():%Y%m%d-%H%M%S-%f}-{scope['method']}-{path[:80]}{PROFILE_SUFFIX}")
+
+        async def send_with_profile(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-profile", profile.name.encode())]
+            await send(message)
+
+        token = _active_profile.set(profile)
+        # 라우팅, 의존성, 응답 직렬화 등 이벤트 루프 스레드 구간
+        profile.enter_thread()
+        self.profiler.add(profile)
+        try:
+            await self.app(scope, receive, send_with_profile)
+        finally:
+            self.profiler.remove(profile)
+            profile.exit_thread()
+            _active_profile.reset(token)
+            self._save(profile)
+
+    def _save(self, profile: RequestProfile) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / profile.name).write_text(profile.collapsed(), encoding="utf-8")
+
+
+def list_profiles(limit: int = 100) -> list[dict]:
+    """저장된 프로파일 목록 (최신순)
+
+    Args:
+        limit (int): 최대 개수
+
+    Returns:
+        list[dict]: 파일 이름, 크기, 샘플 수, 생성 시각
+    """
+    directory = Path(settings.profile_dir)
+    if not directory.is_dir():
+        return []
+    files = sorted(directory.glob(f"*{PROFILE_SUFFIX}"), key=lambda path: path.stat().st_mtime, reverse=True)
+    profiles = []
+    for path in files[:limit]:
+        stat = path.stat()
+        with path.open(encoding="utf-8") as profile_file:
+            samples = sum(int(line.rsplit(" ", 1)[1]) for line in profile_file if line.strip())
+        profiles.append({
+            "name": path.name,
+            "size": stat.st_size,
+            "samples": samples,
+            "created_at": datetime.fromtimestamp(stat.st_mtime).isoformat(timespec="seconds"),
+        })
+    return profiles
+
+
+def profile_path(name: str) -> Path | None:
+    """저장된 프로파일 파일 경로 (디렉터리 밖을 가리키거나 없으면 None)"""
+    directory = Path(settings.profile_dir).resolve()
+    path = (directory / name).resolve()
+    if path.parent != directory or path.suffix != PROFILE_SUFFIX or not path.is_file():
+        return None
+    return path
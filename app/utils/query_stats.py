@@ -0,0 +1,124 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# 요청 하나 동안 실행된 SQL 통계
+_request_queries: ContextVar["RequestQueryStats | None"] = ContextVar("request_queries", default=None)
+
+
+class RequestQueryStats:
+    """요청 하나의 SQL 실행 횟수, 누적 시간, 문장별 실행 횟수
+
+    동기 엔드포인트의 스레드와 async 컨트롤러의 run_sync greenlet이 같은 객체를 공유한다.
+    한 요청의 쿼리는 순서대로 실행되므로 잠금 없이 갱신한다.
+    """
+
+    __slots__ = ("count", "duration", "statements")
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter[str] = Counter()
+
+    def record(self, statement: str, duration: float) -> None:
+        self.count += 1
+        self.duration += duration
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int) -> list[tuple[str, int]]:
+        """같은 문장이 threshold번 이상 실행된 목록 (N+1 의심)
+
+        Args:
+            threshold (int): 반복 횟수 기준
+
+        Returns:
+            list[tuple[str, int]]: (문장, 실행 횟수), 많이 실행된 순
+        """
+        return [(statement, count) for statement, count in self.statements.most_common() if count >= threshold]
+
+
+def current_query_stats() -> RequestQueryStats | None:
+    """현재 요청의 SQL 통계 (요청 밖이거나 계측이 꺼져 있으면 None)"""
+    return _request_queries.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # 시작 시각은 문장별 실행 컨텍스트에 둠 (실패한 문장은 after_cursor_execute가 호출되지 않으므로
+    # 커넥션에 두면 풀에 반환된 뒤에도 계속 쌓임)
+    if context is not None and _request_queries.get() is not None:
+        context._query_started_at = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_queries.get()
+    if stats is None:
+        return
+    started = getattr(context, "_query_started_at", None)
+    if started is not None:
+        stats.record(statement, time.perf_counter() - started)
+
+
+def install_query_listeners() -> None:
+    """모든 엔진(동기/async의 sync_engine, 쓰기/읽기)의 커서 실행 전후에 계측 리스너 등록"""
+    if not event.contains(Engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(Engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(Engine, "after_cursor_execute", _after_cursor_execute)
+
+
+class QueryStatsMiddleware:
+    """요청별 SQL 계측 ASGI 미들웨어
+
+    - 응답 헤더: Server-Timing: db;dur=<ms>;desc="<n> queries", total;dur=<ms>
+      (응답 시작 시점까지의 값이므로 스트리밍 응답은 본문 전송 중 쿼리가 빠짐)
+    - 요청이 끝난 뒤 같은 문장이 n_plus_one_threshold번 이상 반복되었으면 N+1 의심 경고 로그
+    """
+
+    def __init__(self, app, n_plus_one_threshold: int | None = None):
+        self.app = app
+        self.n_plus_one_threshold = (
+            settings.sql_n_plus_one_threshold if n_plus_one_threshold is None else n_plus_one_threshold
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestQueryStats()
+        started = time.perf_counter()
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                timing = (
+                    f'db;dur={stats.duration * 1000:.2f};desc="{stats.count} queries", '
+                    f"total;dur={(time.perf_counter() - started) * 1000:.2f}"
+                )
+                message["headers"] = [*message.get("headers", []), (b"server-timing", timing.encode())]
+            await send(message)
+
+        token = _request_queries.set(stats)
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _request_queries.reset(token)
+            self._report(scope, stats)
+
+    def _report(self, scope, stats: RequestQueryStats) -> None:
+        method, path = scope.get("method", ""), scope.get("path", "")
+        logger.debug("%s %s: %d queries, %.2f ms", method, path, stats.count, stats.duration * 1000)
+
+        if self.n_plus_one_threshold <= 0:
+            return
+        for statement, count in stats.repeated(self.n_plus_one_threshold):
+            logger.warning(
+                "N+1 의심: %s %s 요청에서 같은 쿼리가 %d번 실행됨: %s",
+                method, path, count, " ".join(statement.split())[:500]
+            )
@@ -0,0 +1,225 @@
+import asyncio
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable, Iterable
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+
+import orjson
+from fastapi import Response
+
+from app.config import settings
+from app.utils.pagination import encode_cursor
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """직렬화가 끝난 응답 (본문 + 함께 캐시할 헤더)"""
+    body: bytes
+    headers: dict[str, str] = field(default_factory=dict)
+    # 이 응답에 포함된 게시글 ID (부분 무효화용)
+    post_ids: frozenset[int] = frozenset()
+
+
+class ResponseCache:
+    """직렬화된 응답을 보관하는 프로세스 내 LRU + TTL 캐시
+
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 같은 키의 동시 miss는 하나만 계산하고 나머지는 그 결과를 기다림 (single-flight)
+    - 쓰기 경로에서 전체(clear) 또는 특정 게시글을 포함한 항목만(invalidate_posts) 무효화
+    - 계산 도중 무효화가 일어나면 그 결과는 저장하지 않음 (오래된 데이터 재저장 방지)
+    """
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, tuple[float, CachedResponse]] = OrderedDict()
+        self._inflight: dict[Hashable, Future] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._coalesced = 0
+        self._evictions = 0
+        self._invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def _lookup(self, key: Hashable) -> tuple[CachedResponse | None, Future | None, bool, int]:
+        """캐시 조회 (lock 안에서 호출)
+
+        Returns:
+            (캐시 값, 기다릴 Future, 직접 계산해야 하는지 여부, 계산 시작 시점의 세대)
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, cached = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return cached, None, False, self._generation
+            del self._entries[key]
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            self._coalesced += 1
+            return None, inflight, False, self._generation
+
+        self._misses += 1
+        future = Future()
+        self._inflight[key] = future
+        return None, future, True, self._generation
+
+    def _store(self, key: Hashable, future: Future, generation: int, cached: CachedResponse) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+            if generation == self._generation:
+                self._entries[key] = (time.monotonic() + self.ttl, cached)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                    self._evictions += 1
+        future.set_result(cached)
+
+    def _fail(self, key: Hashable, future: Future, error: BaseException) -> None:
+        with self._lock:
+            self._inflight.pop(key, None)
+        future.set_exception(error)
+
+    def get_or_compute(
+        self,
+        key: Hashable,
+        compute: Callable[[], CachedResponse]
+    ) -> tuple[CachedResponse, bool]:
+        """캐시에서 가져오거나 계산 후 저장
+
+        Args:
+            key (Hashable): 캐시 키 (정규화된 쿼리 파라미터)
+            compute (Callable[[], CachedResponse]): miss일 때 응답을 만드는 함수
+
+        Returns:
+            tuple[CachedResponse, bool]: (응답, 캐시 hit 여부)
+        """
+        if not self.enabled:
+            return compute(), False
+
+        with self._lock:
+            cached, future, owner, generation = self._lookup(key)
+        if cached is not None:
+            return cached, True
+        if not owner:
+            return future.result(), True
+
+        try:
+            cached = compute()
+        except BaseException as e:
+            self._fail(key, future, e)
+            raise
+        self._store(key, future, generation, cached)
+        return cached, False
+
+    async def get_or_compute_async(
+        self,
+        key: Hashable,
+        compute: Callable[[], Awaitable[CachedResponse]]
+    ) -> tuple[CachedResponse, bool]:
+        """get_or_compute의 async 버전 (대기 중에도 이벤트 루프를 막지 않음)"""
+        if not self.enabled:
+            return await compute(), False
+
+        with self._lock:
+            cached, future, owner, generation = self._lookup(key)
+        if cached is not None:
+            return cached, True
+        if not owner:
+            return await asyncio.wrap_future(future), True
+
+        try:
+            cached = await compute()
+        except BaseException as e:
+            self._fail(key, future, e)
+            raise
+        self._store(key, future, generation, cached)
+        return cached, False
+
+    def clear(self) -> None:
+        """모든 항목 무효화 (목록 구성이나 순서가 바뀌는 쓰기: 생성/삭제)"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+
+    def invalidate_posts(self, post_ids: Iterable[int]) -> None:
+        """지정한 게시글을 포함한 항목만 무효화 (내용/댓글 수만 바뀌는 쓰기)
+
+        Args:
+            post_ids (Iterable[int]): 변경된 게시글 ID
+        """
+        targets = set(post_ids)
+        with self._lock:
+            stale = [key for key, (_, cached) in self._entries.items() if cached.post_ids & targets]
+            for key in stale:
+                del self._entries[key]
+            # 계산 중인 페이지가 이 게시글을 포함할 수 있으므로 저장되지 않게 함
+            self._generation += 1
+            self._invalidations += 1
+
+    def stats(self) -> dict:
+        """hit/miss 등 캐시 상태
+
+        Returns:
+            dict: entries, hits, misses, coalesced(single-flight로 합쳐진 요청), evictions, invalidations
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl": self.ttl,
+                "hits": self._hits,
+                "misses": self._misses,
+                "coalesced": self._coalesced,
+                "evictions": self._evictions,
+                "invalidations": self._invalidations,
+            }
+
+
+# GET /posts/ 목록 페이지 캐시
+post_list_cache = ResponseCache(
+    max_entries=settings.post_list_cache_size,
+    ttl=settings.post_list_cache_ttl
+)
+
+
+def serialize_post_page(rows: list[dict], limit: int) -> CachedResponse:
+    """게시글 목록 페이지를 캐시할 수 있는 형태로 직렬화
+
+    PostController.get_post_rows의 dict 행은 이미 Post 스키마 모양이므로 검증 없이 orjson으로 바로 인코딩한다.
+
+    Args:
+        rows (list[dict]): get_post_rows로 조회한 게시글 행
+        limit (int): 요청한 최대 개수 (다음 커서 계산용, 페이지가 가득 찬 경우에만 발급)
+
+    Returns:
+        CachedResponse: JSON 본문, X-Next-Cursor 헤더, 포함된 게시글 ID
+    """
+    headers = {}
+    if rows and len(rows) >= limit:
+        last = rows[-1]
+        headers["X-Next-Cursor"] = encode_cursor(last["created_at"], last["id"])
+    return CachedResponse(
+        body=orjson.dumps(rows),
+        headers=headers,
+        post_ids=frozenset(row["id"] for row in rows)
+    )
+
+
+def cached_response(cached: CachedResponse, hit: bool) -> Response:
+    """캐시 값으로 응답 생성 (X-Cache: HIT | MISS)"""
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers={**cached.headers, "X-Cache": "HIT" if hit else "MISS"}
+    )
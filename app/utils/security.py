@@ -1,7 +1,204 @@
-from argon2 import PasswordHasher
-from argon2.exceptions import VerifyMismatchError
+import asyncio
+import multiprocessing
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING
 
-ph = PasswordHasher()
+from app.config import settings
+from app.exceptions import ServiceUnavailableException
+
+if TYPE_CHECKING:
+    from argon2 import PasswordHasher
+
+# Argon2 비용 프로필 (memory_cost 단위: KiB)
+HASH_PROFILES = {
+    # OWASP 최소 권장값 수준
+    "low": {"time_cost": 2, "memory_cost": 19456, "parallelism": 1},
+    # argon2-cffi 기본값 (RFC 9106 low-memory)
+    "default": {"time_cost": 3, "memory_cost": 65536, "parallelism": 4},
+    "high": {"time_cost": 4, "memory_cost": 131072, "parallelism": 4},
+}
+
+
+def hash_params() -> tuple[int, int, int]:
+    """설정에 따른 Argon2 파라미터 (time_cost, memory_cost, parallelism)
+
+    Returns:
+        tuple[int, int, int]: 프로필 값에 개별 설정값을 덮어쓴 파라미터
+
+    Raises:
+        ValueError: 지원하지 않는 프로필인 경우
+    """
+    profile = HASH_PROFILES.get(settings.password_hash_profile)
+    if profile is None:
+        raise ValueError(f"지원하지 않는 PASSWORD_HASH_PROFILE: {settings.password_hash_profile}")
+
+    return (
+        settings.password_hash_time_cost or profile["time_cost"],
+        settings.password_hash_memory_cost or profile["memory_cost"],
+        settings.password_hash_parallelism or profile["parallelism"],
+    )
+
+
+HASH_PARAMS = hash_params()
+
+# 프로세스(워커)마다 파라미터별 PasswordHasher를 한 번만 생성
+_hashers: dict[tuple[int, int, int], "PasswordHasher"] = {}
+
+
+def _get_hasher(params: tuple[int, int, int]) -> "PasswordHasher":
+    hasher = _hashers.get(params)
+    if hasher is None:
+        # argon2는 해싱 워커 프로세스에서만 쓰므로(PASSWORD_HASH_WORKERS=0 제외) 처음 필요할 때 import
+        from argon2 import PasswordHasher
+
+        time_cost, memory_cost, parallelism = params
+        hasher = PasswordHasher(
+            time_cost=time_cost,
+            memory_cost=memory_cost,
+            parallelism=parallelism
+        )
+        _hashers[params] = hasher
+    return hasher
+
+
+def _hash(password: str, params: tuple[int, int, int]) -> str:
+    return _get_hasher(params).hash(password)
+
+
+def _warm(params: tuple[int, int, int]) -> None:
+    _get_hasher(params)
+
+
+def _verify(
+    hashed_password: str,
+    plain_password: str,
+    params: tuple[int, int, int]
+) -> tuple[bool, bool]:
+    from argon2.exceptions import InvalidHashError, VerificationError
+
+    hasher = _get_hasher(params)
+    try:
+        hasher.verify(hashed_password, plain_password)
+    except (VerificationError, InvalidHashError):
+        return False, False
+    return True, hasher.check_needs_rehash(hashed_password)
+
+
+class PasswordHashPool:
+    """Argon2 해싱/검증 전용 프로세스 풀
+
+    해싱은 수십 ms의 CPU와 메모리를 쓰므로 GIL을 피해 별도 프로세스에서 실행하고,
+    동시에 대기/실행 중인 작업 수를 max_pending으로 제한한다. 자리가 나지 않으면
+    queue_timeout 후 ServiceUnavailableException(503)으로 거절해 회원가입/로그인
+    폭주가 다른 엔드포인트의 스레드를 잡아두지 않게 한다.
+    """
+
+    def __init__(self, workers: int, max_pending: int, queue_timeout: float):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor: ProcessPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._pending = 0
+        self._completed = 0
+        self._rejected = 0
+        self._total_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                # 멀티스레드 서버 프로세스에서 fork는 안전하지 않으므로 spawn 사용
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def submit(self, fn, *args) -> Future:
+        """해싱 작업 제출
+
+        Raises:
+            ServiceUnavailableException: queue_timeout 동안 자리가 나지 않은 경우
+        """
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            with self._stats_lock:
+                self._rejected += 1
+            raise ServiceUnavailableException("비밀번호 처리 요청이 많습니다. 잠시 후 다시 시도해주세요")
+
+        started = time.perf_counter()
+        with self._stats_lock:
+            self._pending += 1
+
+        if self.workers > 0:
+            try:
+                future = self._get_executor().submit(fn, *args)
+            except Exception:
+                self._release(started)
+                raise
+        else:
+            # 워커 0개: 호출 스레드에서 바로 실행 (개발/테스트용)
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+
+        future.add_done_callback(lambda _: self._release(started))
+        return future
+
+    def _release(self, started: float) -> None:
+        with self._stats_lock:
+            self._pending -= 1
+            self._completed += 1
+            self._total_seconds += time.perf_counter() - started
+        self._slots.release()
+
+    def stats(self) -> dict:
+        """큐 깊이 등 풀 상태
+
+        Returns:
+            dict: workers, pending(대기+실행), queued(대기), completed, rejected, avg_ms
+        """
+        with self._stats_lock:
+            return {
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "queued": max(0, self._pending - max(self.workers, 1)),
+                "completed": self._completed,
+                "rejected": self._rejected,
+                "avg_ms": round(self._total_seconds / self._completed * 1000, 2) if self._completed else 0.0,
+            }
+
+    def warm(self) -> None:
+        """워커 프로세스를 미리 띄우고 PasswordHasher를 만들어 둠 (준비될 때까지 대기)
+
+        spawn 방식 워커는 시작에 수백 ms의 CPU를 쓰므로, 첫 로그인/회원가입 요청이나
+        요청 처리와 겹치지 않도록 시작 시점에 띄운다.
+        """
+        if self.workers <= 0:
+            return
+        executor = self._get_executor()
+        futures = [executor.submit(_warm, HASH_PARAMS) for _ in range(self.workers)]
+        wait(futures)
+
+    def shutdown(self) -> None:
+        """워커 프로세스 종료"""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+                self._executor = None
+
+
+hash_pool = PasswordHashPool(
+    workers=settings.password_hash_workers,
+    max_pending=settings.password_hash_max_pending,
+    queue_timeout=settings.password_hash_queue_timeout
+)
 
 
 def hash_password(password: str) -> str:
@@ -13,7 +210,7 @@ def hash_password(password: str) -> str:
     Returns:
         str: 해싱된 비밀번호
     """
-    return ph.hash(password)
+    return hash_pool.submit(_hash, password, HASH_PARAMS).result()
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -26,8 +223,37 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     Returns:
         bool: 비밀번호 일치 여부
     """
-    try:
-        ph.verify(hashed_password, plain_password)
-        return True
-    except VerifyMismatchError:
-        return False
+    return verify_password_and_check_rehash(plain_password, hashed_password)[0]
+
+
+def verify_password_and_check_rehash(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, bool]:
+    """비밀번호 검증 및 재해싱 필요 여부 확인
+
+    Args:
+        plain_password (str): 평문 비밀번호
+        hashed_password (str): 해싱된 비밀번호
+
+    Returns:
+        tuple[bool, bool]: (일치 여부, 현재 비용 프로필로 재해싱이 필요한지 여부)
+    """
+    return hash_pool.submit(_verify, hashed_password, plain_password, HASH_PARAMS).result()
+
+
+async def hash_password_async(password: str) -> str:
+    """비밀번호 해싱 (async, 이벤트 루프를 막지 않음)"""
+    future = await asyncio.to_thread(hash_pool.submit, _hash, password, HASH_PARAMS)
+    return await asyncio.wrap_future(future)
+
+
+async def verify_password_and_check_rehash_async(
+    plain_password: str,
+    hashed_password: str
+) -> tuple[bool, bool]:
+    """비밀번호 검증 및 재해싱 필요 여부 확인 (async, 이벤트 루프를 막지 않음)"""
+    future = await asyncio.to_thread(
+        hash_pool.submit, _verify, hashed_password, plain_password, HASH_PARAMS
+    )
+    return await asyncio.wrap_future(future)
@@ -0,0 +1,49 @@
+from collections.abc import Iterable, Sequence
+
+import orjson
+from fastapi import Response
+from pydantic import BaseModel
+
+
+def schema_fields(schema: type[BaseModel]) -> tuple[str, ...]:
+    """응답 스키마의 필드 이름 (선언 순서)"""
+    return tuple(schema.model_fields)
+
+
+def schema_columns(model, schema: type[BaseModel], *extra) -> list:
+    """응답 스키마 필드 순서대로 나열한 모델 컬럼
+
+    ORM 객체를 만들지 않고 필요한 컬럼만 튜플로 가져오기 위해 사용한다.
+    extra 컬럼(ETag 계산용 updated_at 등)은 뒤에 붙으므로 dump_rows에서 잘려 나간다.
+
+    Args:
+        model: SQLAlchemy 모델 클래스
+        schema (type[BaseModel]): 응답 스키마 (모든 필드가 같은 이름의 컬럼이어야 함)
+        *extra: 응답에는 포함하지 않지만 함께 조회할 컬럼
+
+    Returns:
+        list: SELECT에 넘길 컬럼 목록
+    """
+    table = model.__table__
+    return [table.c[name] for name in schema_fields(schema)] + list(extra)
+
+
+def dump_rows(rows: Iterable[Sequence], fields: Sequence[str]) -> bytes:
+    """컬럼 튜플 행을 JSON 배열 바이트로 직렬화 (Pydantic 검증 생략)
+
+    DB 제약(NOT NULL, 타입)이 스키마와 같은 신뢰할 수 있는 데이터에만 사용한다.
+    datetime은 Pydantic과 같은 ISO 8601 형식으로 출력된다.
+
+    Args:
+        rows (Iterable[Sequence]): schema_columns 순서로 조회한 행
+        fields (Sequence[str]): 출력할 필드 이름 (행의 앞쪽 컬럼과 순서가 같아야 함)
+
+    Returns:
+        bytes: JSON 배열
+    """
+    return orjson.dumps([dict(zip(fields, row)) for row in rows])
+
+
+def json_response(body: bytes, headers: dict[str, str] | None = None) -> Response:
+    """미리 직렬화한 JSON 본문으로 응답 생성 (response_model 검증/직렬화를 거치지 않음)"""
+    return Response(content=body, media_type="application/json", headers=headers)
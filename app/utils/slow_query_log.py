@@ -0,0 +1,166 @@
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime
+
+from sqlalchemy import create_engine, event, pool
+from sqlalchemy.engine import Engine
+
+from app.config import settings
+from app.database import apply_sqlite_pragmas, connect_args
+
+CONTROLLERS_DIR = os.path.join("app", "controllers") + os.sep
+EXPLAINABLE_PREFIXES = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def _parameter_shape(parameters) -> list[str] | dict[str, str]:
+    """바인딩 값 대신 타입 이름만 남김 (로그에 비밀번호 해시 등 값이 남지 않도록)"""
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    return [type(value).__name__ for value in parameters or ()]
+
+
+def _caller() -> str | None:
+    """SQL을 실행한 컨트롤러 메서드 (예: PostController.get_posts)
+
+    호출 스택에서 app/controllers/ 아래의 프레임 중 가장 바깥(라우터에 가까운) 메서드를 고른다.
+    async 컨트롤러는 run_sync로 넘긴 동기 컨트롤러 메서드가 기록된다.
+    """
+    frame = sys._getframe(2)
+    found = None
+    while frame is not None:
+        code = frame.f_code
+        if CONTROLLERS_DIR in code.co_filename and "<" not in code.co_qualname:
+            found = code.co_qualname
+        frame = frame.f_back
+    return found
+
+
+class SlowQueryLog:
+    """임계 시간을 넘은 SQL을 JSON Lines 파일로 기록하는 슬로 쿼리 로그
+
+    요청 스레드에서는 실행 시간 측정과 큐 적재만 하고, EXPLAIN QUERY PLAN 수집과 파일 쓰기는
+    백그라운드 스레드가 별도의 읽기 전용 커넥션으로 처리한다. 같은 문장의 실행 계획은 캐시해
+    반복해서 EXPLAIN하지 않는다.
+    """
+
+    def __init__(self, threshold_ms: float, path: str, explain: bool = True, max_pending: int = 10000):
+        self.threshold = threshold_ms / 1000
+        self.path = path
+        self.explain = explain
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._plans: OrderedDict[str, list[str]] = OrderedDict()
+        self._explain_engine = None
+        self._thread: threading.Thread | None = None
+        self.dropped = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.threshold > 0
+
+    def install(self) -> None:
+        """모든 엔진의 커서 실행 전후에 측정 리스너 등록"""
+        if not event.contains(Engine, "after_cursor_execute", self._after_cursor_execute):
+            event.listen(Engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # 문장별 실행 컨텍스트에 기록 (실패한 문장은 after_cursor_execute가 호출되지 않음)
+        if context is not None:
+            context._slow_query_started_at = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = getattr(context, "_slow_query_started_at", None)
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+        if duration < self.threshold or conn.engine is self._explain_engine:
+            return
+
+        entry = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "duration_ms": round(duration * 1000, 3),
+            "statement": statement,
+            "params": _parameter_shape(parameters[0] if executemany and parameters else parameters),
+            "executemany": executemany,
+            "rows": len(parameters) if executemany else cursor.rowcount,
+            "caller": _caller(),
+            "dialect": conn.dialect.name,
+        }
+        try:
+            # 실행 계획 수집용 바인딩 값은 큐에만 두고 로그에는 쓰지 않음
+            self._queue.put_nowait((entry, parameters[0] if executemany and parameters else parameters))
+        except queue.Full:
+            self.dropped += 1
+
+    def start(self) -> None:
+        """기록 스레드 시작"""
+        if self._thread is not None or not self.enabled:
+            return
+        self._thread = threading.Thread(target=self._run, name="slow-query-log", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """남은 항목을 기록하고 기록 스레드 종료"""
+        if self._thread is None:
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+        if self._explain_engine is not None:
+            self._explain_engine.dispose()
+            self._explain_engine = None
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as log_file:
+            while (item := self._queue.get()) is not None:
+                entry, parameters = item
+                if self.explain:
+                    entry["plan"] = self._plan(entry, parameters)
+                log_file.write(json.dumps(entry, ensure_ascii=False) + "\n")
+                if self._queue.empty():
+                    log_file.flush()
+
+    def _plan(self, entry: dict, parameters) -> list[str] | None:
+        """EXPLAIN QUERY PLAN 결과 (SQLite 이외이거나 실패하면 None)"""
+        statement = entry["statement"]
+        if entry["dialect"] != "sqlite" or not statement.lstrip().upper().startswith(EXPLAINABLE_PREFIXES):
+            return None
+        if statement in self._plans:
+            self._plans.move_to_end(statement)
+            return self._plans[statement]
+
+        try:
+            with self._side_engine().connect() as connection:
+                rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        except Exception as exc:
+            entry["plan_error"] = str(exc)
+            return None
+
+        plan = [row[-1] for row in rows]
+        self._plans[statement] = plan
+        if len(self._plans) > 256:
+            self._plans.popitem(last=False)
+        return plan
+
+    def _side_engine(self):
+        # 요청 풀과 분리된 읽기 전용 커넥션 하나 (기록 스레드에서만 사용)
+        if self._explain_engine is None:
+            url = settings.read_database_url
+            self._explain_engine = create_engine(url, poolclass=pool.StaticPool, connect_args=connect_args(url))
+            event.listen(
+                self._explain_engine, "connect",
+                lambda dbapi_conn, record: apply_sqlite_pragmas(dbapi_conn, read_only=True)
+            )
+        return self._explain_engine
+
+
+slow_query_log = SlowQueryLog(
+    threshold_ms=settings.slow_query_ms,
+    path=settings.slow_query_log_path,
+    explain=settings.slow_query_explain
+)
@@ -0,0 +1,156 @@
+import logging
+import threading
+
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.config import settings
+from app.database import engine
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCountBuffer:
+    """게시글 조회수 write-behind 버퍼
+
+    상세 조회 시 DB에 바로 쓰지 않고 메모리에 증가분을 모아 두었다가
+    주기(flush_interval) 또는 누적 임계치(flush_threshold)에 도달하면
+    게시글별 `view_count = view_count + ?` UPDATE 한 번으로 일괄 반영한다.
+    """
+
+    def __init__(self, flush_interval: float, flush_threshold: int):
+        self.flush_interval = flush_interval
+        self.flush_threshold = flush_threshold
+        self._pending: dict[int, int] = {}
+        # 반영 중(커밋 전)인 증가분도 응답에 보이도록 따로 보관
+        self._inflight: dict[int, int] = {}
+        self._total = 0
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def increment(self, post_id: int) -> None:
+        """조회수 1 증가 (메모리에만 누적)
+
+        Args:
+            post_id (int): 게시글 ID
+        """
+        with self._lock:
+            self._pending[post_id] = self._pending.get(post_id, 0) + 1
+            self._total += 1
+            if self._total >= self.flush_threshold:
+                self._wakeup.set()
+
+    def pending(self, post_id: int) -> int:
+        """아직 DB에 반영되지 않은 조회수 증가분
+
+        Args:
+            post_id (int): 게시글 ID
+
+        Returns:
+            int: 버퍼에 남아 있는 증가분
+        """
+        with self._lock:
+            return self._pending.get(post_id, 0) + self._inflight.get(post_id, 0)
+
+    def apply(self, posts: list) -> None:
+        """게시글 객체의 view_count에 버퍼 증가분을 더함
+
+        set_committed_value를 사용하므로 세션이 변경으로 인식하지 않아
+        이후 커밋에서 view_count가 덮어써지지 않는다.
+
+        Args:
+            posts (list): Post ORM 객체 리스트
+        """
+        for post in posts:
+            buffered = self.pending(post.id)
+            if buffered:
+                set_committed_value(post, "view_count", post.view_count + buffered)
+
+    def apply_rows(self, rows: list[dict]) -> None:
+        """게시글 dict 행의 view_count에 버퍼 증가분을 더함 (목록 빠른 경로용)
+
+        Args:
+            rows (list[dict]): id, view_count 키를 가진 게시글 dict 리스트
+        """
+        for row in rows:
+            buffered = self.pending(row["id"])
+            if buffered:
+                row["view_count"] += buffered
+
+    def flush(self) -> int:
+        """버퍼에 쌓인 증가분을 DB에 일괄 반영
+
+        Returns:
+            int: 반영된 게시글 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._inflight = batch
+                self._total = 0
+
+            if not batch:
+                return 0
+
+            try:
+                with engine.begin() as conn:
+                    conn.execute(
+                        text(
+                            "UPDATE posts SET view_count = view_count + :delta "
+                            "WHERE id = :post_id"
+                        ),
+                        [
+                            {"post_id": post_id, "delta": delta}
+                            for post_id, delta in batch.items()
+                        ]
+                    )
+            except SQLAlchemyError:
+                logger.exception("조회수 반영 실패, 다음 주기에 재시도합니다")
+                # 실패한 증가분은 버퍼로 되돌림
+                with self._lock:
+                    for post_id, delta in batch.items():
+                        self._pending[post_id] = self._pending.get(post_id, 0) + delta
+                        self._total += delta
+                    self._inflight = {}
+                return 0
+
+            with self._lock:
+                self._inflight = {}
+            return len(batch)
+
+    def start(self) -> None:
+        """백그라운드 flush 스레드 시작"""
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            name="view-count-flusher",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """flush 스레드 종료 후 남은 증가분을 모두 반영"""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stopped.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            self.flush()
+
+
+view_counter = ViewCountBuffer(
+    flush_interval=settings.view_count_flush_interval,
+    flush_threshold=settings.view_count_flush_threshold
+)
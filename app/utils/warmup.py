@@ -0,0 +1,139 @@
+import logging
+import time
+from contextlib import AsyncExitStack, ExitStack
+from datetime import datetime
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, configure_mappers
+
+from app.config import settings
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.models.user_model import Users
+from app.controllers.post_controller import PostController
+from app.controllers.comment_controller import CommentController
+from app.controllers.user_controller import UserController
+from app.controllers.auth_controller import AuthController
+from app.exceptions import AppException
+from app.utils.pagination import encode_cursor
+
+logger = logging.getLogger(__name__)
+
+
+def _warm_count(target_pool, connections: int) -> int:
+    # QueuePool만 여러 커넥션을 보관함 (StaticPool/SingletonThreadPool은 1개, NullPool은 보관하지 않음)
+    size = getattr(target_pool, "size", None)
+    return min(connections, size()) if callable(size) else min(connections, 1)
+
+
+def warm_pool(target_engine, connections: int) -> int:
+    """커넥션을 동시에 열었다가 반환해 풀에 채워 둠 (connect 이벤트의 PRAGMA 적용 포함)
+
+    Args:
+        target_engine: 동기 엔진
+        connections (int): 열어 둘 커넥션 수 (풀 크기를 넘지 않음)
+
+    Returns:
+        int: 연 커넥션 수
+    """
+    count = _warm_count(target_engine.pool, connections)
+    with ExitStack() as stack:
+        for _ in range(count):
+            stack.enter_context(target_engine.connect())
+    return count
+
+
+async def warm_pool_async(target_engine, connections: int) -> int:
+    """warm_pool의 async 엔진 버전"""
+    count = _warm_count(target_engine.sync_engine.pool, connections)
+    async with AsyncExitStack() as stack:
+        for _ in range(count):
+            await stack.enter_async_context(target_engine.connect())
+    return count
+
+
+def warm_queries(db: Session) -> int:
+    """읽기 요청 경로의 컨트롤러 쿼리를 한 번씩 실행해 엔진의 SQL 컴파일 캐시를 채움
+
+    SQLAlchemy는 엔진마다 컴파일 결과를 캐시하므로 요청에 쓰이는 엔진마다 실행해야 한다.
+    데이터가 없으면 존재하지 않는 ID로 실행해도 같은 SQL이 컴파일된다. 쓰기 쿼리는 실행하지 않는다.
+
+    Args:
+        db (Session): 워밍업할 엔진에 연결된 세션
+
+    Returns:
+        int: 실행한 컨트롤러 호출 수
+    """
+    post_id = db.query(Post.id).order_by(Post.id.desc()).limit(1).scalar() or 0
+    comment_id = db.query(Comment.id).order_by(Comment.id.desc()).limit(1).scalar() or 0
+    user = db.query(Users.id, Users.email).order_by(Users.id).first()
+    user_id, email = user if user else (0, "warmup@example.com")
+    cursor = encode_cursor(datetime.now(), 0)
+    limit = settings.post_detail_comment_limit
+
+    posts = PostController(db)
+    comments = CommentController(db)
+    calls = [
+        lambda: posts.get_post_rows(0, 10),
+        lambda: posts.get_post_rows(0, 10, cursor),
+        lambda: posts.get_post_detail(post_id, limit, increment_view=False),
+        lambda: comments.get_comment_rows_by_post(post_id, 0, 10),
+        lambda: comments.get_comment_rows_by_post(post_id, 0, 10, cursor),
+        lambda: comments.get_comment_by_id(comment_id),
+        lambda: UserController(db).get_user_by_id(user_id),
+        lambda: AuthController(db).get_user_by_email(email),
+    ]
+    for call in calls:
+        try:
+            call()
+        except AppException:
+            pass
+    db.rollback()
+    return len(calls)
+
+
+def warm_up() -> None:
+    """동기 모드 워밍업: 매퍼 구성, 쓰기/읽기 엔진의 커넥션 풀과 컴파일 캐시
+
+    실패해도 서버 시작을 막지 않고 경고만 남긴다 (첫 요청에서 평소처럼 연결/컴파일).
+    """
+    from app.database import engine, read_engine, SessionLocal, ReadSessionLocal
+
+    started = time.perf_counter()
+    configure_mappers()
+    for name, target_engine, session_factory in (
+        ("write", engine, SessionLocal),
+        ("read", read_engine, ReadSessionLocal),
+    ):
+        try:
+            connections = warm_pool(target_engine, settings.startup_warm_connections)
+            with session_factory() as db:
+                calls = warm_queries(db)
+        except SQLAlchemyError as exc:
+            logger.warning("Startup warmup failed (%s engine): %s", name, exc)
+            continue
+        logger.debug("Warmed %s engine: %d connections, %d controller calls", name, connections, calls)
+    logger.info("Startup warmup finished in %.1f ms", (time.perf_counter() - started) * 1000)
+
+
+async def warm_up_async() -> None:
+    """async 모드 워밍업: 매퍼 구성, async 쓰기/읽기 엔진의 커넥션 풀과 컴파일 캐시"""
+    from app.async_database import (
+        async_engine, async_read_engine, AsyncSessionLocal, AsyncReadSessionLocal
+    )
+
+    started = time.perf_counter()
+    configure_mappers()
+    for name, target_engine, session_factory in (
+        ("async_write", async_engine, AsyncSessionLocal),
+        ("async_read", async_read_engine, AsyncReadSessionLocal),
+    ):
+        try:
+            connections = await warm_pool_async(target_engine, settings.startup_warm_connections)
+            async with session_factory() as db:
+                calls = await db.run_sync(warm_queries)
+        except SQLAlchemyError as exc:
+            logger.warning("Startup warmup failed (%s engine): %s", name, exc)
+            continue
+        logger.debug("Warmed %s engine: %d connections, %d controller calls", name, connections, calls)
+    logger.info("Startup warmup finished in %.1f ms", (time.perf_counter() - started) * 1000)
@@ -0,0 +1,330 @@
+import asyncio
+import contextvars
+import functools
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from sqlalchemy import create_engine, event, pool
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.util import await_only
+from sqlalchemy.util.concurrency import in_greenlet
+
+from app.config import settings
+from app.database import apply_sqlite_pragmas, connect_args
+from app.exceptions import DatabaseException, ServiceUnavailableException
+from app.utils.db_utils import AFTER_COMMIT
+
+logger = logging.getLogger(__name__)
+
+# writer 세션 표시 (Session.info 키, 이 세션에서는 write_operation을 다시 큐에 넣지 않고 바로 실행)
+WRITER_SESSION = "write_coordinator"
+
+
+class WriteCoordinator:
+    """SQLite 쓰기 전용 단일 writer와 group commit
+
+    SQLite는 DB 단위 쓰기 잠금이라 요청 스레드마다 따로 commit하면 잠금 경합(busy_timeout 대기)과
+    commit마다의 fsync가 동시 요청 수만큼 쌓인다. write_operation으로 표시한 컨트롤러 메서드는
+    요청 스레드 대신 전용 writer 스레드의 커넥션 하나에서 차례로 실행하고, 대기 중인 쓰기를
+    최대 max_batch개(첫 쓰기 후 최대 max_wait 초 동안 모은 만큼) 한 트랜잭션으로 묶어 commit한다.
+
+    - 각 쓰기는 SAVEPOINT 안에서 실행하므로 한 쓰기의 실패(권한 오류, 제약 조건 위반 등)는 그 쓰기만
+      되돌리고 호출한 요청에만 예외로 전달된다
+    - commit 자체가 실패하면 묶음 전체가 되돌아가므로 묶음의 모든 쓰기가 DatabaseException으로 실패한다
+    - 캐시 무효화 등 commit 이후 작업(db_utils.after_commit)은 묶음이 commit된 뒤에 실행한다
+    - 대기열(max_pending)이 가득 차면 queue_timeout 후 ServiceUnavailableException(503)으로 거절한다
+    - 결과가 timeout 안에 오지 않으면 ServiceUnavailableException(503)으로 실패한다
+    - writer 스레드가 비정상 종료되면 대기 중인 쓰기를 모두 DatabaseException으로 실패시키고
+      running을 False로 돌려 이후 쓰기는 write_operation이 요청 세션에서 바로 실행한다
+    """
+
+    def __init__(
+        self,
+        max_batch: int,
+        max_wait_ms: float,
+        max_pending: int,
+        queue_timeout: float,
+        timeout: float
+    ):
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max_wait_ms / 1000
+        self.max_pending = max_pending
+        self.queue_timeout = queue_timeout
+        self.timeout = timeout
+        self._queue: queue.Queue = queue.Queue(maxsize=max_pending)
+        self._engine = None
+        self._thread: threading.Thread | None = None
+        self._stats_lock = threading.Lock()
+        self._groups = 0
+        self._writes = 0
+        self._max_group = 0
+        self._failed_commits = 0
+        self._rejected = 0
+        self._timed_out = 0
+        self._commit_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None
+
+    def start(self) -> None:
+        """writer 커넥션을 열고 writer 스레드 시작"""
+        if self._thread is not None:
+            return
+        if self._engine is None:
+            self._engine = self._create_engine()
+        self._thread = threading.Thread(target=self._run, name="write-coordinator", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """대기 중인 쓰기를 모두 처리하고 writer 스레드 종료"""
+        thread = self._thread
+        if thread is not None:
+            self._queue.put(None)
+            thread.join()
+            self._thread = None
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+
+    def submit(self, fn) -> Future:
+        """쓰기 작업 제출
+
+        fn은 writer 세션을 받아 실행되며, 호출한 스레드의 컨텍스트(ContextVar)를 그대로 사용한다.
+
+        Args:
+            fn: Session을 인자로 받는 함수
+
+        Returns:
+            Future: fn의 반환값 또는 예외
+
+        Raises:
+            ServiceUnavailableException: 대기열이 가득 차 자리가 나지 않은 경우
+        """
+        future: Future = Future()
+        item = (fn, contextvars.copy_context(), future)
+        try:
+            if in_greenlet():
+                # 이벤트 루프 스레드(AsyncSession.run_sync 안)에서는 기다리지 않고 바로 거절
+                self._queue.put_nowait(item)
+            else:
+                self._queue.put(item, timeout=self.queue_timeout)
+        except queue.Full:
+            with self._stats_lock:
+                self._rejected += 1
+            raise ServiceUnavailableException("쓰기 요청이 많습니다. 잠시 후 다시 시도해주세요")
+        return future
+
+    def execute(self, fn):
+        """쓰기 작업을 제출하고 결과를 기다림
+
+        AsyncSession.run_sync 안(greenlet)에서 호출되면 이벤트 루프를 막지 않고 기다린다.
+        제한 시간이 지나면 아직 시작하지 않은 쓰기는 취소하고, 이미 실행 중인 쓰기는
+        그대로 commit될 수 있다.
+
+        Args:
+            fn: Session을 인자로 받는 함수
+
+        Returns:
+            fn의 반환값 (fn이 던진 예외는 그대로 다시 발생)
+
+        Raises:
+            ServiceUnavailableException: 대기열이 가득 찼거나 timeout 안에 결과가 오지 않은 경우
+        """
+        future = self.submit(fn)
+        try:
+            if in_greenlet():
+                # wait_for가 시간 초과로 asyncio 쪽 future를 취소하면 원래 future에도 취소가 전달됨
+                return await_only(asyncio.wait_for(asyncio.wrap_future(future), self.timeout))
+            return future.result(timeout=self.timeout)
+        except (FutureTimeoutError, asyncio.TimeoutError):
+            future.cancel()
+            with self._stats_lock:
+                self._timed_out += 1
+            raise ServiceUnavailableException("쓰기 처리가 지연되고 있습니다. 잠시 후 다시 시도해주세요")
+
+    def stats(self) -> dict:
+        """묶음 commit 통계
+
+        Returns:
+            dict: running, pending(대기 중인 쓰기), groups(commit 수), writes, avg_group, max_group,
+                failed_commits, rejected, timed_out, avg_commit_ms
+        """
+        with self._stats_lock:
+            return {
+                "running": self.running,
+                "max_batch": self.max_batch,
+                "max_wait_ms": self.max_wait * 1000,
+                "pending": self._queue.qsize(),
+                "groups": self._groups,
+                "writes": self._writes,
+                "avg_group": round(self._writes / self._groups, 2) if self._groups else 0.0,
+                "max_group": self._max_group,
+                "failed_commits": self._failed_commits,
+                "rejected": self._rejected,
+                "timed_out": self._timed_out,
+                "avg_commit_ms": round(self._commit_seconds / self._groups * 1000, 3) if self._groups else 0.0,
+            }
+
+    def _create_engine(self):
+        # 요청 풀과 분리된 쓰기 커넥션 하나 (writer 스레드에서만 사용)
+        url = settings.database_url
+        writer_engine = create_engine(url, poolclass=pool.StaticPool, connect_args=connect_args(url))
+        if writer_engine.dialect.name == "sqlite":
+            @event.listens_for(writer_engine, "connect")
+            def set_sqlite_pragma(dbapi_conn, connection_record):
+                apply_sqlite_pragmas(dbapi_conn)
+                # pysqlite의 자동 BEGIN을 끄고 SQLAlchemy가 BEGIN/SAVEPOINT를 직접 내보냄
+                dbapi_conn.isolation_level = None
+
+            @event.listens_for(writer_engine, "begin")
+            def begin_immediate(conn):
+                # 묶음 시작 시 쓰기 잠금을 바로 잡아 중간에 다른 writer와 경합해 실패하지 않도록 함
+                conn.exec_driver_sql("BEGIN IMMEDIATE")
+        return writer_engine
+
+    def _run(self) -> None:
+        batch: list = []
+        try:
+            self._process(batch)
+        except Exception as exc:
+            logger.exception("Write coordinator stopped unexpectedly")
+            # 새 쓰기는 write_operation이 요청 세션에서 바로 실행하고, 남은 쓰기는 모두 실패시킴
+            self._thread = None
+            self._fail(batch + self._drain(), exc)
+
+    def _process(self, batch: list) -> None:
+        """쓰기 루프 (batch는 처리 중인 묶음, 비정상 종료 시 _run이 실패 처리)"""
+        with self._engine.connect() as connection:
+            while (item := self._queue.get()) is not None:
+                batch[:] = [item]
+                stopping = False
+                try:
+                    transaction = connection.begin()
+                except SQLAlchemyError as exc:
+                    logger.exception("Write group could not begin")
+                    self._fail(batch, exc)
+                    continue
+
+                results = [self._run_item(connection, item)]
+                deadline = time.perf_counter() + self.max_wait
+                while len(batch) < self.max_batch:
+                    timeout = deadline - time.perf_counter()
+                    try:
+                        item = self._queue.get(timeout=timeout) if timeout > 0 else self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+                    if item is None:
+                        stopping = True
+                        break
+                    batch.append(item)
+                    results.append(self._run_item(connection, item))
+
+                started = time.perf_counter()
+                try:
+                    transaction.commit()
+                except SQLAlchemyError as exc:
+                    logger.exception("Group commit of %d writes failed", len(batch))
+                    try:
+                        transaction.rollback()
+                    except SQLAlchemyError:
+                        logger.exception("Rollback after failed group commit failed")
+                    with self._stats_lock:
+                        self._failed_commits += 1
+                    self._fail(batch, exc, results)
+                else:
+                    self._record(len(batch), time.perf_counter() - started)
+                    self._resolve(batch, results)
+                if stopping:
+                    break
+
+    def _run_item(self, connection, item) -> tuple:
+        """쓰기 하나를 SAVEPOINT 안에서 실행
+
+        Returns:
+            tuple: (반환값, 예외, commit 이후 작업 목록)
+        """
+        fn, context, future = item
+        if not future.set_running_or_notify_cancel():
+            return None, None, []
+        db = Session(
+            bind=connection,
+            autoflush=False,
+            expire_on_commit=False,
+            join_transaction_mode="create_savepoint",
+            info={WRITER_SESSION: True, AFTER_COMMIT: []}
+        )
+        try:
+            return context.run(fn, db), None, db.info[AFTER_COMMIT]
+        except Exception as exc:
+            return None, exc, []
+        finally:
+            # 열린 SAVEPOINT(실패했거나 commit 이후 조회로 시작된 것)만 되돌리고 바깥 트랜잭션은 유지
+            db.close()
+
+    def _resolve(self, batch: list, results: list) -> None:
+        for (_, context, future), (result, exc, callbacks) in zip(batch, results):
+            if future.done():
+                continue
+            for callback in callbacks:
+                try:
+                    context.run(callback)
+                except Exception:
+                    logger.exception("After-commit callback failed")
+            if exc is not None:
+                future.set_exception(exc)
+            else:
+                future.set_result(result)
+
+    def _fail(self, batch: list, error: Exception, results: list | None = None) -> None:
+        for index, (_, _, future) in enumerate(batch):
+            if future.done():
+                continue
+            own_error = results[index][1] if results else None
+            future.set_exception(own_error or DatabaseException(f"데이터베이스 오류가 발생했습니다: {error}"))
+
+    def _drain(self) -> list:
+        items = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                return items
+            if item is not None:
+                items.append(item)
+
+    def _record(self, size: int, seconds: float) -> None:
+        with self._stats_lock:
+            self._groups += 1
+            self._writes += size
+            self._max_group = max(self._max_group, size)
+            self._commit_seconds += seconds
+
+
+write_coordinator = WriteCoordinator(
+    max_batch=settings.write_coordinator_max_batch,
+    max_wait_ms=settings.write_coordinator_max_wait_ms,
+    max_pending=settings.write_coordinator_max_pending,
+    queue_timeout=settings.db_pool_timeout,
+    timeout=settings.write_coordinator_timeout
+)
+
+
+def write_operation(method):
+    """컨트롤러의 쓰기 메서드를 WriteCoordinator의 writer 세션에서 실행하도록 하는 데코레이터
+
+    코디네이터가 꺼져 있거나 이미 writer 세션에서 실행 중이면(쓰기 메서드가 다른 쓰기 메서드를
+    호출하는 경우) 원래 세션으로 바로 실행한다. 컨트롤러는 `Controller(db)`로 만들 수 있어야 한다.
+    반환된 ORM 객체는 writer 세션에서 분리(detached)된 상태이므로 미리 읽어 둔 속성만 쓸 수 있다.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if not write_coordinator.running or self.db.info.get(WRITER_SESSION):
+            return method(self, *args, **kwargs)
+        controller_class = type(self)
+        return write_coordinator.execute(lambda db: method(controller_class(db), *args, **kwargs))
+    return wrapper
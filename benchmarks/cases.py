@@ -0,0 +1,168 @@
+"""데이터셋 하나에 대한 컨트롤러/라우터 벤치마크 (run.py가 데이터셋마다 별도 프로세스로 실행)
+
+엔진과 설정은 import 시점의 환경 변수(DATABASE_URL 등)로 만들어지므로, run.py가 데이터셋별
+환경 변수를 지정해 이 모듈을 새 프로세스로 실행하고 결과 JSON을 stdout으로 받는다.
+
+Usage (직접 실행 시):
+    DATABASE_URL=sqlite:///benchmarks/.data/<name>.db POST_LIST_CACHE_TTL=0 \\
+        python -m benchmarks.cases '{"rounds": 50, "max_seconds": 5}'
+"""
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+import main
+from app.database import ReadSessionLocal, SessionLocal
+from app.models.user_model import Users
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.controllers.post_controller import PostController
+from app.controllers.comment_controller import CommentController
+from app.controllers.user_controller import UserController
+from app.controllers.auth_controller import AuthController
+from app.utils.pagination import encode_cursor
+from benchmarks.datasets import BENCH_PASSWORD
+
+
+def measure(call: Callable[[], object], rounds: int, max_seconds: float, warmup: int = 2) -> dict:
+    """call을 rounds번(또는 max_seconds까지, 최소 3번) 실행한 시간 통계(ms)"""
+    for _ in range(warmup):
+        call()
+
+    timings = []
+    deadline = time.perf_counter() + max_seconds
+    while len(timings) < rounds and (len(timings) < 3 or time.perf_counter() < deadline):
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    return {
+        "rounds": len(timings),
+        "min_ms": timings[0],
+        "median_ms": statistics.median(timings),
+        "mean_ms": statistics.fmean(timings),
+        "p95_ms": timings[max(0, int(len(timings) * 0.95) - 1)],
+        "max_ms": timings[-1],
+    }
+
+
+def dataset_fixtures() -> dict:
+    """데이터셋 크기와 측정에 쓸 ID (댓글이 가장 많은 게시글, 중간 위치 커서 등)"""
+    with ReadSessionLocal() as db:
+        posts = db.scalar(select(func.count(Post.id)))
+        hot_post_id, hot_comments = db.execute(
+            select(Post.id, Post.comment_count).order_by(Post.comment_count.desc()).limit(1)
+        ).one()
+        middle = db.execute(
+            select(Post.created_at, Post.id)
+            .order_by(Post.created_at.desc(), Post.id.desc())
+            .offset(posts // 2)
+            .limit(1)
+        ).one()
+        email = db.scalar(
+            select(Users.email).where(Users.email.like("bench%")).order_by(Users.id).limit(1)
+        )
+        return {
+            "posts": posts,
+            "users": db.scalar(select(func.count(Users.id))),
+            "comments": db.scalar(select(func.count(Comment.id))),
+            "hot_post_id": hot_post_id,
+            "hot_post_comments": hot_comments,
+            "middle_offset": posts // 2,
+            "middle_cursor": encode_cursor(middle.created_at, middle.id),
+            "login_email": email,
+        }
+
+
+def session_call(factory, call: Callable) -> Callable[[], object]:
+    """요청마다 새 세션을 여는 것과 같은 조건으로 컨트롤러 호출"""
+    def run():
+        with factory() as db:
+            return call(db)
+    return run
+
+
+def controller_cases(fx: dict) -> list[tuple[str, Callable[[], object]]]:
+    hot, middle, cursor = fx["hot_post_id"], fx["middle_offset"], fx["middle_cursor"]
+    return [
+        ("PostController.get_posts(first)", session_call(ReadSessionLocal, lambda db: PostController(db).get_posts(0, 10))),
+        ("PostController.get_posts(offset=middle)", session_call(ReadSessionLocal, lambda db: PostController(db).get_posts(middle, 10))),
+        ("PostController.get_posts(cursor=middle)", session_call(ReadSessionLocal, lambda db: PostController(db).get_posts(0, 10, cursor))),
+        ("PostController.get_post_rows(first)", session_call(ReadSessionLocal, lambda db: PostController(db).get_post_rows(0, 10))),
+        (
+            "CommentController.get_comments_by_post(hot)",
+            session_call(ReadSessionLocal, lambda db: CommentController(db).get_comments_by_post(hot, 0, 10))
+        ),
+        (
+            "CommentController.get_comments_by_post(hot, offset=middle)",
+            session_call(
+                ReadSessionLocal,
+                lambda db: CommentController(db).get_comments_by_post(hot, fx["hot_post_comments"] // 2, 10)
+            )
+        ),
+        ("UserController.get_users", session_call(ReadSessionLocal, lambda db: UserController(db).get_users())),
+        ("UserController.get_user_rows", session_call(ReadSessionLocal, lambda db: UserController(db).get_user_rows())),
+        (
+            "AuthController.login",
+            session_call(SessionLocal, lambda db: AuthController(db).login(fx["login_email"], BENCH_PASSWORD))
+        ),
+    ]
+
+
+def router_cases(client: TestClient, fx: dict) -> list[tuple[str, Callable[[], object]]]:
+    hot = fx["hot_post_id"]
+
+    def get(path: str, **params) -> Callable[[], object]:
+        def run():
+            response = client.get(path, params=params)
+            response.raise_for_status()
+        return run
+
+    def login():
+        response = client.post(
+            "/auth/login",
+            data={"username": fx["login_email"], "password": BENCH_PASSWORD}
+        )
+        response.raise_for_status()
+
+    return [
+        ("GET /posts/", get("/posts/", limit=10)),
+        ("GET /posts/?skip=middle", get("/posts/", limit=10, skip=fx["middle_offset"])),
+        ("GET /posts/?cursor=middle", get("/posts/", limit=10, cursor=fx["middle_cursor"])),
+        ("GET /posts/{hot}/comments", get(f"/posts/{hot}/comments", limit=10)),
+        ("GET /api/users/", get("/api/users/")),
+        ("POST /auth/login", login),
+    ]
+
+
+def main_cases(options: dict) -> dict:
+    rounds = options.get("rounds", 50)
+    max_seconds = options.get("max_seconds", 5.0)
+    only = options.get("only")
+    fx = dataset_fixtures()
+
+    results = []
+
+    def run(group: str, cases: list[tuple[str, Callable[[], object]]]) -> None:
+        for name, call in cases:
+            if only and not any(token in name for token in only):
+                continue
+            stats = measure(call, rounds, max_seconds)
+            results.append({"group": group, "name": name, **stats})
+            print(f"  [{group}] {name}: median {stats['median_ms']:.2f} ms", file=sys.stderr)
+
+    run("controller", controller_cases(fx))
+    with TestClient(main.app) as client:
+        run("router", router_cases(client, fx))
+
+    return {"dataset": fx, "cases": results}
+
+
+if __name__ == "__main__":
+    print(json.dumps(main_cases(json.loads(sys.argv[1]) if len(sys.argv) > 1 else {})))
@@ -0,0 +1,67 @@
+"""벤치마크용 SQLite 데이터셋 생성
+
+alembic upgrade head로 빈 스키마를 만든 뒤 scripts.generate_data로 회원/게시글/댓글을 채운다.
+같은 스펙(크기, 분포, 시드)의 데이터셋은 benchmarks/.data/에 캐시해 다시 쓰므로
+커밋 간 비교에서 항상 같은 데이터로 측정된다.
+
+생성 회원의 이메일은 bench<ID>@example.com, 비밀번호는 BENCH_PASSWORD이다.
+"""
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+from scripts.generate_data import DataSpec, generate
+
+ROOT = Path(__file__).resolve().parent.parent
+DATA_DIR = Path(__file__).resolve().parent / ".data"
+BENCH_PASSWORD = "Bench123!"
+
+
+@dataclass(frozen=True)
+class DatasetSpec(DataSpec):
+    """데이터셋 크기와 분포 (캐시 파일 이름 포함)"""
+
+    @property
+    def name(self) -> str:
+        return (
+            f"p{self.posts}-u{self.users}-c{self.comments_per_post:g}"
+            f"-cs{self.comment_skew:g}-as{self.author_skew:g}-s{self.seed}"
+        )
+
+
+def _migrate(path: Path) -> None:
+    env = {**os.environ, "DATABASE_URL": f"sqlite:///{path}"}
+    subprocess.run(
+        [sys.executable, "-m", "alembic", "upgrade", "head"],
+        cwd=ROOT,
+        env=env,
+        check=True,
+        capture_output=True
+    )
+
+
+def build_dataset(spec: DatasetSpec, rebuild: bool = False) -> Path:
+    """스펙에 맞는 데이터셋 파일 경로 (없으면 생성)
+
+    Args:
+        spec (DatasetSpec): 데이터셋 크기와 분포
+        rebuild (bool): 캐시된 파일이 있어도 다시 생성
+
+    Returns:
+        Path: SQLite 파일 경로
+    """
+    DATA_DIR.mkdir(parents=True, exist_ok=True)
+    path = DATA_DIR / f"{spec.name}.db"
+    if path.exists() and not rebuild:
+        return path
+
+    building = path.with_suffix(".building")
+    for stale in (building, Path(f"{building}-wal"), Path(f"{building}-shm")):
+        stale.unlink(missing_ok=True)
+    _migrate(building)
+    generate(str(building), spec, BENCH_PASSWORD, email_prefix="bench")
+
+    building.replace(path)
+    return path
@@ -0,0 +1,145 @@
+"""컨트롤러/라우터 벤치마크 러너
+
+크기별 SQLite 데이터셋을 만들고(캐시 재사용) 데이터셋마다 별도 프로세스에서
+benchmarks.cases를 실행해 각 컨트롤러 메서드와 라우터의 시간 통계를 JSON으로 저장한다.
+--compare로 이전 결과(다른 커밋)와 중앙값을 비교할 수 있다. 네트워크 없이 실행된다.
+
+Usage:
+    python -m benchmarks.run --sizes 1k,100k
+    python -m benchmarks.run --sizes 1m --comments-per-post 8 --comment-skew 1.0
+    python -m benchmarks.run --sizes 1k --only get_posts,login --compare benchmarks/results/base.json
+"""
+import argparse
+import json
+import os
+import platform
+import sqlite3
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.datasets import DatasetSpec, ROOT, build_dataset
+from scripts.generate_data import parse_size
+
+RESULTS_DIR = Path(__file__).resolve().parent / "results"
+
+
+def git_revision() -> str:
+    """현재 커밋 (작업 트리에 변경이 있으면 -dirty)"""
+    try:
+        revision = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+        dirty = subprocess.run(
+            ["git", "status", "--porcelain", "--untracked-files=no"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+    return f"{revision}-dirty" if dirty else revision
+
+
+def run_dataset(path: Path, options: dict) -> dict:
+    """데이터셋 하나를 새 프로세스에서 측정"""
+    env = {
+        **os.environ,
+        "DATABASE_URL": f"sqlite:///{path}",
+        "DB_ASYNC": "0",
+        # 목록 캐시가 켜져 있으면 두 번째 호출부터 캐시 hit만 측정됨
+        "POST_LIST_CACHE_TTL": "0",
+        "LOG_LEVEL": "WARNING",
+    }
+    for name in ("READ_DATABASE_URL", "ASYNC_DATABASE_URL", "ASYNC_READ_DATABASE_URL"):
+        env.pop(name, None)
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.cases", json.dumps(options)],
+        cwd=ROOT, env=env, stdout=subprocess.PIPE, check=True, text=True
+    )
+    return json.loads(completed.stdout)
+
+
+def compare(current: dict, baseline_path: Path) -> None:
+    """데이터셋/케이스별 중앙값 비교 출력 (비율 > 1 이면 느려짐)"""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {
+        (run["spec"]["name"], case["group"], case["name"]): case["median_ms"]
+        for run in baseline["runs"] for case in run["cases"]
+    }
+    print(f"\n비교 기준: {baseline_path} ({baseline['meta']['revision']})")
+    print(f"{'dataset':<36} {'case':<58} {'base ms':>9} {'now ms':>9} {'ratio':>6}")
+    for run in current["runs"]:
+        for case in run["cases"]:
+            key = (run["spec"]["name"], case["group"], case["name"])
+            if key not in previous:
+                continue
+            ratio = case["median_ms"] / previous[key]
+            flag = "  <- 느려짐" if ratio > 1.1 else ("  <- 빨라짐" if ratio < 0.9 else "")
+            label = f"[{case['group']}] {case['name']}"
+            print(f"{key[0]:<36} {label:<58} {previous[key]:>9.2f} {case['median_ms']:>9.2f} {ratio:>6.2f}{flag}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="컨트롤러/라우터 벤치마크 (크기별 SQLite 데이터셋)")
+    parser.add_argument("--sizes", default="1k", help="게시글 수 목록 (예: 1k,100k,1m)")
+    parser.add_argument("--users-per-post", type=float, default=0.1, help="게시글 수 대비 회원 수 비율")
+    parser.add_argument("--comments-per-post", type=float, default=5.0, help="게시글당 평균 댓글 수")
+    parser.add_argument("--comment-skew", type=float, default=0.8, help="게시글별 댓글 수 Zipf 지수")
+    parser.add_argument("--author-skew", type=float, default=1.0, help="작성자 Zipf 지수")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성 시드")
+    parser.add_argument("--rounds", type=int, default=50, help="케이스별 최대 반복 횟수")
+    parser.add_argument("--max-seconds", type=float, default=5.0, help="케이스별 최대 측정 시간(초, 최소 3회는 실행)")
+    parser.add_argument("--only", help="이름에 포함된 문자열로 케이스 선택 (쉼표 구분)")
+    parser.add_argument("--rebuild", action="store_true", help="캐시된 데이터셋을 다시 생성")
+    parser.add_argument("--output", type=Path, help="결과 JSON 경로 (기본: benchmarks/results/<시각>-<커밋>.json)")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    revision = git_revision()
+    options = {
+        "rounds": args.rounds,
+        "max_seconds": args.max_seconds,
+        "only": [token.strip() for token in args.only.split(",")] if args.only else None,
+    }
+    result = {
+        "meta": {
+            "revision": revision,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "options": options,
+        },
+        "runs": [],
+    }
+
+    for size in args.sizes.split(","):
+        posts = parse_size(size)
+        spec = DatasetSpec(
+            posts=posts,
+            users=max(10, int(posts * args.users_per_post)),
+            comments_per_post=args.comments_per_post,
+            comment_skew=args.comment_skew,
+            author_skew=args.author_skew,
+            seed=args.seed,
+        )
+        started = time.perf_counter()
+        path = build_dataset(spec, rebuild=args.rebuild)
+        print(f"데이터셋 {spec.name} 준비 ({time.perf_counter() - started:.1f}s): {path}", file=sys.stderr)
+
+        measured = run_dataset(path, options)
+        result["runs"].append({"spec": {"name": spec.name, **spec.__dict__}, **measured})
+
+    output = args.output or RESULTS_DIR / f"{datetime.now():%Y%m%d-%H%M%S}-{revision}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, ensure_ascii=False, indent=2))
+    print(f"결과 저장: {output}", file=sys.stderr)
+
+    if args.compare:
+        compare(result, args.compare)
+
+
+if __name__ == "__main__":
+    main()
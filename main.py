@@ -1,29 +1,110 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy.exc import SQLAlchemyError
 
-from app.routers import user_router, post_router, comment_router, auth_router
-from app.exceptions import AppException
+from app.config import settings
+from app.database import engine, read_engine, log_sqlite_pragmas
+from app.exceptions import AppException, BulkValidationException
+from app.utils.view_counter import view_counter
+from app.utils.security import hash_pool
+from app.utils.identity_cache import RequestIdentityScopeMiddleware
+from app.utils.query_stats import QueryStatsMiddleware, install_query_listeners
+from app.utils.metrics import MetricsMiddleware, metrics
+from app.utils.slow_query_log import slow_query_log
+from app.utils.profiling import ProfilingMiddleware
+from app.utils.warmup import warm_up, warm_up_async
+from app.utils.write_coordinator import write_coordinator
+from app.routers import internal_router, metrics_router
+
+
+logging.basicConfig(
+    level=settings.log_level,
+    format="%(asctime)s %(levelname)s [%(name)s] %(message)s"
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 실제 적용된 SQLite PRAGMA 확인용 로그
+    log_sqlite_pragmas(engine)
+    log_sqlite_pragmas(read_engine, read_only=True)
+    # 첫 요청 대신 시작 시점에 커넥션 풀, SQL 컴파일 캐시 준비
+    if settings.startup_warmup:
+        if settings.db_async:
+            await warm_up_async()
+        else:
+            await asyncio.to_thread(warm_up)
+    # 첫 로그인/회원가입이 해싱 워커 spawn을 기다리지 않도록 미리 띄움
+    if settings.startup_warm_hash_workers:
+        await asyncio.to_thread(hash_pool.warm)
+    # 조회수 버퍼 flush 스레드 시작, 종료 시 남은 증가분 반영
+    view_counter.start()
+    # 슬로 쿼리 기록 스레드 (EXPLAIN QUERY PLAN 수집, 파일 쓰기)
+    slow_query_log.start()
+    # 쓰기 요청을 전용 writer 커넥션에서 묶음 commit
+    if settings.write_coordinator:
+        write_coordinator.start()
+    yield
+    # 남은 쓰기를 commit한 뒤 조회수 반영
+    write_coordinator.stop()
+    view_counter.stop()
+    slow_query_log.stop()
+    # 비밀번호 해싱 워커 프로세스 종료
+    hash_pool.shutdown()
+    if settings.db_async:
+        from app.async_database import async_engine, async_read_engine
+        await async_engine.dispose()
+        await async_read_engine.dispose()
+
 
 app = FastAPI(
     title="Community API",
     description="커뮤니티 백엔드 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# 요청 범위 작성자 캐시
+app.add_middleware(RequestIdentityScopeMiddleware)
+
+# 요청별 SQL 실행 횟수/시간 계측 (Server-Timing 헤더, N+1 경고)
+if settings.sql_instrumentation:
+    install_query_listeners()
+    app.add_middleware(QueryStatsMiddleware)
+
+# 임계 시간(SLOW_QUERY_MS)을 넘은 SQL 기록
+if slow_query_log.enabled:
+    slow_query_log.install()
+
+# X-Profile 헤더(PROFILE_SECRET) 또는 샘플링(PROFILE_SAMPLE_RATE)에 걸린 요청만 프로파일링
+if settings.profile_secret or settings.profile_sample_rate > 0:
+    app.add_middleware(ProfilingMiddleware)
+
+# 라우트 템플릿별 요청 수/지연 시간/진행 중 요청 수 (가장 바깥 미들웨어, /metrics로 노출)
+if settings.metrics_enabled:
+    app.add_middleware(MetricsMiddleware)
+    metrics.register_engine("write", engine)
+    metrics.register_engine("read", read_engine)
+
 @app.exception_handler(AppException)
 async def app_exception_handler(request: Request, exc: AppException):
-    return JSONResponse(
-        status_code=exc.status_code,
-        content={
-            "error": exc.__class__.__name__,
-            "message": exc.message,
-            "path": request.url.path
-        }
-    )
+    metrics.record_exception(request.scope, exc.__class__.__name__)
+    content = {
+        "error": exc.__class__.__name__,
+        "message": exc.message,
+        "path": request.url.path
+    }
+    if isinstance(exc, BulkValidationException):
+        content["errors"] = exc.errors
+    return JSONResponse(status_code=exc.status_code, content=content)
 
 @app.exception_handler(SQLAlchemyError)
 async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
+    metrics.record_exception(request.scope, "DatabaseError")
     return JSONResponse(
         status_code=500,
         content={
@@ -33,7 +114,30 @@ async def sqlalchemy_exception_handler(request: Request, exc: SQLAlchemyError):
         }
     )
 
+# DB_ASYNC 설정에 따라 동기(threadpool + Session) 또는 async(AsyncSession) 라우터 선택
+if settings.db_async:
+    from app.routers import (
+        async_auth_router as auth_router,
+        async_user_router as user_router,
+        async_post_router as post_router,
+        async_comment_router as comment_router,
+        async_export_router as export_router,
+    )
+    from app.async_database import async_engine, async_read_engine
+
+    if settings.metrics_enabled:
+        metrics.register_engine("async_write", async_engine.sync_engine)
+        metrics.register_engine("async_read", async_read_engine.sync_engine)
+else:
+    from app.routers import auth_router, user_router, post_router, comment_router, export_router
+
 app.include_router(auth_router.router)
 app.include_router(user_router.router)
 app.include_router(post_router.router)
-app.include_router(comment_router.router)
\ No newline at end of file
+app.include_router(comment_router.router)
+app.include_router(export_router.router)
+# 운영 지표/프로파일 조회는 INTERNAL_SECRET이 설정된 경우에만 노출 (X-Internal-Secret 헤더 필요)
+if settings.internal_secret:
+    app.include_router(internal_router.router)
+if settings.metrics_enabled:
+    app.include_router(metrics_router.router)
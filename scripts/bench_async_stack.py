@@ -0,0 +1,140 @@
+"""동기(threadpool + Session) vs async(AsyncSession + aiosqlite) 스택 부하 비교
+
+각 모드로 uvicorn을 띄운 뒤 높은 동시성으로 읽기 위주 요청을 보내고
+p50/p99 지연 시간과 처리량(req/s)을 비교한다.
+
+Usage:
+    python -m scripts.bench_async_stack --requests 5000 --concurrency 200
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+
+import httpx
+
+
+def percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+async def wait_until_ready(base_url: str, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as client:
+        while time.monotonic() < deadline:
+            try:
+                await client.get("/posts/?limit=1")
+                return
+            except httpx.TransportError:
+                await asyncio.sleep(0.1)
+    raise RuntimeError(f"서버가 {timeout}초 안에 시작되지 않았습니다: {base_url}")
+
+
+async def run_load(base_url: str, total: int, concurrency: int, post_ids: list[int]) -> dict:
+    paths = []
+    for _ in range(total):
+        post_id = random.choice(post_ids)
+        paths.append(random.choice([
+            "/posts/?limit=10",
+            f"/posts/{post_id}",
+            f"/posts/{post_id}/comments?limit=10",
+        ]))
+
+    latencies: list[float] = []
+    errors = 0
+    queue: asyncio.Queue[str] = asyncio.Queue()
+    for path in paths:
+        queue.put_nowait(path)
+
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60.0) as client:
+        async def worker() -> None:
+            nonlocal errors
+            while True:
+                try:
+                    path = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                started = time.perf_counter()
+                try:
+                    response = await client.get(path)
+                    if response.status_code >= 500:
+                        errors += 1
+                except httpx.HTTPError:
+                    errors += 1
+                latencies.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "errors": errors,
+        "throughput_rps": round(total / elapsed, 1),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(max(latencies), 2),
+    }
+
+
+def bench_mode(mode: str, args: argparse.Namespace) -> dict:
+    port = args.port + (1 if mode == "async" else 0)
+    env = {**os.environ, "DB_ASYNC": "1" if mode == "async" else "0"}
+    if args.database_url:
+        env["DATABASE_URL"] = args.database_url
+
+    server = subprocess.Popen(
+        [
+            sys.executable, "-m", "uvicorn", "main:app",
+            "--port", str(port), "--log-level", "warning",
+        ],
+        env=env,
+    )
+    try:
+        base_url = f"http://127.0.0.1:{port}"
+        asyncio.run(wait_until_ready(base_url))
+        post_ids = list(range(1, args.max_post_id + 1))
+        # 워밍업 (커넥션 풀, 컴파일 캐시)
+        asyncio.run(run_load(base_url, min(200, args.requests), args.concurrency, post_ids))
+        result = asyncio.run(run_load(base_url, args.requests, args.concurrency, post_ids))
+    finally:
+        server.terminate()
+        server.wait()
+
+    return {"mode": mode, **result}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="sync vs async DB 스택 부하 비교")
+    parser.add_argument("--requests", type=int, default=5000, help="모드별 총 요청 수")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--port", type=int, default=8100, help="sync 서버 포트 (async는 +1)")
+    parser.add_argument("--max-post-id", type=int, default=10, help="요청에 사용할 최대 게시글 ID")
+    parser.add_argument("--database-url", default=None, help="벤치마크 대상 DATABASE_URL")
+    parser.add_argument("--json", dest="json_path", default=None, help="결과를 저장할 JSON 파일")
+    args = parser.parse_args()
+
+    results = [bench_mode(mode, args) for mode in ("sync", "async")]
+
+    print(f"{'mode':<6} {'rps':>9} {'p50(ms)':>9} {'p99(ms)':>9} {'max(ms)':>9} {'errors':>7}")
+    for result in results:
+        print(
+            f"{result['mode']:<6} {result['throughput_rps']:>9} {result['p50_ms']:>9} "
+            f"{result['p99_ms']:>9} {result['max_ms']:>9} {result['errors']:>7}"
+        )
+
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""목록 응답 직렬화 경로 마이크로 벤치마크
+
+게시글/댓글/회원 목록에 대해 두 경로의 "조회 + JSON 직렬화" 시간을 비교한다.
+
+- orm:  ORM 객체 조회 → TypeAdapter(list[Schema]).validate_python(from_attributes=True) → dump_json
+        (response_model로 검증/직렬화하던 기존 방식과 같은 작업)
+- rows: 스키마 필드만 컬럼 튜플로 조회 → 검증 없이 orjson으로 인코딩 (현재 라우터 경로)
+
+롤백되는 트랜잭션 안에서 합성 데이터를 넣고 측정하므로 DB는 변경되지 않는다.
+
+Usage:
+    python -m scripts.bench_serialization
+    python -m scripts.bench_serialization --rows 5000 --limit 100 --repeat 300
+"""
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from datetime import datetime
+
+import orjson
+from pydantic import TypeAdapter
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.user_model import Users
+from app.models.post_model import Post
+from app.models.comment_model import Comment
+from app.controllers.post_controller import PostController
+from app.controllers.comment_controller import CommentController, COMMENT_LIST_FIELDS
+from app.controllers.user_controller import UserController, USER_LIST_FIELDS
+from app.schemas.post_schema import Post as PostSchema
+from app.schemas.comment_schema import Comment as CommentSchema
+from app.schemas.user_schema import User as UserSchema
+from app.utils.serialization import dump_rows
+
+
+def seed(db: Session, rows: int) -> int:
+    """합성 회원/게시글/댓글 추가 (댓글은 게시글 하나에 몰아서 넣음)
+
+    Returns:
+        int: 댓글을 넣은 게시글 ID
+    """
+    now = datetime.now().replace(microsecond=0)
+    users = db.execute(
+        insert(Users).returning(Users.id, sort_by_parameter_order=True),
+        [
+            {
+                "email": f"bench{i}@example.com",
+                "nickname": f"bench{i}",
+                "hashed_password": "bench",
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ]
+    ).scalars().all()
+    posts = db.execute(
+        insert(Post).returning(Post.id, sort_by_parameter_order=True),
+        [
+            {
+                "title": f"벤치마크 게시글 {i}",
+                "content": "직렬화 경로 비교용 본문입니다. " * 8,
+                "author_id": users[i % len(users)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ]
+    ).scalars().all()
+    db.execute(
+        insert(Comment),
+        [
+            {
+                "content": f"벤치마크 댓글 {i}",
+                "post_id": posts[0],
+                "author_id": users[i % len(users)],
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(rows)
+        ]
+    )
+    db.flush()
+    return posts[0]
+
+
+def measure(db: Session, call: Callable[[], bytes], repeat: int) -> tuple[float, float, int]:
+    """(중앙값 ms, p95 ms, 응답 크기 bytes)"""
+    body = call()
+    timings = []
+    for _ in range(repeat):
+        # 매 회 새로 조회하도록 identity map 비우기 (요청마다 새 세션과 같은 조건)
+        db.expunge_all()
+        started = time.perf_counter()
+        call()
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return statistics.median(timings), timings[int(len(timings) * 0.95) - 1], len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목록 응답 ORM+Pydantic vs 컬럼 튜플+orjson 비교")
+    parser.add_argument("--rows", type=int, default=1000, help="추가할 합성 회원/게시글/댓글 수")
+    parser.add_argument("--limit", type=int, default=100, help="게시글/댓글 목록 페이지 크기")
+    parser.add_argument("--repeat", type=int, default=200, help="경로별 반복 횟수")
+    args = parser.parse_args()
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+
+    try:
+        post_id = seed(db, args.rows)
+
+        posts = PostController(db)
+        comments = CommentController(db)
+        users = UserController(db)
+        post_adapter = TypeAdapter(list[PostSchema])
+        comment_adapter = TypeAdapter(list[CommentSchema])
+        user_adapter = TypeAdapter(list[UserSchema])
+
+        cases = [
+            (
+                f"GET /posts/?limit={args.limit}",
+                lambda: post_adapter.dump_json(
+                    post_adapter.validate_python(posts.get_posts(0, args.limit), from_attributes=True)
+                ),
+                lambda: orjson.dumps(posts.get_post_rows(0, args.limit)),
+            ),
+            (
+                f"GET /posts/{{id}}/comments?limit={args.limit}",
+                lambda: comment_adapter.dump_json(
+                    comment_adapter.validate_python(
+                        comments.get_comments_by_post(post_id, 0, args.limit), from_attributes=True
+                    )
+                ),
+                lambda: dump_rows(
+                    comments.get_comment_rows_by_post(post_id, 0, args.limit), COMMENT_LIST_FIELDS
+                ),
+            ),
+            (
+                "GET /api/users/",
+                lambda: user_adapter.dump_json(
+                    user_adapter.validate_python(users.get_users(), from_attributes=True)
+                ),
+                lambda: dump_rows(users.get_user_rows(), USER_LIST_FIELDS),
+            ),
+        ]
+
+        print(f"{'endpoint':<36} {'path':<5} {'p50 ms':>8} {'p95 ms':>8} {'bytes':>9}")
+        for label, orm_call, rows_call in cases:
+            results = {}
+            for name, call in (("orm", orm_call), ("rows", rows_call)):
+                results[name] = measure(db, call, args.repeat)
+                p50, p95, size = results[name]
+                print(f"{label:<36} {name:<5} {p50:>8.2f} {p95:>8.2f} {size:>9}")
+            speedup = results["orm"][0] / results["rows"][0]
+            print(f"{'':<36} -> p50 기준 {speedup:.1f}배\n")
+    finally:
+        db.close()
+        transaction.rollback()
+        connection.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""Argon2 비용 파라미터 보정
+
+현재 호스트에서 memory_cost/time_cost 조합별 해싱 시간을 측정하고, 중앙값이
+목표 지연 시간 안에 들어오는 가장 강한(메모리 x 반복 횟수가 큰) 조합을 골라
+환경 변수 형태로 출력한다.
+
+Usage:
+    python -m scripts.calibrate_argon2 --target-ms 250
+    python -m scripts.calibrate_argon2 --target-ms 100 --parallelism 2 --samples 7
+"""
+import argparse
+import statistics
+import time
+
+from argon2 import PasswordHasher
+
+MEMORY_COSTS_KIB = [19456, 32768, 47104, 65536, 98304, 131072, 262144]
+TIME_COSTS = [1, 2, 3, 4, 5, 6, 8]
+
+
+def measure(time_cost: int, memory_cost: int, parallelism: int, samples: int) -> float:
+    """조합 하나의 해싱 시간 중앙값(ms)"""
+    hasher = PasswordHasher(
+        time_cost=time_cost,
+        memory_cost=memory_cost,
+        parallelism=parallelism
+    )
+    hasher.hash("calibration-warmup")
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        hasher.hash("calibration-password")
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="목표 지연 시간에 맞는 Argon2 파라미터 선택")
+    parser.add_argument("--target-ms", type=float, default=250.0, help="해싱 1회 목표 시간(ms)")
+    parser.add_argument("--parallelism", type=int, default=4, help="Argon2 parallelism")
+    parser.add_argument("--samples", type=int, default=5, help="조합별 측정 횟수")
+    args = parser.parse_args()
+
+    best = None
+    print(f"{'memory(KiB)':>12} {'time_cost':>10} {'median(ms)':>11}")
+    for memory_cost in MEMORY_COSTS_KIB:
+        for time_cost in TIME_COSTS:
+            median_ms = measure(time_cost, memory_cost, args.parallelism, args.samples)
+            print(f"{memory_cost:>12} {time_cost:>10} {median_ms:>11.1f}")
+            if median_ms > args.target_ms:
+                # 같은 메모리에서 반복 횟수를 더 늘리면 더 느려지므로 다음 메모리로
+                break
+            strength = memory_cost * time_cost
+            if best is None or strength > best[0]:
+                best = (strength, time_cost, memory_cost, median_ms)
+
+    if best is None:
+        raise SystemExit(f"{args.target_ms}ms 안에 들어오는 조합이 없습니다 (PASSWORD_HASH_PROFILE=low 권장)")
+
+    _, time_cost, memory_cost, median_ms = best
+    print(f"\n선택: time_cost={time_cost}, memory_cost={memory_cost}KiB, 중앙값 {median_ms:.1f}ms")
+    print(f"PASSWORD_HASH_TIME_COST={time_cost}")
+    print(f"PASSWORD_HASH_MEMORY_COST={memory_cost}")
+    print(f"PASSWORD_HASH_PARALLELISM={args.parallelism}")
+
+
+if __name__ == "__main__":
+    main()
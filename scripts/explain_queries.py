@@ -0,0 +1,228 @@
+"""컨트롤러 쿼리 실행 계획 점검 (EXPLAIN QUERY PLAN)
+
+모든 컨트롤러 메서드를 롤백되는 트랜잭션 안에서 실행하면서 실제로 나가는 SQL을
+수집하고, 각 SQL의 EXPLAIN QUERY PLAN에서 전체 테이블 스캔(SCAN <table>)과
+임시 B-TREE 정렬을 찾아낸다. 허용 목록에 없는 전체 스캔이 있으면 종료 코드 1로
+끝나므로 CI에서 쿼리 계획 회귀를 잡는 데 사용할 수 있다.
+
+Usage:
+    python -m scripts.explain_queries
+    python -m scripts.explain_queries --verbose
+"""
+import argparse
+import sys
+from collections.abc import Callable
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.database import engine
+from app.models.user_model import Users
+from app.models.post_model import Post
+from app.controllers.post_controller import PostController
+from app.controllers.comment_controller import CommentController
+from app.controllers.user_controller import UserController
+from app.controllers.auth_controller import AuthController
+from app.controllers.export_controller import ExportController
+from app.controllers.like_controller import LikeController
+from app.schemas.post_schema import PostCreate, PostUpdate
+from app.schemas.comment_schema import CommentCreate, CommentUpdate
+from app.schemas.user_schema import UserCreate, UserUpdate
+from app.exceptions import AppException
+from app.utils.pagination import encode_cursor, encode_rank_cursor
+
+# 의도적으로 전체 스캔하는 쿼리 (예: 전체 회원 목록, 정합성 복구)
+ALLOWED_FULL_SCANS = {
+    "UserController.get_users": {"users"},
+    "PostController.repair_comment_counts": {"posts"},
+    "ExportController.stream(users)": {"users"},
+    # 모든 검색어가 3글자 미만이면 trigram 색인을 쓸 수 없어 최근 행(rowid 역순, LIMIT)만 LIKE로 확인
+    "PostController.search_posts(like)": {"posts", "comments"},
+}
+
+SKIPPED_PREFIXES = ("INSERT", "PRAGMA", "SAVEPOINT", "RELEASE", "ROLLBACK", "BEGIN", "COMMIT")
+
+
+def controller_calls(db: Session) -> list[tuple[str, Callable]]:
+    """점검할 컨트롤러 호출 목록 (실제 데이터의 ID 사용)"""
+    post = db.query(Post).order_by(Post.id).first()
+    author = db.query(Users).order_by(Users.id).first()
+    if post is None or author is None:
+        raise SystemExit("게시글/회원 데이터가 필요합니다 (alembic upgrade head 후 실행)")
+
+    posts = PostController(db)
+    comments = CommentController(db)
+    users = UserController(db)
+    auth = AuthController(db)
+    export = ExportController(db)
+    likes = LikeController(db)
+    first_page = posts.get_posts(0, 10)
+    cursor_post = first_page[-1]
+
+    cursor = encode_cursor(cursor_post.created_at, cursor_post.id)
+    first_comment = comments.get_comments_by_post(post.id, 0, 1)[0]
+
+    def get_post_detail():
+        return posts.get_post_detail(post.id, comment_limit=20, increment_view=False)
+
+    def comment_lifecycle():
+        comment = comments.create_comment(
+            CommentCreate(content="explain", post_id=post.id), post.id, author.id
+        )
+        comments.update_comment(comment.id, CommentUpdate(content="explain2"), author.id)
+        comments.delete_comment(comment.id, author.id)
+
+    def post_lifecycle():
+        new_post = posts.create_post(PostCreate(title="explain", content="explain"), author.id)
+        posts.update_post(new_post.id, PostUpdate(title="explain2"), author.id)
+        posts.delete_post(new_post.id, author.id)
+
+    def like_lifecycle():
+        likes.like_post(post.id, author.id)
+        likes.like_post(post.id, author.id)
+        likes.unlike_post(post.id, author.id)
+        likes.unlike_post(post.id, author.id)
+
+    def user_lifecycle():
+        user = users.create_user(
+            UserCreate(
+                email="explain@example.com",
+                nickname="explain",
+                password="Explain123!",
+                password_confirm="Explain123!"
+            ),
+            hashed_password="explain"
+        )
+        users.update_user(user.id, UserUpdate(nickname="explain2"))
+        users.delete_user(user.id)
+
+    return [
+        ("PostController.get_posts", lambda: posts.get_posts(20, 10)),
+        ("PostController.get_posts(cursor)", lambda: posts.get_posts(0, 10, cursor)),
+        ("PostController.get_post_detail", get_post_detail),
+        ("PostController.search_posts", lambda: posts.search_posts("FastAPI", 10)),
+        (
+            "PostController.search_posts(cursor)",
+            lambda: posts.search_posts("FastAPI", 10, encode_rank_cursor(-1.0, post.id))
+        ),
+        ("PostController.search_posts(like)", lambda: posts.search_posts("인증", 10)),
+        ("PostController.search_posts(fts+like)", lambda: posts.search_posts("FastAPI 인증", 10)),
+        ("PostController.create/update/delete_post", post_lifecycle),
+        ("PostController.repair_comment_counts", posts.repair_comment_counts),
+        ("CommentController.get_comments_by_post", lambda: comments.get_comments_by_post(post.id, 0, 10)),
+        (
+            "CommentController.get_comments_by_post(cursor)",
+            lambda: comments.get_comments_by_post(
+                post.id, 0, 10, encode_cursor(first_comment.created_at, first_comment.id)
+            )
+        ),
+        ("CommentController.get_comment_by_id", lambda: comments.get_comment_by_id(1)),
+        ("CommentController.create/update/delete_comment", comment_lifecycle),
+        ("LikeController.like/unlike_post", like_lifecycle),
+        ("UserController.get_users", users.get_users),
+        ("UserController.get_user_by_id", lambda: users.get_user_by_id(author.id)),
+        ("UserController.create/update/delete_user", user_lifecycle),
+        ("AuthController.get_user_by_email", lambda: auth.get_user_by_email(author.email)),
+        ("ExportController.stream(posts)", lambda: list(export.stream(export.posts_statement()))),
+        (
+            "ExportController.stream(posts, range)",
+            lambda: list(export.stream(export.posts_statement(post.created_at, None)))
+        ),
+        (
+            "ExportController.stream(posts, author)",
+            lambda: list(export.stream(export.posts_statement(author_id=author.id)))
+        ),
+        (
+            "ExportController.stream(comments, range)",
+            lambda: list(export.stream(export.comments_statement(first_comment.created_at, None)))
+        ),
+        (
+            "ExportController.stream(comments, author)",
+            lambda: list(export.stream(export.comments_statement(author_id=author.id)))
+        ),
+        ("ExportController.stream(users)", lambda: list(export.stream(export.users_statement()))),
+    ]
+
+
+def find_problems(plan: list[str], allowed_tables: set[str]) -> list[str]:
+    problems = []
+    # CTE/서브쿼리 결과(CO-ROUTINE, MATERIALIZE)를 읽는 SCAN은 테이블 스캔이 아님
+    subqueries = {
+        detail.split()[1] for detail in plan
+        if detail.startswith(("CO-ROUTINE ", "MATERIALIZE "))
+    }
+    for detail in plan:
+        words = detail.split()
+        # "SCAN posts" 는 전체 테이블 스캔, "SCAN posts USING INDEX ..." 는 인덱스 순회,
+        # "SCAN posts_fts VIRTUAL TABLE INDEX ..." 는 FTS5 색인 조회
+        if words[:1] == ["SCAN"] and "USING" not in words and "VIRTUAL" not in words:
+            table = words[1]
+            if table not in allowed_tables and table not in subqueries:
+                problems.append(f"full scan: {detail}")
+        if "USE TEMP B-TREE" in detail:
+            problems.append(f"temp sort: {detail}")
+    return problems
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="컨트롤러 쿼리 EXPLAIN QUERY PLAN 점검")
+    parser.add_argument("--verbose", action="store_true", help="모든 쿼리의 실행 계획 출력")
+    args = parser.parse_args()
+
+    connection = engine.connect()
+    transaction = connection.begin()
+    # 컨트롤러의 commit은 SAVEPOINT 해제로 바뀌고, 마지막에 전체를 롤백
+    db = Session(bind=connection, autoflush=False, join_transaction_mode="create_savepoint")
+
+    captured: list[tuple[str, str, object]] = []
+    current = {"label": "setup"}
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if not statement.lstrip().upper().startswith(SKIPPED_PREFIXES) and not executemany:
+            captured.append((current["label"], statement, parameters))
+
+    event.listen(connection, "before_cursor_execute", capture)
+    try:
+        calls = controller_calls(db)
+        captured.clear()
+        for label, call in calls:
+            current["label"] = label
+            try:
+                call()
+            except AppException as e:
+                print(f"[warn] {label}: {e.message}")
+    finally:
+        event.remove(connection, "before_cursor_execute", capture)
+
+    failures = 0
+    seen = set()
+    for label, statement, parameters in captured:
+        key = (label, statement)
+        if key in seen:
+            continue
+        seen.add(key)
+
+        rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+        plan = [row[-1] for row in rows]
+        problems = find_problems(plan, ALLOWED_FULL_SCANS.get(label, set()))
+        failures += len([p for p in problems if p.startswith("full scan")])
+
+        if problems or args.verbose:
+            status = "FAIL" if any(p.startswith("full scan") for p in problems) else ("WARN" if problems else "OK")
+            print(f"[{status}] {label}")
+            print("    " + " ".join(statement.split()))
+            for detail in plan:
+                print(f"      {detail}")
+            for problem in problems:
+                print(f"    ! {problem}")
+
+    db.close()
+    transaction.rollback()
+    connection.close()
+
+    print(f"\n{len(seen)}개 쿼리 점검, 허용되지 않은 전체 스캔 {failures}건")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""대용량 합성 데이터 생성 (회원/게시글/댓글)
+
+마이그레이션된 SQLite DB(alembic upgrade head)에 기존 데이터 뒤로 회원, 게시글, 댓글을 추가한다.
+성능 측정용이므로 실제 서비스와 비슷한 분포를 따른다.
+
+- 게시글 작성자, 댓글 작성자: 순위 기반 Zipf 가중치 (소수 회원이 대부분의 글을 씀)
+- 게시글별 댓글 수: 순위 기반 Zipf 분포 (대부분 몇 개, 일부 게시글에 댓글이 몰림)
+- 제목/본문/댓글 길이: 로그정규 분포의 한국어 문장
+- 비밀번호 해시는 한 번만 계산해 모든 회원이 공유 (Argon2를 회원 수만큼 돌리지 않음)
+
+적재 중에는 저널을 메모리에 두고 동기화를 끈 채, 보조 인덱스와 전문 검색 트리거를 지우고
+executemany로 넣은 뒤 인덱스 생성과 전문 검색 재색인을 한 번에 한다. 전체가 하나의 트랜잭션이라
+오류가 나면 인덱스/트리거까지 그대로 롤백되지만, 프로세스가 중간에 죽으면 DB가 손상될 수 있으므로
+운영 DB가 아닌 별도 파일에 실행할 것.
+
+Usage:
+    python -m scripts.generate_data --users 100k --posts 1m --comments-per-post 8
+    DATABASE_URL=sqlite:///./perf.db python -m scripts.generate_data --users 1m --posts 2m
+"""
+import argparse
+import itertools
+import math
+import random
+import sqlite3
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from argon2 import PasswordHasher
+from sqlalchemy.engine import make_url
+
+from app.config import settings
+from app.utils.security import HASH_PARAMS
+
+BATCH_SIZE = 50_000
+SUFFIXES = {"k": 1_000, "m": 1_000_000}
+DEFAULT_PASSWORD = "Password123!"
+
+WORDS = (
+    "오늘 어제 내일 정말 너무 조금 아주 항상 가끔 다시 함께 혼자 처음 마지막 우리 여러분 저는 제가 "
+    "회사 학교 집 카페 식당 여행 주말 출근 퇴근 점심 저녁 커피 음식 날씨 사진 영화 음악 운동 공부 "
+    "개발 서버 코드 배포 테스트 데이터 성능 질문 답변 후기 추천 정보 공유 경험 생각 문제 해결 방법 "
+    "좋아요 감사합니다 궁금합니다 했습니다 있습니다 없습니다 같습니다 봤습니다 먹었습니다 갔습니다 "
+    "재미있는 맛있는 새로운 중요한 간단한 어려운 편한 좋은 나쁜 많은 적은 빠른 느린 "
+    "그리고 그런데 하지만 그래서 또한 역시 혹시 아마 결국 드디어"
+).split()
+
+
+@dataclass(frozen=True)
+class DataSpec:
+    """생성할 데이터 크기와 분포"""
+    users: int
+    posts: int
+    # 게시글당 평균 댓글 수
+    comments_per_post: float = 5.0
+    # 게시글별 댓글 수 Zipf 지수 (클수록 소수 게시글에 댓글이 몰림)
+    comment_skew: float = 0.8
+    # 작성자 Zipf 지수 (클수록 소수 회원에 글이 몰림)
+    author_skew: float = 1.0
+    seed: int = 42
+
+
+def parse_size(value: str) -> int:
+    """'1k', '100k', '1m' 형식의 크기를 정수로 변환"""
+    value = value.strip().lower()
+    if value[-1:] in SUFFIXES:
+        return int(float(value[:-1]) * SUFFIXES[value[-1]])
+    return int(value)
+
+
+def _zipf_weights(count: int, exponent: float) -> list[float]:
+    return [1.0 / (rank ** exponent) for rank in range(1, count + 1)]
+
+
+def _comment_counts(spec: DataSpec, rng: random.Random) -> list[int]:
+    """게시글별 댓글 수 (순위별 Zipf 기댓값을 확률적으로 반올림하고 게시글에 무작위 배정)"""
+    weights = _zipf_weights(spec.posts, spec.comment_skew)
+    scale = spec.posts * spec.comments_per_post / math.fsum(weights)
+    counts = []
+    for weight in weights:
+        expected = weight * scale
+        counts.append(int(expected) + (rng.random() < expected - int(expected)))
+    rng.shuffle(counts)
+    return counts
+
+
+def _timestamp(value: datetime) -> str:
+    # SQLAlchemy의 SQLite DateTime 저장 형식(마이크로초 항상 포함)과 같아야 커서 비교(문자열 비교)가 맞음
+    return value.isoformat(" ", "microseconds")
+
+
+def _batched(rows: Iterator[tuple]) -> Iterator[list[tuple]]:
+    while batch := list(itertools.islice(rows, BATCH_SIZE)):
+        yield batch
+
+
+class TextSource:
+    """한국어 문장 생성기 (미리 만든 말뭉치에서 로그정규 분포 길이만큼 잘라 씀)
+
+    행마다 난수 분포를 계산하지 않도록 길이는 미리 뽑아 둔 표본에서 고른다.
+    """
+
+    SAMPLES = 4096
+
+    def __init__(self, rng: random.Random, size: int = 1_000_000):
+        self.rng = rng
+        self.corpus = " ".join(rng.choices(WORDS, k=size // 4))
+
+    def lengths(self, median: int, sigma: float, maximum: int) -> list[int]:
+        """로그정규 분포 길이 표본"""
+        return [
+            max(1, min(maximum, int(self.rng.lognormvariate(math.log(median), sigma))))
+            for _ in range(self.SAMPLES)
+        ]
+
+    def text(self, lengths: list[int]) -> str:
+        length = lengths[self.rng.getrandbits(12)]
+        start = int(self.rng.random() * (len(self.corpus) - length))
+        return self.corpus[start:start + length].strip() or WORDS[0]
+
+
+def _drop_secondary(connection: sqlite3.Connection) -> list[tuple[str, str]]:
+    """보조 인덱스/전문 검색 트리거 삭제 (행마다 갱신하지 않고 적재 후 한 번에 생성)
+
+    Returns:
+        list[tuple[str, str]]: 적재 후 다시 만들 (이름, CREATE 문)
+    """
+    # UNIQUE 인덱스(email, nickname)는 중복 검사에 필요하므로 유지
+    dropped = connection.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE sql IS NOT NULL AND tbl_name IN ('users', 'posts', 'comments') AND ("
+        "(type = 'index' AND sql NOT LIKE 'CREATE UNIQUE%') "
+        "OR (type = 'trigger' AND name LIKE '%_fts_%'))"
+    ).fetchall()
+    for name, sql in dropped:
+        kind = "INDEX" if sql.startswith("CREATE INDEX") else "TRIGGER"
+        connection.execute(f"DROP {kind} {name}")
+    return dropped
+
+
+def _restore(connection: sqlite3.Connection, dropped: list[tuple[str, str]]) -> None:
+    for _, sql in dropped:
+        connection.execute(sql)
+    # 재색인 중에는 세그먼트 병합을 미루고 끝난 뒤 한 번에 병합 (병합을 반복하는 것보다 빠름)
+    for table in ("posts_fts", "comments_fts"):
+        connection.execute(f"INSERT INTO {table}({table}, rank) VALUES ('automerge', 0)")
+        connection.execute(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+        connection.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+        connection.execute(f"INSERT INTO {table}({table}, rank) VALUES ('automerge', 4)")
+
+
+def _load(
+    connection: sqlite3.Connection,
+    spec: DataSpec,
+    password: str,
+    email_prefix: str,
+) -> dict[str, int]:
+    rng = random.Random(spec.seed)
+    texts = TextSource(rng)
+    (offset_user,) = connection.execute("SELECT coalesce(max(id), 0) FROM users").fetchone()
+    (offset_post,) = connection.execute("SELECT coalesce(max(id), 0) FROM posts").fetchone()
+    now = datetime.now().replace(microsecond=0)
+    start = now - timedelta(days=365)
+
+    hashed_password = PasswordHasher(*HASH_PARAMS).hash(password)
+    for batch in _batched(
+        (
+            offset_user + i,
+            f"{email_prefix}{offset_user + i}@example.com",
+            f"{email_prefix}{offset_user + i}",
+            hashed_password,
+            _timestamp(start),
+        )
+        for i in range(1, spec.users + 1)
+    ):
+        connection.executemany(
+            "INSERT INTO users (id, email, nickname, hashed_password, updated_at) VALUES (?, ?, ?, ?, ?)",
+            batch
+        )
+
+    user_ids = range(offset_user + 1, offset_user + spec.users + 1)
+    author_weights = list(itertools.accumulate(_zipf_weights(spec.users, spec.author_skew)))
+    comment_counts = _comment_counts(spec, rng)
+    title_lengths = texts.lengths(20, 0.4, 100)
+    content_lengths = texts.lengths(200, 0.8, 5000)
+    comment_lengths = texts.lengths(30, 0.7, 500)
+    step = (now - start) / max(1, spec.posts)
+
+    def post_rows() -> Iterator[tuple]:
+        authors = rng.choices(user_ids, cum_weights=author_weights, k=spec.posts)
+        for i, (author_id, count) in enumerate(zip(authors, comment_counts)):
+            created_at = start + step * i
+            yield (
+                offset_post + i + 1,
+                texts.text(title_lengths),
+                texts.text(content_lengths),
+                _timestamp(created_at.replace(microsecond=0)),
+                _timestamp(created_at),
+                int(rng.paretovariate(1.5)) - 1,
+                count,
+                author_id,
+            )
+
+    # like_count는 post_likes와 맞도록 0으로 둠
+    for batch in _batched(post_rows()):
+        connection.executemany(
+            "INSERT INTO posts (id, title, content, created_at, updated_at, view_count, "
+            "like_count, comment_count, author_id) VALUES (?, ?, ?, ?, ?, ?, 0, ?, ?)",
+            batch
+        )
+
+    def comment_rows() -> Iterator[tuple]:
+        for i, count in enumerate(comment_counts):
+            if not count:
+                continue
+            post_created_at = (start + step * i).replace(microsecond=0)
+            authors = rng.choices(user_ids, cum_weights=author_weights, k=count)
+            for n, author_id in enumerate(authors):
+                created_at = _timestamp(post_created_at + timedelta(seconds=n + 1))
+                yield (
+                    texts.text(comment_lengths),
+                    created_at,
+                    created_at,
+                    offset_post + i + 1,
+                    author_id,
+                )
+
+    for batch in _batched(comment_rows()):
+        connection.executemany(
+            "INSERT INTO comments (content, created_at, updated_at, post_id, author_id) "
+            "VALUES (?, ?, ?, ?, ?)",
+            batch
+        )
+
+    return {"users": spec.users, "posts": spec.posts, "comments": sum(comment_counts)}
+
+
+def generate(
+    path: str,
+    spec: DataSpec,
+    password: str = DEFAULT_PASSWORD,
+    email_prefix: str = "user",
+) -> dict[str, int]:
+    """SQLite 파일에 합성 데이터 추가
+
+    Args:
+        path (str): 마이그레이션된 SQLite 파일 경로
+        spec (DataSpec): 데이터 크기와 분포
+        password (str): 모든 생성 회원의 비밀번호
+        email_prefix (str): 생성 회원 이메일/닉네임 접두사
+
+    Returns:
+        dict[str, int]: 테이블별 추가된 행 수
+    """
+    connection = sqlite3.connect(path, isolation_level=None)
+    try:
+        connection.execute("PRAGMA journal_mode=MEMORY")
+        connection.execute("PRAGMA synchronous=OFF")
+        connection.execute("PRAGMA temp_store=MEMORY")
+        connection.execute("PRAGMA cache_size=-262144")
+        connection.execute("BEGIN")
+        try:
+            dropped = _drop_secondary(connection)
+            counts = _load(connection, spec, password, email_prefix)
+            _restore(connection, dropped)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        if settings.sqlite_journal_mode:
+            connection.execute(f"PRAGMA journal_mode={settings.sqlite_journal_mode}")
+    finally:
+        connection.close()
+    return counts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="대용량 합성 데이터 생성 (마이그레이션된 SQLite DB에 추가)")
+    parser.add_argument("--users", default="10k", help="회원 수 (예: 10k, 1m)")
+    parser.add_argument("--posts", default="100k", help="게시글 수 (예: 100k, 2m)")
+    parser.add_argument("--comments-per-post", type=float, default=5.0, help="게시글당 평균 댓글 수")
+    parser.add_argument("--comment-skew", type=float, default=0.8, help="게시글별 댓글 수 Zipf 지수")
+    parser.add_argument("--author-skew", type=float, default=1.0, help="작성자 Zipf 지수")
+    parser.add_argument("--seed", type=int, default=42, help="데이터 생성 시드")
+    parser.add_argument("--password", default=DEFAULT_PASSWORD, help="생성 회원 공통 비밀번호")
+    parser.add_argument("--email-prefix", default="user", help="생성 회원 이메일/닉네임 접두사")
+    args = parser.parse_args()
+
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "sqlite" or not url.database:
+        raise SystemExit(f"SQLite 파일 DB만 지원합니다: {settings.database_url}")
+
+    spec = DataSpec(
+        users=parse_size(args.users),
+        posts=parse_size(args.posts),
+        comments_per_post=args.comments_per_post,
+        comment_skew=args.comment_skew,
+        author_skew=args.author_skew,
+        seed=args.seed,
+    )
+    started = time.perf_counter()
+    counts = generate(url.database, spec, args.password, args.email_prefix)
+    elapsed = time.perf_counter() - started
+    total = sum(counts.values())
+    print(
+        f"생성 완료 ({elapsed:.1f}s, {total / elapsed:,.0f} rows/s): "
+        + ", ".join(f"{table} {count:,}" for table, count in counts.items())
+    )
+
+
+if __name__ == "__main__":
+    main()
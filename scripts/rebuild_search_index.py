@@ -0,0 +1,38 @@
+"""전문 검색 색인(posts_fts, comments_fts) 재생성
+
+SEARCH_TOKENIZER를 바꾼 뒤 실행하면 현재 설정의 토크나이저로 FTS5 테이블을 다시 만들고
+posts/comments 전체를 재색인한다. 동기화 트리거는 테이블 이름만 참조하므로 그대로 둔다.
+
+Usage:
+    python -m scripts.rebuild_search_index
+    SEARCH_TOKENIZER=unicode61 python -m scripts.rebuild_search_index
+"""
+import re
+
+from app.config import settings
+from app.database import engine
+
+FTS_TABLES = {
+    "posts_fts": "title, content, content='posts', content_rowid='id'",
+    "comments_fts": "content, content='comments', content_rowid='id'",
+}
+
+
+def main() -> None:
+    tokenizer = settings.search_tokenizer
+    if not re.fullmatch(r"[A-Za-z0-9_ ]+", tokenizer):
+        raise SystemExit(f"지원하지 않는 SEARCH_TOKENIZER: {tokenizer}")
+
+    with engine.begin() as connection:
+        for table, columns in FTS_TABLES.items():
+            connection.exec_driver_sql(f"DROP TABLE IF EXISTS {table}")
+            connection.exec_driver_sql(
+                f"CREATE VIRTUAL TABLE {table} USING fts5({columns}, tokenize='{tokenizer}')"
+            )
+            connection.exec_driver_sql(f"INSERT INTO {table}({table}) VALUES ('rebuild')")
+
+    print(f"검색 색인 재생성 완료 (tokenizer={tokenizer})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""posts.comment_count 정합성 복구 명령
+
+Usage:
+    python -m scripts.repair_comment_counts
+"""
+from app.database import SessionLocal
+from app.controllers.post_controller import PostController
+
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        repaired = PostController(db).repair_comment_counts()
+    finally:
+        db.close()
+
+    print(f"comment_count 복구 완료: {repaired}개 게시글 수정")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""pre-fork 서버 (앱 preload 후 워커 fork)
+
+`uvicorn --workers N`은 워커마다 새 인터프리터를 spawn해 main을 다시 import하고 워밍업하므로
+워커 수만큼 콜드 스타트 비용을 낸다. 이 스크립트는 마스터 프로세스에서 main을 한 번 import하고
+(STARTUP_WARMUP이면) 매퍼 구성과 SQL 컴파일 캐시까지 채운 뒤 워커를 fork한다. 워커는
+copy-on-write로 import된 모듈과 컴파일 캐시를 공유하며 바로 같은 리슨 소켓에서 요청을 받는다.
+
+- 커넥션은 프로세스 간에 공유하면 안 되므로 fork 전에 닫고, 워커의 lifespan에서 각자 다시 연다
+- 마스터는 fork 전까지 스레드를 시작하지 않는다 (view_counter, 슬로 쿼리 기록 스레드 등은 워커의 lifespan에서 시작)
+- 종료된 워커는 다시 fork하고, SIGTERM/SIGINT를 받으면 워커에 SIGTERM을 보내 정상 종료를 기다린다
+
+Usage:
+    python -m scripts.serve_prefork --workers 4
+    python -m scripts.serve_prefork --host 0.0.0.0 --port 8000 --workers 8
+"""
+import argparse
+import asyncio
+import gc
+import logging
+import os
+import signal
+import sys
+import time
+
+import uvicorn
+
+logger = logging.getLogger("serve_prefork")
+
+
+async def _warm_async_engines() -> None:
+    from app.async_database import async_engine, async_read_engine
+    from app.utils.warmup import warm_up_async
+
+    await warm_up_async()
+    # aiosqlite 커넥션은 스레드를 가지므로 fork 전에 모두 닫음 (컴파일 캐시는 엔진에 남음)
+    await async_engine.dispose()
+    await async_read_engine.dispose()
+
+
+def preload():
+    """main import와 워밍업 (마스터 프로세스에서 fork 전에 한 번)
+
+    Returns:
+        FastAPI: main.app
+    """
+    import main
+    from app.config import settings
+    from app.database import engine, read_engine
+    from app.utils.warmup import warm_up
+
+    if settings.startup_warmup:
+        if settings.db_async:
+            asyncio.run(_warm_async_engines())
+        else:
+            warm_up()
+    engine.dispose()
+    read_engine.dispose()
+
+    # preload한 객체를 GC 추적 대상에서 빼서 워커의 GC가 공유 페이지를 건드려 복사되지 않도록 함
+    gc.collect()
+    gc.freeze()
+    return main.app
+
+
+def run_worker(config: uvicorn.Config, sock) -> None:
+    """fork된 워커: 자체 이벤트 루프와 lifespan으로 공유 소켓에서 요청 처리"""
+    # 터미널의 Ctrl+C는 마스터만 받고 워커에는 마스터가 한 번만 전달하도록 프로세스 그룹 분리
+    os.setpgid(0, 0)
+    for signum in (signal.SIGTERM, signal.SIGINT):
+        signal.signal(signum, signal.SIG_DFL)
+    uvicorn.Server(config).run(sockets=[sock])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="main을 preload한 뒤 워커를 fork하는 서버")
+    parser.add_argument("--host", default="127.0.0.1", help="바인드 주소")
+    parser.add_argument("--port", type=int, default=8000, help="포트")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1, help="워커 프로세스 수")
+    parser.add_argument("--backlog", type=int, default=2048, help="리슨 소켓 backlog")
+    parser.add_argument("--log-level", default="info", help="uvicorn 로그 레벨")
+    args = parser.parse_args()
+
+    if not hasattr(os, "fork"):
+        raise SystemExit("fork를 지원하지 않는 플랫폼입니다 (uvicorn --workers를 사용하세요)")
+
+    # 로그 설정은 main import 시 LOG_LEVEL로 적용됨
+    app = preload()
+    config = uvicorn.Config(app, host=args.host, port=args.port, backlog=args.backlog, log_level=args.log_level)
+    sock = config.bind_socket()
+
+    workers: set[int] = set()
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                run_worker(config, sock)
+            finally:
+                os._exit(0)
+        workers.add(pid)
+
+    def stop(signum, frame) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in workers:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, stop)
+    signal.signal(signal.SIGINT, stop)
+
+    for _ in range(args.workers):
+        spawn()
+    logger.info("Preloaded main and forked %d workers on %s:%d", args.workers, args.host, args.port)
+
+    while workers:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        workers.discard(pid)
+        if not stopping:
+            logger.warning("Worker %d exited (status %d), forking a replacement", pid, status)
+            # 시작하자마자 죽는 워커를 쉬지 않고 다시 fork하지 않도록 잠시 대기
+            time.sleep(1)
+            spawn()
+
+    sock.close()
+    logger.info("All workers stopped")
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+"""슬로 쿼리 로그 집계 리포트
+
+SLOW_QUERY_LOG_PATH(JSON Lines)를 읽어 같은 모양의 SQL(IN 목록 길이 차이는 무시)끼리 묶고
+총 소요 시간 순으로 상위 N개를 출력한다. 어느 컨트롤러 메서드부터 고칠지 고르는 용도.
+
+Usage:
+    python -m scripts.slow_query_report
+    python -m scripts.slow_query_report --top 10 --by caller
+    python -m scripts.slow_query_report --log /var/log/app/slow_queries.jsonl --since 2025-12-01
+"""
+import argparse
+import json
+import math
+import re
+import statistics
+from collections import defaultdict
+from pathlib import Path
+
+from app.config import settings
+
+# IN (?, ?, ?) 처럼 길이만 다른 바인딩 목록을 하나로 묶음
+PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+
+def statement_shape(statement: str) -> str:
+    """공백과 바인딩 목록 길이를 정규화한 SQL"""
+    return PLACEHOLDER_LIST.sub("(?, ...)", " ".join(statement.split()))
+
+
+def load_entries(path: Path, since: str | None) -> list[dict]:
+    entries = []
+    with path.open(encoding="utf-8") as log_file:
+        for line in log_file:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if since is None or entry["ts"] >= since:
+                entries.append(entry)
+    return entries
+
+
+def aggregate(entries: list[dict], by: str) -> list[dict]:
+    """그룹별 실행 횟수, 총/평균/p95/최대 시간(ms), 호출 위치, 마지막 실행 계획"""
+    groups: dict[str, dict] = defaultdict(lambda: {"durations": [], "callers": set(), "statements": set()})
+    for entry in entries:
+        shape = statement_shape(entry["statement"])
+        key = (entry.get("caller") or "<unknown>") if by == "caller" else shape
+        group = groups[key]
+        group["durations"].append(entry["duration_ms"])
+        group["callers"].add(entry.get("caller") or "<unknown>")
+        group["statements"].add(shape)
+        if entry.get("plan"):
+            group["plan"] = entry["plan"]
+
+    report = []
+    for key, group in groups.items():
+        durations = sorted(group["durations"])
+        report.append({
+            "key": key,
+            "count": len(durations),
+            "total_ms": sum(durations),
+            "mean_ms": statistics.fmean(durations),
+            "p95_ms": durations[math.ceil(len(durations) * 0.95) - 1],
+            "max_ms": durations[-1],
+            "callers": sorted(group["callers"]),
+            "statements": sorted(group["statements"]),
+            "plan": group.get("plan"),
+        })
+    report.sort(key=lambda row: row["total_ms"], reverse=True)
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="슬로 쿼리 로그 상위 N개 (총 소요 시간 순)")
+    parser.add_argument("--log", type=Path, default=Path(settings.slow_query_log_path), help="슬로 쿼리 로그 경로")
+    parser.add_argument("--top", type=int, default=20, help="출력할 그룹 수")
+    parser.add_argument("--by", choices=("statement", "caller"), default="statement", help="묶는 기준")
+    parser.add_argument("--since", help="이 시각(ISO 형식) 이후 항목만 집계")
+    parser.add_argument("--plans", action="store_true", help="그룹별 EXPLAIN QUERY PLAN 출력")
+    args = parser.parse_args()
+
+    if not args.log.exists():
+        raise SystemExit(f"슬로 쿼리 로그가 없습니다: {args.log}")
+
+    entries = load_entries(args.log, args.since)
+    report = aggregate(entries, args.by)
+    total = sum(row["total_ms"] for row in report)
+    print(f"{len(entries)}건, 총 {total:,.1f} ms, {len(report)}개 그룹 ({args.log})\n")
+
+    for rank, row in enumerate(report[:args.top], start=1):
+        share = row["total_ms"] / total * 100 if total else 0
+        print(
+            f"{rank:>2}. 총 {row['total_ms']:,.1f} ms ({share:.1f}%)  {row['count']}회  "
+            f"평균 {row['mean_ms']:.1f}  p95 {row['p95_ms']:.1f}  최대 {row['max_ms']:.1f} ms"
+        )
+        if args.by == "caller":
+            print(f"    {row['key']}")
+            for statement in row["statements"][:3]:
+                print(f"      {statement[:160]}")
+        else:
+            print(f"    호출: {', '.join(row['callers'])}")
+            print(f"    {row['key'][:240]}")
+        if args.plans and row["plan"]:
+            for detail in row["plan"]:
+                print(f"      | {detail}")
+        print()
+
+
+if __name__ == "__main__":
+    main()
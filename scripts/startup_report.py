@@ -0,0 +1,212 @@
+"""콜드 스타트 시간 리포트
+
+새 프로세스에서 `python -X importtime -c "import main"`을 실행해 main import 시간을
+패키지/모듈별로 나누고, 별도 프로세스에서 import → lifespan(시작 워밍업) → 경로별 첫 요청/두 번째
+요청 시간을 STARTUP_WARMUP=0/1 두 가지로 측정한다. --output으로 저장한 결과를 --compare로
+비교해 커밋 간 콜드 스타트 회귀를 추적할 수 있다. 현재 DATABASE_URL 등 환경 변수를 그대로 쓴다.
+
+Usage:
+    python -m scripts.startup_report
+    python -m scripts.startup_report --runs 5 --top 15 --output startup.json
+    DB_ASYNC=1 python -m scripts.startup_report --compare startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from benchmarks.run import git_revision
+
+ROOT = Path(__file__).resolve().parent.parent
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+REQUEST_PATHS = ("/posts/?limit=10", "/posts/1", "/posts/1/comments?limit=10", "/api/users/1")
+
+# 자식 프로세스에서 실행: import main → lifespan 시작 → 경로별 요청 두 번씩 (ms, JSON 출력)
+PHASES_CODE = """
+import json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+from fastapi.testclient import TestClient
+client = TestClient(main.app)
+lifespan_started = time.perf_counter()
+client.__enter__()
+ready = time.perf_counter()
+requests = {}
+for path in json.loads(sys.argv[1]):
+    timings = []
+    for _ in range(2):
+        request_started = time.perf_counter()
+        client.get(path)
+        timings.append((time.perf_counter() - request_started) * 1000)
+    requests[path] = timings
+client.__exit__(None, None, None)
+print(json.dumps({
+    "import_ms": (imported - started) * 1000,
+    "lifespan_ms": (ready - lifespan_started) * 1000,
+    "requests": requests,
+}))
+"""
+
+
+def child_env(**overrides: str) -> dict:
+    # -c 실행은 현재 디렉터리만 sys.path에 넣으므로 저장소 루트 추가 (DATABASE_URL 상대 경로는 현재 디렉터리 기준)
+    python_path = os.pathsep.join(filter(None, (str(ROOT), os.getenv("PYTHONPATH"))))
+    return {**os.environ, "PYTHONPATH": python_path, "LOG_LEVEL": "WARNING", **overrides}
+
+
+def parse_importtime(stderr: str) -> list[tuple[str, int, int, int]]:
+    """`-X importtime` 출력 중 main import에 속한 (모듈, self µs, 누적 µs, 깊이) 목록"""
+    entries = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            entries.append((module, int(self_us), int(cumulative_us), (len(indent) - 1) // 2))
+
+    # 출력은 import가 끝난 순서이므로 main 직전의 최상위 항목 다음부터 main까지가 main의 하위 트리
+    end = max(index for index, entry in enumerate(entries) if entry[0] == "main" and entry[3] == 0)
+    start = max((index for index, entry in enumerate(entries[:end]) if entry[3] == 0), default=-1) + 1
+    return entries[start:end + 1]
+
+
+def measure_imports(runs: int) -> list[tuple[str, int, int, int]]:
+    """main import 트리 (runs번 중 전체 시간이 가장 짧은 실행)"""
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import main"],
+            env=child_env(), capture_output=True, text=True, check=True
+        )
+        entries = parse_importtime(completed.stderr)
+        if best is None or entries[-1][2] < best[-1][2]:
+            best = entries
+    return best
+
+
+def measure_phases(runs: int, warmup: bool) -> dict:
+    """import/lifespan/요청별 시간 (ms, 항목별로 runs번 중 최솟값)"""
+    results = []
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, "-c", PHASES_CODE, json.dumps(REQUEST_PATHS)],
+            env=child_env(STARTUP_WARMUP="1" if warmup else "0"),
+            stdout=subprocess.PIPE, check=True, text=True
+        )
+        results.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+    return {
+        "import_ms": min(result["import_ms"] for result in results),
+        "lifespan_ms": min(result["lifespan_ms"] for result in results),
+        "requests": {
+            path: [min(result["requests"][path][index] for result in results) for index in range(2)]
+            for path in REQUEST_PATHS
+        },
+    }
+
+
+def summarize_imports(entries: list[tuple[str, int, int, int]], top: int) -> dict:
+    packages: defaultdict[str, int] = defaultdict(int)
+    for module, self_us, _, _ in entries:
+        packages[module.split(".")[0]] += self_us
+    return {
+        "total_ms": entries[-1][2] / 1000,
+        "module_count": len(entries),
+        "packages": {
+            name: self_us / 1000
+            for name, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]
+        },
+        "modules": [
+            {"module": module, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+            for module, self_us, cumulative_us, _ in sorted(entries, key=lambda entry: entry[1], reverse=True)[:top]
+        ],
+        "app_modules": [
+            {"module": module, "self_ms": self_us / 1000, "cumulative_ms": cumulative_us / 1000}
+            for module, self_us, cumulative_us, _ in sorted(
+                (entry for entry in entries if entry[0].startswith("app.")),
+                key=lambda entry: entry[2], reverse=True
+            )[:top]
+        ],
+    }
+
+
+def print_report(report: dict) -> None:
+    imports = report["imports"]
+    print(f"import main: {imports['total_ms']:.1f} ms ({imports['module_count']}개 모듈, -X importtime 기준)\n")
+
+    print("패키지별 self 시간 합계")
+    for name, ms in imports["packages"].items():
+        print(f"  {name:<32} {ms:>8.1f} ms  {ms / imports['total_ms'] * 100:>5.1f}%")
+
+    print("\n모듈별 self 시간 상위")
+    for entry in imports["modules"]:
+        print(f"  {entry['module']:<48} {entry['self_ms']:>8.1f} ms  (누적 {entry['cumulative_ms']:.1f})")
+
+    print("\napp 모듈 누적 시간 상위")
+    for entry in imports["app_modules"]:
+        print(f"  {entry['module']:<48} {entry['cumulative_ms']:>8.1f} ms  (self {entry['self_ms']:.1f})")
+
+    print("\n단계별 시간 (ms, 첫 요청 / 두 번째 요청)")
+    for mode, phases in report["phases"].items():
+        print(f"  STARTUP_WARMUP={mode}: import {phases['import_ms']:.1f}, lifespan {phases['lifespan_ms']:.1f}")
+        for path, (first, second) in phases["requests"].items():
+            print(f"    GET {path:<32} {first:>7.2f} / {second:>7.2f}")
+
+
+def compare(current: dict, baseline_path: Path) -> None:
+    """전체 import 시간과 단계별 시간 비교 (비율 > 1 이면 느려짐)"""
+    baseline = json.loads(baseline_path.read_text())
+    print(f"\n비교 기준: {baseline_path} ({baseline['meta']['revision']})")
+    rows = [("import main (importtime)", baseline["imports"]["total_ms"], current["imports"]["total_ms"])]
+    for mode, phases in current["phases"].items():
+        previous = baseline["phases"].get(mode)
+        if previous is None:
+            continue
+        rows.append((f"[warmup={mode}] import", previous["import_ms"], phases["import_ms"]))
+        rows.append((f"[warmup={mode}] lifespan", previous["lifespan_ms"], phases["lifespan_ms"]))
+        for path, (first, _) in phases["requests"].items():
+            if path in previous["requests"]:
+                rows.append((f"[warmup={mode}] first GET {path}", previous["requests"][path][0], first))
+
+    print(f"{'metric':<56} {'base ms':>9} {'now ms':>9} {'ratio':>6}")
+    for label, before, after in rows:
+        ratio = after / before if before else float("inf")
+        flag = "  <- 느려짐" if ratio > 1.1 else ("  <- 빨라짐" if ratio < 0.9 else "")
+        print(f"{label:<56} {before:>9.1f} {after:>9.1f} {ratio:>6.2f}{flag}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="콜드 스타트(import, lifespan, 첫 요청) 시간 리포트")
+    parser.add_argument("--runs", type=int, default=3, help="측정 반복 횟수 (최솟값 사용)")
+    parser.add_argument("--top", type=int, default=20, help="패키지/모듈 목록 개수")
+    parser.add_argument("--output", type=Path, help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", type=Path, help="비교할 이전 결과 JSON")
+    args = parser.parse_args()
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_async": os.getenv("DB_ASYNC", "0"),
+        },
+        "imports": summarize_imports(measure_imports(args.runs), args.top),
+        "phases": {mode: measure_phases(args.runs, warmup=mode == "1") for mode in ("0", "1")},
+    }
+    print_report(report)
+
+    if args.output:
+        args.output.write_text(json.dumps(report, ensure_ascii=False, indent=2))
+        print(f"\n결과 저장: {args.output}")
+    if args.compare:
+        compare(report, args.compare)
+
+
+if __name__ == "__main__":
+    main()
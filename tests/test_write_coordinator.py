@@ -0,0 +1,156 @@
+"""WriteCoordinator 묶음 commit 동작 테스트
+
+임시 SQLite 파일에 단순한 테이블을 만들고 코디네이터를 직접 띄워, 묶음 안의 SAVEPOINT 격리,
+commit 실패 시 묶음 전체 실패, commit 이후 작업 실행 시점, 시간 초과와 writer 비정상 종료를 확인한다.
+"""
+import sqlite3
+import threading
+
+import pytest
+from sqlalchemy import text
+
+from app.config import settings
+from app.exceptions import DatabaseException, InvalidDataException, ServiceUnavailableException
+from app.utils.db_utils import after_commit, db_transaction
+from app.utils.write_coordinator import WriteCoordinator
+
+SCHEMA = """
+CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT NOT NULL UNIQUE);
+CREATE TABLE parents (id INTEGER PRIMARY KEY);
+CREATE TABLE children (
+    id INTEGER PRIMARY KEY,
+    parent_id INTEGER NOT NULL REFERENCES parents(id) DEFERRABLE INITIALLY DEFERRED
+);
+"""
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    path = tmp_path / "coordinator.db"
+    with sqlite3.connect(path) as connection:
+        connection.executescript(SCHEMA)
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{path}")
+    return path
+
+
+def make_coordinator(**overrides) -> WriteCoordinator:
+    options = {"max_batch": 64, "max_wait_ms": 200.0, "max_pending": 100, "queue_timeout": 1.0, "timeout": 5.0}
+    options.update(overrides)
+    return WriteCoordinator(**options)
+
+
+@pytest.fixture
+def coordinator(db_path):
+    # 첫 쓰기 후 200ms 동안 모으므로 연달아 제출한 쓰기는 한 묶음이 됨
+    coordinator = make_coordinator()
+    coordinator.start()
+    yield coordinator
+    coordinator.stop()
+
+
+def insert_item(name: str):
+    def write(db):
+        with db_transaction(db):
+            db.execute(text("INSERT INTO items (name) VALUES (:name)"), {"name": name})
+        return name
+    return write
+
+
+def item_names(db_path) -> list[str]:
+    with sqlite3.connect(db_path) as connection:
+        return [name for (name,) in connection.execute("SELECT name FROM items ORDER BY id")]
+
+
+def test_failed_write_is_rolled_back_alone(coordinator, db_path):
+    futures = [
+        coordinator.submit(insert_item("a")),
+        coordinator.submit(insert_item("a")),
+        coordinator.submit(insert_item("b")),
+    ]
+
+    assert futures[0].result(timeout=5) == "a"
+    with pytest.raises(InvalidDataException):
+        futures[1].result(timeout=5)
+    assert futures[2].result(timeout=5) == "b"
+
+    assert item_names(db_path) == ["a", "b"]
+    stats = coordinator.stats()
+    assert stats["groups"] == 1
+    assert stats["writes"] == 3
+
+
+def test_failed_group_commit_fails_every_write(coordinator, db_path):
+    def insert_orphan(db):
+        # 지연된 외래키 검사는 SAVEPOINT 해제가 아니라 묶음 COMMIT에서 실패함
+        with db_transaction(db):
+            db.execute(text("INSERT INTO children (parent_id) VALUES (999)"))
+
+    futures = [coordinator.submit(insert_item("a")), coordinator.submit(insert_orphan)]
+
+    for future in futures:
+        with pytest.raises(DatabaseException):
+            future.result(timeout=5)
+    assert item_names(db_path) == []
+    assert coordinator.stats()["failed_commits"] == 1
+
+
+def test_after_commit_runs_only_after_group_commit(coordinator, db_path):
+    seen = []
+
+    def write(name: str):
+        def run(db):
+            insert_item(name)(db)
+            before = list(seen)
+            # 아직 commit 전이므로 바로 실행되지 않고 묶음 commit 뒤로 미뤄져야 함
+            after_commit(db, lambda: seen.append((name, item_names(db_path))))
+            assert seen == before
+        return run
+
+    def insert_orphan(db):
+        with db_transaction(db):
+            db.execute(text("INSERT INTO children (parent_id) VALUES (999)"))
+        after_commit(db, lambda: seen.append(("orphan", item_names(db_path))))
+
+    coordinator.execute(write("a"))
+    # 다른 스레드의 커넥션에서도 commit된 행이 보이는 시점에 실행됨
+    assert seen == [("a", ["a"])]
+
+    failed = [coordinator.submit(write("b")), coordinator.submit(insert_orphan)]
+    for future in failed:
+        with pytest.raises(DatabaseException):
+            future.result(timeout=5)
+    assert seen == [("a", ["a"])]
+
+
+def test_execute_times_out_with_503_and_cancels_queued_write(db_path):
+    coordinator = make_coordinator(max_wait_ms=0.0, timeout=0.2)
+    coordinator.start()
+    release = threading.Event()
+    try:
+        blocking = coordinator.submit(lambda db: release.wait(5))
+        with pytest.raises(ServiceUnavailableException):
+            coordinator.execute(insert_item("late"))
+        release.set()
+        assert blocking.result(timeout=5) is True
+    finally:
+        release.set()
+        coordinator.stop()
+
+    # 시작하기 전에 시간이 초과된 쓰기는 취소되어 실행되지 않음
+    assert item_names(db_path) == []
+    assert coordinator.stats()["timed_out"] == 1
+
+
+def test_writer_failure_fails_pending_writes_and_stops_running(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "database_url", f"sqlite:///{tmp_path / 'missing' / 'app.db'}")
+    coordinator = make_coordinator()
+    futures = [coordinator.submit(insert_item("a")), coordinator.submit(insert_item("b"))]
+
+    coordinator.start()
+
+    for future in futures:
+        with pytest.raises(DatabaseException):
+            future.result(timeout=5)
+    # write_operation이 이후 쓰기를 요청 세션에서 바로 실행하도록 running이 꺼져 있어야 함
+    assert not coordinator.running
+    coordinator.stop()